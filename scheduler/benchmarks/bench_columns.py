@@ -0,0 +1,82 @@
+# benchmarks/bench_columns.py
+"""
+Generación de columnas (core/column_generation.py) frente al modelo
+compacto del backend "matrix": objetivo, cota inferior, columnas generadas
+y tiempo. El modelo compacto se omite por encima de --full-max workers.
+
+    python -m scheduler.benchmarks.bench_columns --workers 20 100 200 500
+"""
+
+import argparse
+import time
+
+from scheduler.benchmarks.generator import DEMAND_PROFILES, generate_request
+from scheduler.core.backends import SolverOptions
+from scheduler.core.column_generation import solve_column_generation
+from scheduler.core.solve import solve_schedule
+
+
+def run_case(request, options, full=True):
+    start = time.perf_counter()
+    columns = solve_column_generation(request, options=options, compact=True)
+    case = {
+        "objective": columns.objective,
+        "lower_bound": columns.lower_bound,
+        "iterations": len(columns.iterations),
+        "columns": columns.stats["size"]["columns"],
+        "time": time.perf_counter() - start,
+        "full_objective": None,
+        "full_time": None,
+    }
+    if full:
+        start = time.perf_counter()
+        compact = solve_schedule(
+            request, backend="matrix", options=options, compact=True
+        )
+        case["full_objective"] = compact.objective
+        case["full_time"] = time.perf_counter() - start
+    return case
+
+
+def run(workers=(20, 100, 200), n_days=7, options=None, full_max=50, profile="peaks"):
+    options = options or SolverOptions(time_limit=60)
+    results = []
+    for n in workers:
+        request = generate_request(n, n_days, profile=profile)
+        case = run_case(request, options, full=n <= full_max)
+        case["workers"] = n
+        results.append(case)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[20, 100, 200])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--full-max", type=int, default=50)
+    parser.add_argument("--profile", choices=DEMAND_PROFILES, default="peaks")
+    parser.add_argument("--time-limit", type=int, default=60)
+    parser.add_argument("--gap", type=float)
+    args = parser.parse_args()
+
+    options = SolverOptions(time_limit=args.time_limit)
+    if args.gap is not None:
+        options.gap = args.gap
+    results = run(args.workers, args.days, options, args.full_max, args.profile)
+
+    print(
+        f"{'workers':<9}{'columnas':>9}{'iter':>6}{'objetivo':>11}{'cota':>11}"
+        f"{'tiempo':>9}{'compacto':>11}{'tiempo':>9}"
+    )
+    for r in results:
+        full = "-" if r["full_objective"] is None else f"{r['full_objective']:.1f}"
+        full_time = "-" if r["full_time"] is None else f"{r['full_time']:.2f}s"
+        print(
+            f"{r['workers']:<9}{r['columns']:>9}{r['iterations']:>6}"
+            f"{r['objective']:>11.1f}{r['lower_bound']:>11.1f}{r['time']:>8.2f}s"
+            f"{full:>11}{full_time:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/bench_heuristic.py
+"""
+Heurística (core/heuristic.py) frente al MIP: objetivo y tiempo del
+voraz, de voraz + búsqueda local y, hasta --mip-max workers, de CBC con y
+sin la heurística como warm start.
+
+    python -m scheduler.benchmarks.bench_heuristic --workers 20 50 200
+"""
+
+import argparse
+import time
+
+from scheduler.benchmarks.generator import DEMAND_PROFILES, generate_request
+from scheduler.core.backends import SolverOptions
+from scheduler.core.heuristic import solve_heuristic
+from scheduler.core.solve import solve_schedule
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    solution = fn(*args, **kwargs)
+    return solution.objective, time.perf_counter() - start
+
+
+def run_case(request, options, mip=True):
+    case = {
+        "greedy": _timed(solve_heuristic, request, local_search=False, compact=True),
+        "local_search": _timed(solve_heuristic, request, compact=True),
+    }
+    if mip:
+        case["mip"] = _timed(solve_schedule, request, options=options, compact=True)
+        draft = solve_heuristic(request, compact=True)
+        case["mip_warm"] = _timed(
+            solve_schedule, request, warm_start=draft, options=options, compact=True
+        )
+    return case
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[20, 50, 200])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--mip-max", type=int, default=50)
+    parser.add_argument("--profile", choices=DEMAND_PROFILES, default="peaks")
+    parser.add_argument("--time-limit", type=int, default=60)
+    args = parser.parse_args()
+
+    options = SolverOptions(time_limit=args.time_limit)
+    print(f"{'workers':<9}{'método':<14}{'objetivo':>11}{'tiempo':>10}")
+    for n in args.workers:
+        request = generate_request(n, args.days, profile=args.profile)
+        for name, (objective, elapsed) in run_case(
+            request, options, mip=n <= args.mip_max
+        ).items():
+            print(f"{n:<9}{name:<14}{objective:>11.1f}{elapsed:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
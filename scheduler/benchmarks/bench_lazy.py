@@ -0,0 +1,82 @@
+# benchmarks/bench_lazy.py
+"""
+Modelo completo frente a generación perezosa de las filas de descanso y
+turnos partidos (core/lazy.py): filas añadidas, rondas, tiempo total y
+objetivo.
+
+    python -m scheduler.benchmarks.bench_lazy --workers 50 100 --days 14
+"""
+
+import argparse
+import time
+
+from scheduler.benchmarks.generator import DEMAND_PROFILES, generate_request
+from scheduler.core.backends import SolverOptions
+from scheduler.core.lazy import solve_lazy
+from scheduler.core.solve import BACKENDS, solve_schedule
+
+
+def run_case(request, backend="matrix", options=None, neighborhood=(0, 1)):
+    options = options or SolverOptions()
+    start = time.perf_counter()
+    full = solve_schedule(request, backend=backend, options=options, compact=True)
+    cases = [
+        {
+            "mode": "full",
+            "rows": full.stats["size"].get("constraints"),
+            "rounds": 1,
+            "objective": full.objective,
+            "time": time.perf_counter() - start,
+        }
+    ]
+    for k in neighborhood:
+        start = time.perf_counter()
+        lazy = solve_lazy(
+            request, backend=backend, options=options, neighborhood=k, compact=True
+        )
+        size = lazy.stats["size"]
+        cases.append(
+            {
+                "mode": f"lazy (vecinos {k})",
+                "rows": f"{size['lazy_rows']}/{size['lazy_total']} perezosas",
+                "rounds": len(lazy.rounds),
+                "objective": lazy.objective,
+                "time": time.perf_counter() - start,
+            }
+        )
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[50, 100])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--backend", choices=BACKENDS[:2], default="matrix")
+    parser.add_argument("--profile", choices=DEMAND_PROFILES, default="peaks")
+    parser.add_argument("--time-limit", type=int, default=120)
+    parser.add_argument("--gap", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    options = SolverOptions(time_limit=args.time_limit, gap=args.gap)
+    print(
+        "solve_lazy es opcional (solve_schedule resuelve el modelo completo); "
+        "x completo > 1 = más lento"
+    )
+    print(
+        f"{'workers':<9}{'modo':<18}{'filas':>22}{'rondas':>8}{'objetivo':>10}"
+        f"{'tiempo':>9}{'x completo':>12}"
+    )
+    for n in args.workers:
+        request = generate_request(n, args.days, seed=args.seed, profile=args.profile)
+        cases = run_case(request, args.backend, options)
+        for r in cases:
+            print(
+                f"{n:<9}{r['mode']:<18}{str(r['rows']):>22}{r['rounds']:>8}"
+                f"{r['objective']:>10.1f}{r['time']:>8.2f}s"
+                f"{r['time'] / cases[0]['time']:>11.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# benchmarks/bench_output.py
+"""
+Salidas de un resultado (DataFrame, consola y BD): recorrido de las x
+PuLP con .value() (implementación anterior) frente a assignment_array,
+con el dict de solve_schedule y con ScheduleSolution.
+
+    python -m scheduler.benchmarks.bench_output --workers 200
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from scheduler.benchmarks.generator import generate_request
+from scheduler.config.settings import TURN_HOURS
+from scheduler.core.heuristic import solve_heuristic
+from scheduler.interface.utils import (
+    day_worker_matrix,
+    hours_per_worker,
+    result_to_df,
+    schedule_pivot,
+)
+from scheduler.interface.views import ScheduleView
+from scheduler.io.output import print_schedule
+from scheduler.services.repository import SchedulerRepository
+
+
+# -----------------------------------------
+# Implementación anterior (una lectura por variable)
+# -----------------------------------------
+def legacy_result_to_df(result, schedule_request):
+    x = result["variables"]["x"]
+    workers = {w.id: w.name for w in schedule_request.workers}
+    rows = []
+    for (w, d, t), val in x.items():
+        if val.value() == 1:
+            rows.append({"Día": d, "Turno": t, "Trabajador": workers[w]})
+    return pd.DataFrame(rows)
+
+
+def legacy_schedule_pivot(df):
+    # un join por grupo de pandas
+    agg = df.groupby(["Día", "Turno"])["Trabajador"].agg(", ".join)
+    return agg.unstack(fill_value="")
+
+
+def legacy_print_schedule(result, schedule_request):
+    # recorre todas las x en cada (día, turno)
+    x = result["variables"]["x"]
+    workers = {w.id: w for w in schedule_request.workers}
+    for d in schedule_request.days:
+        print(f"\n=== Día {d} ===")
+        for t in schedule_request.shifts:
+            assigned = [
+                workers[w].name
+                for (w, dd, tt) in x
+                if dd == d and tt == t and x[(w, d, t)].value() == 1
+            ]
+            print(f" Turno {t}: {assigned}")
+
+
+def legacy_save_schedule_from_result(repo, result):
+    x = result["variables"]["x"]
+    rows = [(d, t, wid) for (wid, d, t), val in x.items() if val.value() == 1]
+    repo._sync("schedule", ("day", "shift", "worker_id"), (), rows, "replace")
+
+
+def _timed(fn, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n_workers, n_days=7):
+    request = generate_request(n_workers, n_days)
+    result = solve_heuristic(request)
+    solution = solve_heuristic(request, compact=True)
+
+    def views(source):
+        df = result_to_df(source, request)
+        schedule_pivot(df.copy())
+        hours_per_worker(df.copy(), TURN_HOURS)
+        day_worker_matrix(df.copy())
+
+    df = result_to_df(result, request)
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = SchedulerRepository(os.path.join(tmp, "bench.db"))
+        return {
+            "dataframe": (
+                _timed(legacy_result_to_df, result, request),
+                _timed(result_to_df, result, request),
+                _timed(result_to_df, solution, request),
+            ),
+            "print": (
+                _timed(legacy_print_schedule, result, request),
+                _timed(print_schedule, result, request),
+                _timed(print_schedule, solution, request),
+            ),
+            "save": (
+                _timed(legacy_save_schedule_from_result, repo, result),
+                _timed(repo.save_schedule_from_result, result),
+                _timed(repo.save_schedule_from_result, solution),
+            ),
+            "pivot": (
+                _timed(legacy_schedule_pivot, df),
+                _timed(schedule_pivot, df),
+                _timed(lambda: ScheduleView.from_result(solution, request).pivot()),
+            ),
+            "views": (
+                None,
+                _timed(views, result),
+                _timed(views, solution),
+            ),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[200])
+    parser.add_argument("--days", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'workers':<9}{'salida':<11}{'anterior':>10}{'dict':>10}{'compacto':>10}")
+    for n in args.workers:
+        for name, times in run(n, args.days).items():
+            cells = "".join(
+                f"{'-':>10}" if t is None else f"{t * 1e3:>8.1f}ms" for t in times
+            )
+            print(f"{n:<9}{name:<11}{cells}")
+
+
+if __name__ == "__main__":
+    main()
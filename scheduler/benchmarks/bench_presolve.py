@@ -0,0 +1,40 @@
+# benchmarks/bench_presolve.py
+"""
+Reducción del presolve (core/presolve.py) sobre datos con disponibilidad
+dispersa: variables, filas, no ceros y tiempo de construcción del modelo.
+
+    python -m scheduler.benchmarks.bench_presolve --workers 200 --days 28
+"""
+
+import argparse
+
+from scheduler.benchmarks.generator import generate_request
+from scheduler.core.presolve import presolve_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=200)
+    parser.add_argument("--days", type=int, default=28)
+    parser.add_argument("--unavailable", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    request = generate_request(
+        args.workers, args.days, unavailable=args.unavailable, seed=args.seed
+    )
+    report = presolve_report(request)
+
+    print(f"{'':<12}{'completo':>12}{'presolve':>12}{'reducción':>12}")
+    for name, (before, after) in report.items():
+        fmt = "{:>11.2f}s" if name == "build_time" else "{:>12}"
+        print(
+            f"{name:<12}"
+            + fmt.format(before)
+            + fmt.format(after)
+            + f"{1 - after / before:>11.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# benchmarks/bench_repository.py
+"""
+Escritura en SchedulerRepository: inserciones fila a fila (implementación
+anterior) frente a executemany en una transacción y al modo diff.
+
+    python -m scheduler.benchmarks.bench_repository --workers 2000
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from scheduler.benchmarks.generator import generate_data
+from scheduler.services.repository import SchedulerRepository
+
+
+# -----------------------------------------
+# Implementación anterior (una sentencia por fila)
+# -----------------------------------------
+def legacy_save_workers(repo, workers):
+    conn = sqlite3.connect(repo.db_path)
+    cur = conn.cursor()
+    cur.execute("DELETE FROM workers;")
+    for w in workers:
+        cur.execute(
+            "INSERT INTO workers(id, name, max_hours) VALUES (?, ?, ?)",
+            (int(w["id"]), str(w["name"]).strip(), int(w["max_hours"])),
+        )
+    conn.commit()
+    conn.close()
+
+
+def legacy_save_availability(repo, availability):
+    conn = sqlite3.connect(repo.db_path)
+    cur = conn.cursor()
+    cur.execute("DELETE FROM availability")
+    for wid, days in availability.items():
+        for day_idx, shifts in days.items():
+            for shift_idx in shifts.keys():
+                cur.execute(
+                    """
+                    INSERT INTO availability(worker_id, day, shift, available)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (int(wid), int(day_idx), int(shift_idx), 0),
+                )
+    conn.commit()
+    conn.close()
+
+
+def legacy_save_demand(repo, demand):
+    conn = sqlite3.connect(repo.db_path)
+    cur = conn.cursor()
+    cur.execute("DELETE FROM demand;")
+    for d, shifts in demand.items():
+        for t, val in shifts.items():
+            cur.execute(
+                "INSERT INTO demand(day, shift, min_workers) VALUES (?, ?, ?)",
+                (d, t, val),
+            )
+    conn.commit()
+    conn.close()
+
+
+def legacy_save_schedule(repo, rows):
+    conn = sqlite3.connect(repo.db_path)
+    cur = conn.cursor()
+    cur.execute("DELETE FROM schedule;")
+    for d, t, wid in rows:
+        cur.execute(
+            "INSERT INTO schedule(day, shift, worker_id) VALUES (?,?,?)",
+            (d, t, wid),
+        )
+    conn.commit()
+    conn.close()
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def run(n_workers=2000, n_days=7, seed=0):
+    workers, availability, demand = generate_data(n_workers, n_days, seed=seed)
+    schedule = [(d, t, w["id"]) for w in workers for d, t in [(0, 0), (1, 2)]]
+
+    # una pequeña edición para el modo diff
+    edited = dict(availability)
+    edited[0] = {0: {0: 0, 1: 0}}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = SchedulerRepository(os.path.join(tmp, "bench.db"))
+
+        results = {}
+        cases = [
+            ("workers", legacy_save_workers, repo.save_workers, workers),
+            (
+                "availability",
+                legacy_save_availability,
+                repo.save_availability,
+                availability,
+            ),
+            ("demand", legacy_save_demand, repo.save_demand, demand),
+        ]
+        for name, legacy, new, data in cases:
+            results[name] = {
+                "rows": _count_rows(data),
+                "legacy": _timed(legacy, repo, data),
+                "executemany": _timed(new, data),
+            }
+        results["availability"]["diff_one_edit"] = _timed(
+            repo.save_availability, edited, mode="diff"
+        )
+
+        results["schedule"] = {
+            "rows": len(schedule),
+            "legacy": _timed(legacy_save_schedule, repo, schedule),
+            "executemany": _timed(
+                repo._sync, "schedule", ("day", "shift", "worker_id"), (), schedule
+            ),
+        }
+    return results
+
+
+def _count_rows(data):
+    # hojas de la estructura anidada (una fila por hoja)
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict):
+        return sum(_count_rows(v) for v in data.values())
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.workers, args.days, args.seed)
+    print(f"{'tabla':<14}{'filas':>8}{'fila a fila':>14}{'executemany':>14}{'x':>8}")
+    for name, r in results.items():
+        speedup = r["legacy"] / r["executemany"]
+        print(
+            f"{name:<14}{r['rows']:>8}{r['legacy'] * 1000:>12.1f}ms"
+            f"{r['executemany'] * 1000:>12.1f}ms{speedup:>7.1f}x"
+        )
+        if "diff_one_edit" in r:
+            print(f"{'  diff (1 edición)':<36}{r['diff_one_edit'] * 1000:>12.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
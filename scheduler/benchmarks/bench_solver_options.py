@@ -0,0 +1,78 @@
+# benchmarks/bench_solver_options.py
+"""
+Barrido de opciones de CBC (hilos, gap, cortes, heurísticas) sobre los
+escenarios generados, para elegir los valores por defecto de
+config/settings.py. Cada combinación cambia una opción respecto a la base.
+
+    python -m scheduler.benchmarks.bench_solver_options --workers 10 20
+"""
+
+import argparse
+import copy
+
+from scheduler.benchmarks.generator import generate_request
+from scheduler.core.backends import CUT_LEVELS, SolverOptions
+from scheduler.core.solve import solve_schedule
+
+# opción -> valores a probar
+SWEEP = {
+    "threads": [1, 2, 4, 8],
+    "gap": [0.0, 0.005, 0.01, 0.05],
+    "cuts": list(CUT_LEVELS),
+    "heuristics": [True, False],
+}
+
+
+def variants(base, sweep=SWEEP):
+    yield "base", base
+    for name, values in sweep.items():
+        for val in values:
+            if getattr(base, name) == val:
+                continue
+            options = copy.copy(base)
+            setattr(options, name, val)
+            yield f"{name}={val}", options
+
+
+def run(workers=(10, 20), n_days=7, base=None, sweep=SWEEP, seed=0):
+    base = base or SolverOptions(time_limit=60)
+    results = []
+    for n in workers:
+        request = generate_request(n, n_days, seed=seed)
+        for label, options in variants(base, sweep):
+            solution = solve_schedule(request, options=options, compact=True)
+            results.append(
+                {
+                    "workers": n,
+                    "variant": label,
+                    "status": solution.status,
+                    "objective": solution.objective,
+                    "time": solution.stats["total_time"],
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[10, 20])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--time-limit", type=int, default=60)
+    parser.add_argument("--only", nargs="+", choices=SWEEP, help="opciones a barrer")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    base = SolverOptions(time_limit=args.time_limit)
+    sweep = {k: v for k, v in SWEEP.items() if not args.only or k in args.only}
+    print(f"base: {base}")
+    print(f"{'workers':<9}{'variante':<20}{'tiempo':>9}{'objetivo':>11}")
+    for r in run(args.workers, args.days, base, sweep, args.seed):
+        objective = "-" if r["objective"] is None else f"{r['objective']:.1f}"
+        print(
+            f"{r['workers']:<9}{r['variant']:<20}{r['time']:>8.2f}s"
+            f"{objective:>11}  {r['status']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
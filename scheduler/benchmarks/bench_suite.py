@@ -0,0 +1,175 @@
+# benchmarks/bench_suite.py
+"""
+Tiempos por fase del pipeline PuLP sobre escenarios sintéticos:
+create_model, cada restricción de ACTIVE_RESTRICTIONS, set_objective, solve
+y extracción del resultado. Escribe JSON para comparar entre commits.
+
+    python -m scheduler.benchmarks.bench_suite --out bench.json
+    python -m scheduler.benchmarks.bench_suite --out new.json --compare bench.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import time
+
+from pulp import PULP_CBC_CMD, LpStatus, value
+
+from scheduler.benchmarks.generator import DEMAND_PROFILES, generate_request
+from scheduler.core.matrix import FAMILIES
+from scheduler.core.model import create_model
+from scheduler.core.objective import set_objective
+from scheduler.core.presolve import PresolvedModel, feasible_cells
+from scheduler.core.restrictions_manager import ACTIVE_RESTRICTIONS
+from scheduler.core.solution import ScheduleSolution
+from scheduler.interface.utils import result_to_df
+
+# nombre, trabajadores, días, fracción no disponible, perfil, resolver
+SCENARIOS = [
+    ("small", 10, 7, 0.2, "peaks", True),
+    ("medium", 50, 14, 0.3, "weekend", True),
+    ("large", 200, 28, 0.3, "weekend", False),
+    ("sparse", 200, 28, 0.7, "flat", False),
+]
+
+
+def _timed(timings, name, fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    timings[name] = time.perf_counter() - start
+    return out
+
+
+def run_case(request, solve=True, time_limit=30, presolve=False):
+    timings = {}
+    cells = feasible_cells(request) if presolve else None
+    model, variables = _timed(timings, "create_model", create_model, request, cells)
+
+    target = PresolvedModel(model) if presolve else model
+    for add in ACTIVE_RESTRICTIONS:
+        _timed(timings, add.__name__, add, target, variables, request)
+    _timed(timings, "set_objective", set_objective, model, variables, request)
+
+    size = {
+        "variables": sum(len(f) for f in variables),
+        "rows": len(model.constraints),
+        "nonzeros": sum(len(c) for c in model.constraints.values()),
+    }
+    if not solve:
+        return {"timings": timings, "size": size}
+
+    solver = PULP_CBC_CMD(msg=False, timeLimit=time_limit)
+    _timed(timings, "solve", model.solve, solver)
+    result = {
+        "status": LpStatus[model.status],
+        "model": model,
+        "variables": dict(zip(FAMILIES, variables)),
+        "objective": value(model.objective),
+    }
+    solution = _timed(
+        timings, "extract_solution", ScheduleSolution.from_result, result, request
+    )
+    _timed(timings, "extract_df", result_to_df, solution, request)
+    return {
+        "timings": timings,
+        "size": size,
+        "status": result["status"],
+        "objective": result["objective"],
+    }
+
+
+def run(scenarios=SCENARIOS, seed=0, time_limit=30, presolve=False, solve=True):
+    cases = []
+    for name, n_workers, n_days, unavailable, profile, do_solve in scenarios:
+        request = generate_request(
+            n_workers, n_days, unavailable=unavailable, seed=seed, profile=profile
+        )
+        case = run_case(request, solve and do_solve, time_limit, presolve)
+        case["name"] = name
+        case["params"] = {
+            "workers": n_workers,
+            "days": n_days,
+            "unavailable": unavailable,
+            "profile": profile,
+            "seed": seed,
+        }
+        cases.append(case)
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "presolve": presolve,
+        "time_limit": time_limit,
+        "cases": cases,
+    }
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(new, old):
+    """Cociente nuevo / anterior de cada tiempo, por escenario."""
+    old_cases = {c["name"]: c for c in old["cases"]}
+    ratios = {}
+    for case in new["cases"]:
+        previous = old_cases.get(case["name"])
+        if previous is None:
+            continue
+        ratios[case["name"]] = {
+            phase: t / previous["timings"][phase]
+            for phase, t in case["timings"].items()
+            if previous["timings"].get(phase)
+        }
+    return ratios
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--out", default="bench.json")
+    parser.add_argument("--compare", help="JSON de una ejecución anterior")
+    parser.add_argument("--only", nargs="+", help="escenarios a ejecutar")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=int, default=30)
+    parser.add_argument("--presolve", action="store_true")
+    parser.add_argument("--no-solve", action="store_true")
+    parser.add_argument(
+        "--profile", choices=DEMAND_PROFILES, help="fuerza un perfil de demanda"
+    )
+    args = parser.parse_args()
+
+    scenarios = [s for s in SCENARIOS if not args.only or s[0] in args.only]
+    if args.profile:
+        scenarios = [s[:4] + (args.profile,) + s[5:] for s in scenarios]
+
+    report = run(
+        scenarios, args.seed, args.time_limit, args.presolve, not args.no_solve
+    )
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for case in report["cases"]:
+        print(f"\n== {case['name']} {case['params']} {case['size']}")
+        for phase, t in case["timings"].items():
+            print(f"  {phase:<34}{t * 1000:>10.1f} ms")
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        print(f"\nnuevo / anterior ({old.get('commit')})")
+        for name, ratios in compare(report, old).items():
+            worst = max(ratios.items(), key=lambda kv: kv[1])
+            print(f"  {name:<10} peor fase: {worst[0]} x{worst[1]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
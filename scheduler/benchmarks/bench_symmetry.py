@@ -0,0 +1,59 @@
+# benchmarks/bench_symmetry.py
+"""
+Tiempo hasta el óptimo con y sin ruptura de simetría en plantillas con
+muchos trabajadores del mismo contrato (misma disponibilidad y max_hours).
+
+    python -m scheduler.benchmarks.bench_symmetry --workers 12 20 30
+"""
+
+import argparse
+import time
+
+from scheduler.benchmarks.generator import generate_request
+from scheduler.core.restrictions.symmetry import symmetry_groups
+from scheduler.core.restrictions_manager import (
+    ACTIVE_RESTRICTIONS,
+    SYMMETRY_RESTRICTIONS,
+)
+from scheduler.core.solve import BACKENDS, solve_schedule
+
+
+def run(n_workers, n_days=7, backend="matrix", seed=0):
+    request = generate_request(n_workers, n_days, unavailable=0.0, seed=seed)
+    result = {"groups": [len(g) for g in symmetry_groups(request)]}
+    for name, restrictions in (
+        ("base", ACTIVE_RESTRICTIONS),
+        ("symmetry", SYMMETRY_RESTRICTIONS),
+    ):
+        start = time.perf_counter()
+        solved = solve_schedule(
+            request, restrictions=restrictions, backend=backend, compact=True
+        )
+        result[name] = {
+            "status": solved.status,
+            "objective": solved.objective,
+            "time": time.perf_counter() - start,
+        }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[12, 20, 30])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--backend", choices=BACKENDS, default="matrix")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'workers':<9}{'grupos':<14}{'base':>16}{'simetría':>16}")
+    for n in args.workers:
+        r = run(n, args.days, args.backend, args.seed)
+        cells = [
+            f"{r[k]['time']:>7.2f}s {r[k]['objective']:>7.1f}"
+            for k in ("base", "symmetry")
+        ]
+        print(f"{n:<9}{str(r['groups']):<14}{cells[0]:>16}{cells[1]:>16}")
+
+
+if __name__ == "__main__":
+    main()
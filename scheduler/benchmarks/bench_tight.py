@@ -0,0 +1,114 @@
+# benchmarks/bench_tight.py
+"""
+Fuerza de la formulación: gap de la relajación LP en la raíz, nodos y
+tiempo de HiGHS con ACTIVE_RESTRICTIONS frente a TIGHT_RESTRICTIONS.
+
+"tight_rest" sólo cambia el descanso de 2 días (mismo óptimo que "active");
+"tight" además corrige el día completo, que pasa a penalizarse.
+
+    python -m scheduler.benchmarks.bench_tight --workers 10 20 30
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+from scheduler.benchmarks.generator import DEMAND_PROFILES, generate_request
+from scheduler.core.matrix import VariableIndex
+from scheduler.core.objective import objective_vector
+from scheduler.core.restrictions import rest2days
+from scheduler.core.restrictions_manager import (
+    ACTIVE_RESTRICTIONS,
+    TIGHT_RESTRICTIONS,
+    build_matrix,
+)
+
+RESTRICTION_SETS = {
+    "active": ACTIVE_RESTRICTIONS,
+    "tight_rest": [
+        (
+            rest2days.add_rest2days_constraints_tight
+            if add is rest2days.add_rest2days_constraints
+            else add
+        )
+        for add in ACTIVE_RESTRICTIONS
+    ],
+    "tight": TIGHT_RESTRICTIONS,
+}
+
+
+def _solve(c, index, A, lb, ub, integrality, time_limit):
+    lower, upper = index.bounds()
+    start = time.perf_counter()
+    res = milp(
+        c,
+        integrality=integrality,
+        bounds=Bounds(lower, upper),
+        constraints=LinearConstraint(A, lb, ub),
+        options={"disp": False, "time_limit": time_limit},
+    )
+    return res, time.perf_counter() - start
+
+
+def run_case(request, restrictions, time_limit=60):
+    index = VariableIndex(request)
+    c = objective_vector(index, request)
+    A, lb, ub = build_matrix(index, request, restrictions)
+
+    relaxed, _ = _solve(c, index, A, lb, ub, np.zeros(index.n_cols), time_limit)
+    res, elapsed = _solve(c, index, A, lb, ub, index.integrality(), time_limit)
+
+    objective = res.fun if res.x is not None else None
+    root_gap = None
+    if objective is not None:
+        root_gap = (objective - relaxed.fun) / max(abs(objective), 1.0)
+    return {
+        "rows": A.shape[0],
+        "nonzeros": A.nnz,
+        "lp_bound": relaxed.fun,
+        "objective": objective,
+        "root_gap": root_gap,
+        "nodes": getattr(res, "mip_node_count", None),
+        "final_gap": getattr(res, "mip_gap", None),
+        "time": elapsed,
+    }
+
+
+def run(workers=(10, 20), n_days=7, time_limit=60, profile="peaks", seed=0):
+    results = []
+    for n in workers:
+        request = generate_request(n, n_days, seed=seed, profile=profile)
+        for name, restrictions in RESTRICTION_SETS.items():
+            case = run_case(request, restrictions, time_limit)
+            case.update(workers=n, restrictions=name)
+            results.append(case)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[10, 20])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--time-limit", type=int, default=60)
+    parser.add_argument("--profile", choices=DEMAND_PROFILES, default="peaks")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'workers':<9}{'conjunto':<12}{'filas':>7}{'cota LP':>10}"
+        f"{'objetivo':>10}{'gap raíz':>10}{'nodos':>8}{'tiempo':>9}"
+    )
+    for r in run(args.workers, args.days, args.time_limit, args.profile, args.seed):
+        objective = "-" if r["objective"] is None else f"{r['objective']:.1f}"
+        gap = "-" if r["root_gap"] is None else f"{100 * r['root_gap']:.1f}%"
+        print(
+            f"{r['workers']:<9}{r['restrictions']:<12}{r['rows']:>7}"
+            f"{r['lp_bound']:>10.1f}{objective:>10}{gap:>10}"
+            f"{str(r['nodes']):>8}{r['time']:>8.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/generator.py
+
+import random
+
+from scheduler.config.settings import DEFAULT_MAX_HOURS
+from scheduler.services.builder import RequestBuilder
+
+DEMAND_PROFILES = ("flat", "peaks", "weekend")
+
+
+def _demand(rng, base, n_days, n_shifts, profile):
+    """
+    base = plantilla / 10 por turno y además:
+    - "peaks": refuerzo aleatorio a mediodía y noche
+    - "weekend": como "peaks" y más gente de viernes a domingo
+    """
+    if profile not in DEMAND_PROFILES:
+        raise ValueError(f"Perfil desconocido: {profile} (opciones: {DEMAND_PROFILES})")
+
+    demand = {}
+    for d in range(n_days):
+        demand[d] = {}
+        for t in range(n_shifts):
+            m = base
+            if profile != "flat":
+                m += rng.randint(0, base) * (t % 2)
+            if profile == "weekend" and d % 7 >= 4:
+                m += base // 2 + 1
+            demand[d][t] = m
+    return demand
+
+
+def generate_data(
+    n_workers, n_days=7, n_shifts=4, unavailable=0.2, seed=0, profile="peaks"
+):
+    """
+    Datos sintéticos reproducibles con la forma que guarda el repositorio:
+    - workers: [{id, name, max_hours}]
+    - availability: {worker_id: {day: {shift: 0}}} (sólo celdas no disponibles)
+    - demand: {day: {shift: min_workers}} según `profile` (DEMAND_PROFILES)
+    unavailable: fracción de celdas (w, d, t) no disponibles.
+    """
+    rng = random.Random(seed)
+
+    workers = [
+        {
+            "id": wid,
+            "name": f"Worker_{wid}",
+            "max_hours": rng.choice([20, 30, DEFAULT_MAX_HOURS]),
+        }
+        for wid in range(n_workers)
+    ]
+
+    availability = {}
+    for w in workers:
+        for d in range(n_days):
+            for t in range(n_shifts):
+                if rng.random() < unavailable:
+                    availability.setdefault(w["id"], {}).setdefault(d, {})[t] = 0
+
+    demand = _demand(rng, max(1, n_workers // 10), n_days, n_shifts, profile)
+    return workers, availability, demand
+
+
+def generate_request(
+    n_workers, n_days=7, n_shifts=4, unavailable=0.2, seed=0, profile="peaks"
+):
+    """Mismo que generate_data, como ScheduleRequest para el solver."""
+    workers, availability, demand = generate_data(
+        n_workers, n_days, n_shifts, unavailable, seed, profile
+    )
+    return RequestBuilder.from_dict(workers, availability, demand)
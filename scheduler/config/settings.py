@@ -17,3 +17,29 @@ TURN_HOURS = {
 
 M_BIG = 4  # Big-M turnos por día
 SOLVER_TIME_LIMIT = 120  # segundos límite de tiempo del solver
+
+# Opciones del solver por defecto (SolverOptions). None deja el valor
+# propio de CBC; no son valores medidos:
+# - SOLVER_GAP_REL: la biblioteca (solve_schedule y demás) resuelve hasta el
+#   óptimo exacto o SOLVER_TIME_LIMIT, como antes de SolverOptions. El gap
+#   medido es APP_SOLVER_GAP_REL, que sólo usa la interfaz.
+# - SOLVER_THREADS: sin medir; la máquina de los benchmarks tiene un solo
+#   núcleo. Antes de cambiarlo: bench_solver_options --only threads en una
+#   máquina con varios.
+SOLVER_THREADS = None
+SOLVER_GAP_REL = None
+SOLVER_GAP_ABS = None
+SOLVER_MAX_NODES = None  # sin límite de nodos
+SOLVER_CUTS = "on"  # CBC: off | root | ifmove | on | forceOn
+SOLVER_HEURISTICS = True
+
+# Gap inicial de la interfaz, medido con
+#   bench_solver_options --workers 10 20 --only gap --time-limit 60
+# (7 días, 1 núcleo). CBC encuentra pronto el mejor horario y gasta el
+# tiempo en cerrar la cota; con 5% para en cuanto lo tiene:
+#   gap         10 trabajadores   20 trabajadores
+#   exacto      60.1 s (límite)   60.1 s (límite)
+#   0.5%, 1%    60.1 s (límite)   60.1 s (límite)
+#   5%           3.6 s             2.8 s
+# con el mismo objetivo en todos los casos (-40.0 y -81.5).
+APP_SOLVER_GAP_REL = 0.05
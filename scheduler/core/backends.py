@@ -0,0 +1,283 @@
+# core/backends.py
+
+import copy
+import importlib.util
+
+import numpy as np
+from pulp import PULP_CBC_CMD
+
+from scheduler.config.settings import (
+    SOLVER_CUTS,
+    SOLVER_GAP_ABS,
+    SOLVER_GAP_REL,
+    SOLVER_HEURISTICS,
+    SOLVER_MAX_NODES,
+    SOLVER_THREADS,
+    SOLVER_TIME_LIMIT,
+)
+from scheduler.core.matrix import solve_matrix
+
+CUT_LEVELS = ("off", "root", "ifmove", "on", "forceOn")
+
+
+class SolverOptions:
+    """
+    Opciones comunes a todos los motores, por defecto las de
+    config/settings.py. None deja el valor por defecto del motor.
+
+    time_limit: segundos
+    gap: gap relativo MIP en el que parar (0.01 = 1%)
+    gap_abs: gap absoluto, en unidades del objetivo
+    threads: hilos del solver
+    max_nodes: nodos máximos del branch and bound
+    cuts: nivel de cortes de CBC (CUT_LEVELS); HiGHS y OR-Tools lo ignoran
+    heuristics: heurísticas primales activadas
+    msg: mostrar el log del solver
+
+    Lo que un motor no admite se ignora: scipy no tiene hilos, gap_abs ni
+    heurísticas; OR-Tools sólo usa gap, hilos y tiempo.
+    """
+
+    def __init__(
+        self,
+        time_limit=SOLVER_TIME_LIMIT,
+        gap=SOLVER_GAP_REL,
+        threads=SOLVER_THREADS,
+        msg=False,
+        gap_abs=SOLVER_GAP_ABS,
+        max_nodes=SOLVER_MAX_NODES,
+        cuts=SOLVER_CUTS,
+        heuristics=SOLVER_HEURISTICS,
+    ):
+        if cuts is not None and cuts not in CUT_LEVELS:
+            raise ValueError(f"cuts debe ser uno de {CUT_LEVELS}")
+        self.time_limit = time_limit
+        self.gap = gap
+        self.threads = threads
+        self.msg = msg
+        self.gap_abs = gap_abs
+        self.max_nodes = max_nodes
+        self.cuts = cuts
+        self.heuristics = heuristics
+
+    def as_dict(self):
+        return dict(vars(self))
+
+    def __repr__(self):
+        args = ", ".join(f"{k}={v!r}" for k, v in vars(self).items())
+        return f"SolverOptions({args})"
+
+
+def pulp_solver(options=None):
+    """PULP_CBC_CMD (subproceso) configurado con las opciones comunes."""
+    options = options or SolverOptions()
+    extra = []
+    if options.cuts is not None:
+        extra.append(f"cuts {options.cuts}")
+    if options.heuristics is not None:
+        extra.append("heuristics " + ("on" if options.heuristics else "off"))
+    return PULP_CBC_CMD(
+        msg=options.msg,
+        timeLimit=options.time_limit,
+        gapRel=options.gap,
+        gapAbs=options.gap_abs,
+        threads=options.threads,
+        maxNodes=options.max_nodes,
+        options=extra,
+    )
+
+
+def warm_start_solver(solver):
+    """
+    Copia de un PULP_CBC_CMD con warmStart activado. No se toca el solver
+    recibido: si lo reutiliza quien lo pasó, los siguientes solves no
+    arrancarían de valores iniciales viejos.
+    """
+    solver = copy.copy(solver)
+    solver.optionsDict = dict(solver.optionsDict, warmStart=True)
+    return solver
+
+
+# Motores en proceso para el backend "matrix": reciben el modelo como arrays
+# (c, cotas, matriz CSR) y devuelven (status, valores, objetivo) con status
+# al estilo de LpStatus. start: vector de valores iniciales o None.
+
+
+def solve_scipy(c, index, A, row_lb, row_ub, options, start=None):
+    # scipy.optimize.milp no admite hilos ni solución inicial
+    return solve_matrix(
+        c,
+        index,
+        A,
+        row_lb,
+        row_ub,
+        time_limit=options.time_limit,
+        gap=options.gap,
+        node_limit=options.max_nodes,
+    )
+
+
+def solve_highspy(c, index, A, row_lb, row_ub, options, start=None):
+    """
+    HiGHS vía highspy: la matriz se pasa por columnas (CSC) a passModel sin
+    copiarla a objetos Python, y admite hilos y MIP start.
+    """
+    highspy = _require("highspy")
+
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", bool(options.msg))
+    if options.time_limit is not None:
+        h.setOptionValue("time_limit", float(options.time_limit))
+    if options.gap is not None:
+        h.setOptionValue("mip_rel_gap", float(options.gap))
+    if options.gap_abs is not None:
+        h.setOptionValue("mip_abs_gap", float(options.gap_abs))
+    if options.threads is not None:
+        h.setOptionValue("threads", int(options.threads))
+    if options.max_nodes is not None:
+        h.setOptionValue("mip_max_nodes", int(options.max_nodes))
+    if options.heuristics is False:
+        h.setOptionValue("mip_heuristic_effort", 0.0)
+
+    lb, ub = index.bounds()
+    A = A.tocsc()
+    lp = highspy.HighsLp()
+    lp.num_col_ = index.n_cols
+    lp.num_row_ = A.shape[0]
+    lp.col_cost_ = c
+    lp.col_lower_ = lb
+    lp.col_upper_ = ub
+    lp.row_lower_ = row_lb
+    lp.row_upper_ = row_ub
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+    lp.a_matrix_.start_ = A.indptr
+    lp.a_matrix_.index_ = A.indices
+    lp.a_matrix_.value_ = A.data
+    lp.integrality_ = [
+        highspy.HighsVarType.kInteger if i else highspy.HighsVarType.kContinuous
+        for i in index.integrality()
+    ]
+    h.passModel(lp)
+
+    if start is not None:
+        solution = highspy.HighsSolution()
+        solution.col_value = list(start)
+        h.setSolution(solution)
+
+    h.run()
+    model_status = h.getModelStatus()
+    info = h.getInfo()
+    has_solution = info.primal_solution_status == 2  # kSolutionStatusFeasible
+
+    if model_status == highspy.HighsModelStatus.kInfeasible:
+        return "Infeasible", np.zeros(index.n_cols), None
+    if model_status == highspy.HighsModelStatus.kUnbounded:
+        return "Unbounded", np.zeros(index.n_cols), None
+    # Igual que PULP_CBC_CMD: si para por tiempo con solución entera, "Optimal"
+    if not has_solution:
+        return "Not Solved", np.zeros(index.n_cols), None
+
+    values = _round_integers(index, np.array(h.getSolution().col_value))
+    return "Optimal", values, float(c @ values)
+
+
+def solve_ortools(c, index, A, row_lb, row_ub, options, start=None, name="CBC"):
+    """
+    CBC (o SCIP con name="SCIP") enlazado en proceso a través de OR-Tools:
+    sin fichero MPS ni subproceso.
+    """
+    _require("ortools")
+    from ortools.linear_solver import pywraplp
+
+    solver = pywraplp.Solver.CreateSolver(name)
+    if solver is None:
+        raise RuntimeError(f"OR-Tools se compiló sin el solver {name}")
+    if options.msg:
+        solver.EnableOutput()
+    if options.time_limit is not None:
+        solver.SetTimeLimit(int(options.time_limit * 1000))
+    if options.threads is not None:
+        solver.SetNumThreads(int(options.threads))
+
+    inf = solver.infinity()
+    lb, ub = index.bounds()
+    lb, ub = np.clip(lb, -inf, inf), np.clip(ub, -inf, inf)
+    integrality = index.integrality()
+    columns = [
+        (
+            solver.IntVar(lb[j], ub[j], "")
+            if integrality[j]
+            else solver.NumVar(lb[j], ub[j], "")
+        )
+        for j in range(index.n_cols)
+    ]
+
+    objective = solver.Objective()
+    for j in np.flatnonzero(c):
+        objective.SetCoefficient(columns[j], float(c[j]))
+    objective.SetMinimization()
+
+    A = A.tocsr()
+    row_lb, row_ub = np.clip(row_lb, -inf, inf), np.clip(row_ub, -inf, inf)
+    for i in range(A.shape[0]):
+        row = solver.RowConstraint(row_lb[i], row_ub[i], "")
+        for k in range(A.indptr[i], A.indptr[i + 1]):
+            row.SetCoefficient(columns[A.indices[k]], float(A.data[k]))
+
+    if start is not None:
+        solver.SetHint(columns, [float(v) for v in start])
+
+    params = pywraplp.MPSolverParameters()
+    if options.gap is not None:
+        params.SetDoubleParam(params.RELATIVE_MIP_GAP, float(options.gap))
+    result = solver.Solve(params)
+
+    if result == pywraplp.Solver.INFEASIBLE:
+        return "Infeasible", np.zeros(index.n_cols), None
+    if result == pywraplp.Solver.UNBOUNDED:
+        return "Unbounded", np.zeros(index.n_cols), None
+    if result not in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
+        return "Not Solved", np.zeros(index.n_cols), None
+
+    values = _round_integers(index, np.array([v.solution_value() for v in columns]))
+    return "Optimal", values, float(c @ values)
+
+
+ENGINES = {
+    "scipy": solve_scipy,
+    "highspy": solve_highspy,
+    "ortools": solve_ortools,
+}
+
+# módulo que necesita cada motor opcional
+REQUIRES = {"highspy": "highspy", "ortools": "ortools"}
+
+
+def available_engines():
+    """Motores del backend "matrix" cuyas dependencias están instaladas."""
+    return [
+        name
+        for name in ENGINES
+        if name not in REQUIRES or importlib.util.find_spec(REQUIRES[name])
+    ]
+
+
+def get_engine(name):
+    if name not in ENGINES:
+        raise ValueError(f"Motor desconocido: {name} (opciones: {list(ENGINES)})")
+    return ENGINES[name]
+
+
+def _require(module, package=None):
+    if importlib.util.find_spec(module) is None:
+        raise ImportError(
+            f"El motor necesita el paquete opcional '{package or module}' "
+            "(pip install -r requirements-solvers.txt)"
+        )
+    return importlib.import_module(module)
+
+
+def _round_integers(index, values):
+    # redondear binarios (los solvers devuelven 0.9999999...)
+    integrality = index.integrality().astype(bool)
+    return np.where(integrality, np.round(values), values)
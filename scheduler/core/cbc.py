@@ -0,0 +1,264 @@
+# core/cbc.py
+
+import os
+import re
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+
+import numpy as np
+from pulp import LpSolutionOptimal, LpStatus, LpStatusOptimal
+
+from scheduler.core.backends import pulp_solver
+from scheduler.io.mps import write_mps
+
+
+def solve_mps(
+    index,
+    schedule_request,
+    c,
+    restrictions=None,
+    solver=None,
+    start=None,
+    progress=None,
+):
+    """
+    Escribe el modelo en streaming a un MPS y lo resuelve con el mismo
+    ejecutable y línea de comandos que PULP_CBC_CMD.
+    start: vector de valores iniciales por columna (MIP start, -mips).
+    progress: CbcProgress para seguir el solve y poder pararlo.
+    Devuelve (status, valores, objetivo).
+    """
+    solver = solver or pulp_solver()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        mps_path = os.path.join(tmp, "model.mps")
+        sol_path = os.path.join(tmp, "model.sol")
+        mst_path = os.path.join(tmp, "model.mst")
+
+        columns = write_mps(mps_path, index, schedule_request, c, restrictions)
+
+        args = [solver.path, mps_path]
+        if start is not None:
+            write_start(mst_path, columns, start)
+            args += ["-mips", mst_path]
+        args += solver_args(solver)
+        args += ["-solve", "-printingOptions", "all", "-solution", sol_path]
+
+        run_cbc(args, progress, solver.msg)
+
+        status, _ = solver.get_status(sol_path)
+        values = read_solution(sol_path, columns, index.n_cols)
+
+    return LpStatus[status], values, float(c @ values)
+
+
+def solve_pulp(model, solver, progress=None):
+    """
+    Equivale a model.solve(solver) con un PULP_CBC_CMD (mismo MPS, misma
+    línea de comandos y misma lectura de la solución) pero ejecutando CBC
+    con run_cbc, para seguir su progreso y poder pararlo.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        mps_path = os.path.join(tmp, "model.mps")
+        sol_path = os.path.join(tmp, "model.sol")
+        mst_path = os.path.join(tmp, "model.mst")
+
+        columns, variable_names, constraint_names, _ = model.writeMPS(
+            mps_path, rename=1
+        )
+        args = [solver.path, mps_path]
+        if solver.optionsDict.get("warmStart", False):
+            solver.writesol(mst_path, model, columns, variable_names, constraint_names)
+            args += ["-mips", mst_path]
+        args += solver_args(solver)
+        args += ["-solve", "-printingOptions", "all", "-solution", sol_path]
+
+        run_cbc(args, progress, solver.msg)
+
+        status, values, _, _, _, sol_status = solver.readsol_MPS(
+            sol_path, model, columns, variable_names, constraint_names
+        )
+    model.assignVarsVals(values)
+    model.assignStatus(status, sol_status)
+    return status
+
+
+def gap_reached(model):
+    """
+    True si CBC terminó porque demostró el óptimo o alcanzó el gap. Al
+    parar por el límite de tiempo (o a mano) PuLP también da "Optimal"
+    si hay solución, pero con sol_status LpSolutionIntegerFeasible.
+    """
+    return model.status == LpStatusOptimal and model.sol_status == LpSolutionOptimal
+
+
+def solver_args(solver):
+    """Opciones de PULP_CBC_CMD como argumentos de la línea de comandos."""
+    args = []
+    if solver.timeLimit is not None:
+        args += ["-sec", str(solver.timeLimit)]
+    for option in solver.options + solver.getOptions():
+        args += ("-" + option).split()
+    return args
+
+
+# Líneas del log de CBC con mejor solución entera y cota inferior:
+#   Cbc0012I Integer solution of -81 found by DiveCoefficient after ...
+#   Cbc0010I After 100 nodes, 5 on tree, -81 best solution, best possible -83.1 ...
+#   Cbc0013I At root node, 116 cuts changed objective from -90.46 to -83.13 ...
+#   Cbc0001I Search completed - best objective -81.5, took ...
+#   Cbc0005I Partial search - best objective -81.5 (best possible -83.13), took ...
+#   Cbc0045I MIPStart provided solution with cost -81.5
+_NUMBER = r"(-?[\d.]+(?:e[+-]?\d+)?)"
+_INCUMBENT = [
+    re.compile(r"Integer solution of " + _NUMBER),
+    re.compile(_NUMBER + r" best solution"),
+    re.compile(r"best objective " + _NUMBER),
+    re.compile(r"MIPStart provided solution with cost " + _NUMBER),
+]
+_BOUND = [
+    re.compile(r"Continuous objective value is " + _NUMBER),
+    re.compile(r"changed objective from \S+ to " + _NUMBER),
+    re.compile(r"best possible " + _NUMBER),
+]
+_COMPLETED = re.compile(r"Search completed - best objective " + _NUMBER)
+
+
+class CbcProgress:
+    """
+    Progreso de un solve de CBC leído de su log: mejor solución entera
+    encontrada (incumbent), cota inferior (bound) y gap relativo entre ambas.
+
+    callback(progress) se llama cada vez que mejora el incumbent o la cota.
+    stop() pide a CBC que pare (SIGINT): termina limpiamente y devuelve la
+    mejor solución encontrada, como al agotar el tiempo.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.incumbent = None
+        self.bound = None
+        self.history = []  # (segundos, incumbent, bound) en cada mejora
+        self.started = time.perf_counter()
+        self._stop = threading.Event()
+
+    @property
+    def gap(self):
+        if self.incumbent is None or self.bound is None:
+            return None
+        return abs(self.incumbent - self.bound) / max(abs(self.incumbent), 1e-9)
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def stopped(self):
+        return self._stop.is_set()
+
+    def feed(self, line):
+        """Actualiza el estado con una línea del log; True si mejoró algo."""
+        incumbent, bound = self.incumbent, self.bound
+        for pattern in _INCUMBENT:
+            for match in pattern.finditer(line):
+                value = float(match.group(1))
+                if self.incumbent is None or value < self.incumbent:
+                    self.incumbent = value
+        for pattern in _BOUND:
+            for match in pattern.finditer(line):
+                value = float(match.group(1))
+                if self.bound is None or value > self.bound:
+                    self.bound = value
+        completed = _COMPLETED.search(line)
+        if completed:
+            # búsqueda completa: la cota alcanza al óptimo
+            self.bound = float(completed.group(1))
+
+        changed = (incumbent, bound) != (self.incumbent, self.bound)
+        if changed:
+            self.history.append((self.elapsed, self.incumbent, self.bound))
+            if self.callback is not None:
+                self.callback(self)
+        return changed
+
+
+def run_cbc(args, progress=None, msg=False):
+    """
+    Ejecuta CBC. Con progress lee el log línea a línea a través de un
+    pseudo-terminal (por una tubería CBC lo retiene en bloques de 4 KB) y
+    atiende progress.stop() enviando SIGINT. En sistemas sin pty el log se
+    lee por tubería y stop() no está disponible.
+    """
+    if progress is None:
+        subprocess.run(
+            args,
+            stdout=None if msg else subprocess.DEVNULL,
+            stderr=None if msg else subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            check=True,
+        )
+        return
+
+    if os.name == "posix":
+        import pty
+
+        reader, writer = pty.openpty()
+    else:
+        reader, writer = os.pipe()
+    proc = subprocess.Popen(
+        args, stdout=writer, stderr=writer, stdin=subprocess.DEVNULL
+    )
+    os.close(writer)
+
+    def watch_stop():
+        while proc.poll() is None:
+            if progress._stop.wait(0.1):
+                if os.name == "posix":
+                    proc.send_signal(signal.SIGINT)
+                return
+
+    threading.Thread(target=watch_stop, daemon=True).start()
+
+    with open(reader, errors="replace") as log:
+        try:
+            for line in log:
+                if msg:
+                    print(line, end="")
+                progress.feed(line)
+        except OSError:
+            # EIO al cerrar CBC el pseudo-terminal
+            pass
+
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, args)
+
+
+def read_solution(path, columns, n_cols):
+    """Lee el fichero -solution de CBC (nombres X0000000...) a un vector."""
+    values = np.zeros(n_cols)
+    with open(path) as f:
+        next(f)  # línea de estado
+        for line in f:
+            parts = line.split()
+            if not parts:
+                break
+            if parts[0] == "**":
+                parts = parts[1:]
+            name, val = parts[1], parts[2]
+            if name.startswith("X"):
+                values[columns[int(name[1:])]] = float(val)
+    return values
+
+
+def write_start(path, columns, start):
+    """Fichero de MIP start con el formato de COIN_CMD.writesol."""
+    with open(path, "w") as f:
+        f.write("Stopped on time - objective value 0\n")
+        for i, col in enumerate(columns):
+            f.write("{:>7} {} {:>15} {:>23}\n".format(i, "X%07d" % i, start[col], 0))
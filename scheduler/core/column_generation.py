@@ -0,0 +1,416 @@
+# core/column_generation.py
+
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, linprog, milp
+from scipy.sparse import csr_matrix, hstack, identity, vstack
+
+from scheduler.config.settings import (
+    P_COVER,
+    P_EMPTY,
+    P_LESS,
+    P_REST,
+    P_SPLIT,
+    TURN_HOURS,
+)
+from scheduler.core.backends import SolverOptions
+from scheduler.core.domain import as_request
+from scheduler.core.evaluate import Evaluator
+from scheduler.core.matrix import (
+    FAMILIES,
+    VariableIndex,
+    assign_values,
+    availability_array,
+    demand_array,
+)
+from scheduler.core.model import build_variables
+from scheduler.core.solution import ScheduleSolution
+from scheduler.core.stats import SolveStats
+
+TOLERANCE = 1e-6
+
+# estado del día anterior en el DP de pricing
+FREE, WORKED, NIGHT = 0, 1, 2
+
+
+def day_patterns(shifts):
+    """
+    Los 2^T subconjuntos de turnos de un día: bits (S, T), horas (S,) y
+    coste propio (S,) con las mismas penalizaciones que set_objective
+    (turnos partidos y -P_LESS por turno trabajado).
+    """
+    T = len(shifts)
+    bits = (np.arange(2**T)[:, None] >> np.arange(T)) & 1
+    hours = bits @ np.array([TURN_HOURS[t] for t in shifts])
+    on = {t: bits[:, k] for k, t in enumerate(shifts)}
+    off = np.zeros(len(bits), dtype=int)
+    s0, s1, s2, s3 = (on.get(t, off) for t in (0, 1, 2, 3))
+    split = (
+        np.maximum(0, s0 + s2 - s1 - 1)
+        + np.maximum(0, s1 + s3 - s2 - 1)
+        + np.maximum(0, s0 + s3 - 1)
+    )
+    cost = P_SPLIT * split - P_LESS * bits.sum(axis=1)
+    return bits.astype(np.uint8), hours, cost.astype(float)
+
+
+class PricingProblem:
+    """
+    Subproblema de pricing de todos los trabajadores a la vez: un DP sobre
+    los días con 2^T decisiones por día (el subconjunto de turnos) y estado
+    (horas acumuladas, primer día libre, estado del día anterior, ya hay 2
+    días libres seguidos). Dentro del DP se cumplen disponibilidad,
+    noche→mañana y max_hours (en hours.py viol_max suma en el lado
+    izquierdo, así que nunca permite superarlas); los turnos partidos y el
+    descanso de 2 días se pagan en el coste.
+    """
+
+    def __init__(self, index, schedule_request):
+        schedule_request = as_request(schedule_request)
+        self.shifts = index.shifts
+        self.bits, self.hours, self.base = day_patterns(index.shifts)
+        blocked = 1 - availability_array(index, schedule_request)
+        # subconjunto s permitido para (w, d) si no usa turnos no disponibles
+        self.allowed = (blocked @ self.bits.T.astype(float)) == 0
+        self.max_hours = schedule_request.max_hours
+        self.n_hours = int(self.max_hours.max()) + 1
+
+        pos = {t: k for k, t in enumerate(index.shifts)}
+        empty = np.zeros(len(self.bits), dtype=bool)
+        self.night = self.bits[:, pos[3]] == 1 if 3 in pos else empty
+        self.morning = self.bits[:, pos[0]] == 1 if 0 in pos else empty
+        self.after = np.where(
+            np.arange(len(self.bits)) == 0, FREE, np.where(self.night, NIGHT, WORKED)
+        )
+
+        # penalización final por estado (h, primer libre, anterior, par libre)
+        h = np.arange(self.n_hours)
+        end = np.where(h[None, :] > self.max_hours[:, None], np.inf, 0.0)
+        end = np.broadcast_to(end[:, :, None, None, None], self._shape()).copy()
+        no_pair = np.ones((2, 3, 2), dtype=bool)
+        no_pair[:, :, 1] = False
+        no_pair[1, FREE, :] = False  # par modular (último día, primer día)
+        self.end = end + P_REST * no_pair
+
+    def _shape(self):
+        return (len(self.max_hours), self.n_hours, 2, 3, 2)
+
+    def solve(self, duals, workers=None):
+        """
+        duals: (D, T) valor de cubrir cada turno, común a todos, o (n, D, T)
+        uno por trabajador de `workers` (por defecto todos).
+        Devuelve (subconjunto elegido (n, D), coste del patrón menos los
+        duales cubiertos (n,)).
+        """
+        workers = np.arange(len(self.max_hours)) if workers is None else workers
+        cost = self.base - duals @ self.bits.T.astype(float)  # (D, S) o (n, D, S)
+        cost = np.where(self.allowed[workers], cost, np.inf)  # (n, D, S)
+        W, D, S = cost.shape
+        H = self.n_hours
+        shape = (W,) + self._shape()[1:]
+
+        value = np.full(shape, np.inf)
+        for s in range(S):
+            h, a = self.hours[s], int(s == 0)
+            if h < H:
+                value[:, h, a, self.after[s], 0] = np.minimum(
+                    value[:, h, a, self.after[s], 0], cost[:, 0, s]
+                )
+        parents = []
+        for d in range(1, D):
+            new = np.full(shape, np.inf)
+            choice = np.zeros(shape, dtype=np.int8)
+            prev = np.zeros(shape, dtype=np.int8)
+            pair = np.zeros(shape, dtype=np.int8)
+            for s in range(S):
+                h = self.hours[s]
+                if h >= H:
+                    continue
+                day_cost = cost[:, d, s][:, None, None]
+                for p in (FREE, WORKED, NIGHT):
+                    if p == NIGHT and self.morning[s]:
+                        continue  # descanso noche → mañana
+                    for c in (0, 1):
+                        c_new = 1 if (p == FREE and s == 0) else c
+                        cand = value[:, : H - h, :, p, c] + day_cost
+                        target = new[:, h:, :, self.after[s], c_new]
+                        better = cand < target
+                        target[better] = cand[better]
+                        choice[:, h:, :, self.after[s], c_new][better] = s
+                        prev[:, h:, :, self.after[s], c_new][better] = p
+                        pair[:, h:, :, self.after[s], c_new][better] = c
+            value = new
+            parents.append((choice, prev, pair))
+
+        total = (value + self.end[workers]).reshape(W, -1)
+        best = total.argmin(axis=1)
+        reduced = total[np.arange(W), best]
+        h, a, p, c = np.unravel_index(best, self._shape()[1:])
+
+        rows = np.arange(W)
+        chosen = np.zeros((W, D), dtype=int)
+        for d in range(D - 1, 0, -1):
+            choice, prev, pair = parents[d - 1]
+            s = choice[rows, h, a, p, c]
+            chosen[:, d] = s
+            h, p, c = h - self.hours[s], prev[rows, h, a, p, c], pair[rows, h, a, p, c]
+        chosen[:, 0] = [self._first_day(h[i], a[i], p[i], cost[i, 0]) for i in range(W)]
+        return chosen, reduced
+
+    def pattern_cost(self, workers, chosen):
+        """Coste real (sin duales) de los patrones chosen (n, D) de workers."""
+        costs = self.base[chosen].sum(axis=1)
+        free = chosen == 0
+        pair = (free & np.roll(free, -1, axis=1)).any(axis=1)
+        return costs + P_REST * ~pair
+
+    def _first_day(self, h, a, p, cost):
+        # subconjunto del primer día compatible con el estado de llegada
+        match = (self.hours == h) & ((np.arange(len(cost)) == 0) == a)
+        match &= self.after == p
+        return int(np.flatnonzero(match)[np.argmin(cost[match])])
+
+
+def best_response(pricing, demand, chosen, max_sweeps=10):
+    """
+    Mejora local de un horario (subconjunto elegido (W, D)): con el resto
+    fijo, el valor de que un trabajador cubra (d, t) es exacto (P_COVER si
+    falta gente, más P_EMPTY si nadie más lo cubre), así que el DP de
+    pricing da su mejor patrón. Se recorren los trabajadores hasta que
+    ninguno mejora.
+    """
+    chosen = chosen.copy()
+    x = pricing.bits[chosen].astype(int)  # (W, D, T)
+    cover = x.sum(axis=0)
+    for _ in range(max_sweeps):
+        changed = 0
+        for w in range(len(chosen)):
+            others = cover - x[w]
+            value = P_COVER * (others < demand) + P_EMPTY * (others == 0)
+            current = pricing.pattern_cost([w], chosen[w][None])[0]
+            current -= (value * x[w]).sum()
+            new, best = pricing.solve(value[None], [w])
+            if best[0] < current - TOLERANCE:
+                chosen[w] = new[0]
+                x[w] = pricing.bits[new[0]]
+                cover = others + x[w]
+                changed += 1
+        if not changed:
+            break
+    return chosen
+
+
+class Columns:
+    """Patrones semanales generados: trabajador, x (D*T) y coste de cada uno."""
+
+    def __init__(self, n_workers, n_cells):
+        self.n_workers = n_workers
+        self.worker = np.zeros(0, dtype=int)
+        self.x = np.zeros((0, n_cells), dtype=np.uint8)
+        self.cost = np.zeros(0)
+        self.seen = set()
+
+    def add(self, workers, x, cost):
+        """Añade los patrones nuevos; devuelve cuántos lo eran."""
+        keep = []
+        for i, (w, row) in enumerate(zip(workers, x)):
+            key = (int(w), row.tobytes())
+            if key not in self.seen:
+                self.seen.add(key)
+                keep.append(i)
+        self.worker = np.concatenate([self.worker, np.asarray(workers)[keep]])
+        self.x = np.vstack([self.x, x[keep]])
+        self.cost = np.concatenate([self.cost, np.asarray(cost)[keep]])
+        return len(keep)
+
+    def __len__(self):
+        return len(self.worker)
+
+    def master(self, demand):
+        """
+        Problema maestro: min coste·λ + P_COVER·deficit + P_EMPTY·z
+        con (por turno) Σ a·λ + deficit >= m, Σ a·λ + z >= 1 y un patrón por
+        trabajador. Columnas [λ | deficit | z]; filas [cobertura; vacío;
+        convexidad].
+        """
+        n, cells = len(self), self.x.shape[1]
+        cover = csr_matrix(self.x.T.astype(float))
+        eye = identity(cells, format="csr")
+        zero = csr_matrix((cells, cells))
+        convexity = csr_matrix(
+            (np.ones(n), (self.worker, np.arange(n))), shape=(self.n_workers, n)
+        )
+        A = vstack(
+            [
+                hstack([cover, eye, zero]),
+                hstack([cover, zero, eye]),
+                hstack([convexity, csr_matrix((self.n_workers, 2 * cells))]),
+            ],
+            format="csr",
+        )
+        c = np.concatenate(
+            [self.cost, np.full(cells, P_COVER), np.full(cells, P_EMPTY)]
+        )
+        lb = np.concatenate([demand.ravel(), np.ones(cells), np.ones(self.n_workers)])
+        ub = np.concatenate([np.full(2 * cells, np.inf), np.ones(self.n_workers)])
+        upper = np.concatenate([np.ones(n), np.full(cells, np.inf), np.ones(cells)])
+        return c, A, lb, ub, upper
+
+
+def _solve_lp(c, A, lb, upper, n_ge):
+    # maestro relajado con HiGHS: las n_ge primeras filas son >= (se pasan
+    # negadas como <=) y el resto la convexidad (=)
+    res = linprog(
+        c,
+        A_ub=-A[:n_ge],
+        b_ub=-lb[:n_ge],
+        A_eq=A[n_ge:],
+        b_eq=lb[n_ge:],
+        bounds=np.column_stack([np.zeros(len(c)), upper]),
+        method="highs",
+    )
+    if res.status != 0:
+        raise RuntimeError(f"El maestro relajado no se resolvió: {res.message}")
+    return res.fun, -res.ineqlin.marginals, res.eqlin.marginals
+
+
+def _integer_master(columns, demand, options):
+    # maestro entero sólo con las columnas generadas (price and branch)
+    c, A, lb, ub, upper = columns.master(demand)
+    n, cells = len(columns), columns.x.shape[1]
+    integrality = np.ones(len(c), dtype=np.uint8)
+    integrality[n : n + cells] = 0
+    milp_options = {"disp": False}
+    if options.time_limit is not None:
+        milp_options["time_limit"] = options.time_limit
+    if options.gap is not None:
+        milp_options["mip_rel_gap"] = options.gap
+    res = milp(
+        c,
+        integrality=integrality,
+        bounds=Bounds(np.zeros(len(c)), upper),
+        constraints=LinearConstraint(A, lb, ub),
+        options=milp_options,
+    )
+    if res.x is None:
+        return None
+    picked = np.flatnonzero(np.round(res.x[:n]) == 1)
+    return picked[np.argsort(columns.worker[picked])]
+
+
+def solve_column_generation(
+    schedule_request,
+    options=None,
+    max_iterations=200,
+    local_search=False,
+    compact=False,
+    on_iteration=None,
+):
+    """
+    Generación de columnas con patrones semanales por trabajador.
+
+    El maestro cubre demand[d][t] eligiendo un patrón por trabajador; el
+    pricing (PricingProblem, un DP días × subconjuntos de turnos) genera
+    patrones que ya cumplen disponibilidad, noche→mañana y max_hours, y
+    cuyo coste incluye turnos partidos, descanso de 2 días y -P_LESS por
+    turno. Es el mismo modelo que ACTIVE_RESTRICTIONS.
+
+    Se resuelve la relajación del maestro hasta que ningún trabajador tiene
+    un patrón de coste reducido negativo (o max_iterations) y después el
+    maestro entero sólo con los patrones generados (HiGHS con el tiempo y
+    gap de `options`). Es una heurística, así que el status es "Heuristic"
+    (o "Not Solved" si el maestro entero no da solución): la cota inferior
+    (relajación más costes reducidos, cota de Lagrange) da el gap relativo
+    frente al óptimo, (objetivo - cota) / |objetivo|.
+    local_search: pulir el resultado con best_response.
+
+    on_iteration(iteración, columnas_nuevas, objetivo_lp) en cada ronda.
+    Devuelve lo mismo que solve_schedule más "iterations", "lower_bound" y
+    "gap".
+    """
+    options = options or SolverOptions()
+    stats = SolveStats()
+
+    with stats.phase("build_variables"):
+        index = VariableIndex(schedule_request)
+        demand = demand_array(index, schedule_request)
+        pricing = PricingProblem(index, schedule_request)
+        W, D, T = index.x.shape
+        columns = Columns(W, D * T)
+        # patrón vacío: siempre factible
+        empty = np.zeros((W, D), dtype=int)
+        columns.add(
+            np.arange(W),
+            pricing.bits[empty].reshape(W, D * T),
+            pricing.pattern_cost(np.arange(W), empty),
+        )
+
+    iterations = []
+    lower_bound = -np.inf
+    for it in range(max_iterations):
+        with stats.phase("master"):
+            c, A, lb, ub, upper = columns.master(demand)
+            lp_value, row_duals, convexity = _solve_lp(c, A, lb, upper, 2 * D * T)
+        with stats.phase("pricing"):
+            duals = (row_duals[: D * T] + row_duals[D * T :]).reshape(D, T)
+            chosen, dp_cost = pricing.solve(duals)
+            reduced = dp_cost - convexity
+            lower_bound = max(lower_bound, lp_value + np.minimum(reduced, 0).sum())
+            improving = np.flatnonzero(reduced < -TOLERANCE)
+            added = columns.add(
+                improving,
+                pricing.bits[chosen[improving]].reshape(-1, D * T),
+                pricing.pattern_cost(improving, chosen[improving]),
+            )
+        iterations.append(
+            {"columns": added, "lp_objective": lp_value, "lower_bound": lower_bound}
+        )
+        if on_iteration is not None:
+            on_iteration(it, added, lp_value)
+        if not added:
+            break
+
+    with stats.phase("integer_master"):
+        picked = _integer_master(columns, demand, options)
+
+    n = len(columns)
+    if picked is None:
+        status, values, objective = "Not Solved", np.zeros(index.n_cols), None
+    else:
+        x = columns.x[picked].reshape(W, D, T).astype(int)
+        chosen = x @ (1 << np.arange(T))  # subconjunto de cada (w, d)
+        if local_search:
+            with stats.phase("local_search"):
+                chosen = best_response(pricing, demand, chosen)
+        with stats.phase("extract"):
+            evaluator = Evaluator(schedule_request, index=index)
+            x = pricing.bits[chosen]
+            values = evaluator.vector(x)
+            status = "Heuristic"
+            objective = evaluator.objective(x)
+
+    stats.size = {"variables": index.n_cols, "columns": n}
+    gap = None
+    if objective is not None:
+        gap = max(objective - lower_bound, 0.0) / max(abs(objective), TOLERANCE)
+
+    if compact:
+        solution = ScheduleSolution.from_vector(status, objective, index, values)
+        solution.stats = stats.as_dict()
+        solution.iterations = iterations
+        solution.lower_bound = lower_bound
+        solution.gap = gap
+        return solution
+
+    with stats.phase("extract"):
+        variables = build_variables(schedule_request)
+        assign_values(variables, index, values)
+    return {
+        "status": status,
+        "model": None,
+        "variables": dict(zip(FAMILIES, variables)),
+        "objective": objective,
+        "iterations": iterations,
+        "lower_bound": lower_bound,
+        "gap": gap,
+        "stats": stats.as_dict(),
+    }
@@ -0,0 +1,196 @@
+# core/decomposition.py
+
+import copy
+import math
+import time
+
+from pulp import LpStatus, value
+
+from scheduler.config.settings import SOLVER_TIME_LIMIT, TURN_HOURS
+from scheduler.core.backends import SolverOptions, pulp_solver
+from scheduler.core.domain import ScheduleRequest, Worker, as_request
+from scheduler.core.matrix import FAMILIES
+from scheduler.core.model import create_model
+from scheduler.core.objective import set_objective
+from scheduler.core.restrictions_manager import apply_restrictions
+from scheduler.core.solve import solve_schedule
+
+
+def _sub_request(schedule_request, days, max_hours):
+    request = as_request(schedule_request)
+    workers = [
+        Worker(w.id, getattr(w, "name", str(w.id)), max_hours[w.id])
+        for w in request.workers
+    ]
+    cols = [request.day_pos[d] for d in days]
+    return ScheduleRequest.from_arrays(
+        workers,
+        days,
+        request.shifts,
+        request.available[:, cols],
+        request.demand_matrix[cols],
+    )
+
+
+def solve_fixed(schedule_request, assigned, solver=None, restrictions=None):
+    """
+    Resuelve el modelo completo con todas las x fijadas a `assigned`
+    (conjunto de (w, d, t)); sirve para obtener el objetivo exacto y el resto
+    de variables de un horario ya decidido.
+    """
+    model, variables = create_model(schedule_request)
+    apply_restrictions(model, variables, schedule_request, restrictions)
+    set_objective(model, variables, schedule_request)
+
+    for key, var in variables[0].items():
+        var.lowBound = var.upBound = 1 if key in assigned else 0
+
+    model.solve(solver or pulp_solver())
+    return {
+        "status": LpStatus[model.status],
+        "model": model,
+        "variables": dict(zip(FAMILIES, variables)),
+        "objective": value(model.objective),
+    }
+
+
+def solve_rolling_horizon(
+    schedule_request,
+    window=7,
+    overlap=0,
+    time_limit=None,
+    restrictions=None,
+    options=None,
+):
+    """
+    Resuelve un horizonte largo por ventanas de `window` días.
+
+    - Cada ventana se resuelve con el día anterior ya decidido como día
+      frontera fijo, de modo que noche→mañana y las ventanas de 2 días
+      libres que cruzan la frontera se respetan.
+    - Con overlap > 0 sólo se fijan los primeros window - overlap días de
+      cada ventana; los solapados se vuelven a optimizar en la siguiente.
+    - Las horas ya asignadas se descuentan de max_hours y el resto se reparte
+      proporcionalmente a los días que quedan.
+    - Si un trabajador ya tiene sus 2 días libres seguidos, la ventana no
+      vuelve a penalizar viol_rest.
+
+    time_limit: segundos por ventana (por defecto SOLVER_TIME_LIMIT repartido
+    entre las ventanas).
+    options: SolverOptions para el CBC de cada ventana (su time_limit se
+    sustituye por el de la ventana).
+    Devuelve un resultado como solve_schedule con "windows" y "wall_time".
+    """
+    if not 0 <= overlap < window:
+        raise ValueError("overlap debe estar entre 0 y window - 1")
+
+    start_time = time.perf_counter()
+    days = schedule_request.days
+    shifts = schedule_request.shifts
+    workers = schedule_request.workers
+    step = window - overlap
+    n_windows = max(1, math.ceil(max(len(days) - overlap, 1) / step))
+    if time_limit is None:
+        time_limit = max(1, SOLVER_TIME_LIMIT // n_windows)
+
+    assigned = set()
+    used_hours = {w.id: 0 for w in workers}
+    rest_done = {w.id: False for w in workers}
+    windows = []
+
+    committed = 0  # días ya fijados
+    while committed < len(days):
+        boundary = days[committed - 1] if committed else None
+        new_days = days[committed : committed + window]
+        last_window = committed + window >= len(days)
+        commit_days = new_days if last_window else new_days[:step]
+        window_days = ([boundary] if boundary is not None else []) + new_days
+
+        # presupuesto de horas: lo que queda, repartido por días restantes
+        remaining_days = len(days) - committed
+        max_hours = {}
+        for w in workers:
+            left = max(0, w.max_hours - used_hours[w.id])
+            budget = math.ceil(left * len(new_days) / remaining_days)
+            boundary_hours = sum(
+                TURN_HOURS[t] for t in shifts if (w.id, boundary, t) in assigned
+            )
+            max_hours[w.id] = budget + boundary_hours
+
+        sub = _sub_request(schedule_request, window_days, max_hours)
+        model, variables = create_model(sub)
+        apply_restrictions(model, variables, sub, restrictions)
+        set_objective(model, variables, sub)
+        x, free2, viol_rest = variables[0], variables[8], variables[9]
+
+        # día frontera fijo
+        if boundary is not None:
+            for w in workers:
+                for t in shifts:
+                    x[(w.id, boundary, t)].lowBound = x[(w.id, boundary, t)].upBound = (
+                        1 if (w.id, boundary, t) in assigned else 0
+                    )
+
+        for w in workers:
+            # rest2days es modular dentro de la ventana: el par (último día,
+            # frontera) no existe salvo en la última ventana, donde se admite
+            # si el primer día del horizonte quedó libre
+            first_free = not any((w.id, days[0], t) in assigned for t in shifts)
+            if not (last_window and first_free):
+                free2[(w.id, window_days[-1])].upBound = 0
+            if rest_done[w.id]:
+                model.objective.pop(viol_rest[w.id], None)
+
+        window_options = copy.copy(options or SolverOptions())
+        window_options.time_limit = time_limit
+        model.solve(pulp_solver(window_options))
+
+        for (wid, d, t), var in x.items():
+            if d in commit_days and var.value() == 1:
+                assigned.add((wid, d, t))
+                used_hours[wid] += TURN_HOURS[t]
+
+        done_days = days[: committed + len(commit_days)]
+        for w in workers:
+            free = [
+                not any((w.id, d, t) in assigned for t in shifts) for d in done_days
+            ]
+            if any(a and b for a, b in zip(free, free[1:])):
+                rest_done[w.id] = True
+
+        windows.append(
+            {
+                "days": list(new_days),
+                "committed": list(commit_days),
+                "status": LpStatus[model.status],
+                "objective": value(model.objective),
+            }
+        )
+        committed += len(commit_days)
+
+    result = solve_fixed(schedule_request, assigned, restrictions=restrictions)
+    result["windows"] = windows
+    result["wall_time"] = time.perf_counter() - start_time
+    return result
+
+
+def compare_with_monolithic(schedule_request, **kwargs):
+    """Tiempo total y objetivo final de la descomposición frente al modelo único."""
+    start = time.perf_counter()
+    monolithic = solve_schedule(schedule_request)
+    monolithic_time = time.perf_counter() - start
+
+    decomposed = solve_rolling_horizon(schedule_request, **kwargs)
+    return {
+        "monolithic": {
+            "status": monolithic["status"],
+            "objective": monolithic["objective"],
+            "wall_time": monolithic_time,
+        },
+        "decomposed": {
+            "status": decomposed["status"],
+            "objective": decomposed["objective"],
+            "wall_time": decomposed["wall_time"],
+            "windows": len(decomposed["windows"]),
+        },
+    }
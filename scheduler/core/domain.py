@@ -1,9 +1,13 @@
 # core/domain.py
 
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+import numpy as np
 
 
 class Worker:
+    __slots__ = ("id", "name", "max_hours")
+
     def __init__(self, id: int, name: str, max_hours: int):
         self.id = id
         self.name = name
@@ -16,19 +20,104 @@ class ScheduleRequest:
     - workers
     - disponibilidad
     - demanda mínimos m[d][t]
+
+    Al construirse se pasa todo a arrays, que es lo que leen los builders:
+    - available: uint8 (workers, days, shifts), 1 = disponible
+    - demand_matrix: int (days, shifts)
+    - max_hours: (workers,)
+    - worker_pos, day_pos, shift_pos: posición de cada id en esos ejes
+    availability y demand se guardan tal cual (la forma de dict de
+    RequestBuilder.from_dict y load_data). No se modifican después: para
+    editar se construye otro ScheduleRequest.
+
+    days/shifts: por defecto las claves ordenadas de demand; las celdas que
+    falten en demand valen 0.
     """
 
-    def __init__(self, workers: List[Worker], availability: Dict, demand: Dict):
+    def __init__(
+        self,
+        workers: List[Worker],
+        availability: Dict,
+        demand: Dict,
+        days: Optional[List[int]] = None,
+        shifts: Optional[List[int]] = None,
+    ):
         self.workers = workers
-        self.availability = availability  # a[w][d][t]
+        self.availability = availability  # a[w][d][t], ausente = disponible
         self.demand = demand  # m[d][t]
 
-    @property
-    def days(self):
-        return list(sorted(self.demand.keys()))
+        self.worker_ids = [w.id for w in workers]
+        self.days = sorted(demand) if days is None else list(days)
+        if shifts is None:
+            # asumimos todos los días tienen todos los turnos cargados
+            shifts = sorted(demand[self.days[0]]) if self.days else []
+        self.shifts = list(shifts)
+        self.worker_pos = {wid: i for i, wid in enumerate(self.worker_ids)}
+        self.day_pos = {d: j for j, d in enumerate(self.days)}
+        self.shift_pos = {t: k for k, t in enumerate(self.shifts)}
+
+        W, D, T = len(workers), len(self.days), len(self.shifts)
+        self.max_hours = np.array([w.max_hours for w in workers])
+        self.demand_matrix = np.array(
+            [[demand.get(d, {}).get(t, 0) for t in self.shifts] for d in self.days],
+            dtype=int,
+        ).reshape(D, T)
+
+        # sólo se recorren las celdas presentes en el dict (normalmente las 0)
+        self.available = np.ones((W, D, T), dtype=np.uint8)
+        for wid, by_day in availability.items():
+            i = self.worker_pos.get(wid)
+            if i is None:
+                continue
+            for d, by_shift in by_day.items():
+                j = self.day_pos.get(d)
+                if j is None:
+                    continue
+                for t, a in by_shift.items():
+                    k = self.shift_pos.get(t)
+                    if k is not None:
+                        self.available[i, j, k] = a
+
+    @classmethod
+    def from_arrays(cls, workers, days, shifts, available, demand_matrix):
+        """
+        Inverso de los arrays: available (W, D, T) y demand_matrix (D, T)
+        con los ejes en el orden de workers, days y shifts.
+        """
+        availability = availability_to_dict(
+            [w.id for w in workers], days, shifts, available
+        )
+        demand = demand_to_dict(days, shifts, demand_matrix)
+        return cls(workers, availability, demand, days, shifts)
 
-    @property
-    def shifts(self):
-        # asumimos todos los días tienen todos los turnos cargados
-        d0 = self.days[0]
-        return list(sorted(self.demand[d0].keys()))
+
+def availability_to_dict(worker_ids, days, shifts, available):
+    """{worker_id: {day: {shift: 0}}} sólo con las celdas no disponibles."""
+    availability = {}
+    for i, j, k in zip(*np.nonzero(np.asarray(available) == 0)):
+        availability.setdefault(worker_ids[i], {}).setdefault(days[j], {})[
+            shifts[k]
+        ] = 0
+    return availability
+
+
+def demand_to_dict(days, shifts, demand_matrix):
+    """{day: {shift: min_workers}}"""
+    rows = np.asarray(demand_matrix).tolist()
+    return {d: dict(zip(shifts, row)) for d, row in zip(days, rows)}
+
+
+def as_request(schedule_request):
+    """
+    El mismo ScheduleRequest, o uno nuevo si es otro objeto con workers,
+    availability, demand, days y shifts (p. ej. los de los tests).
+    """
+    if hasattr(schedule_request, "demand_matrix"):
+        return schedule_request
+    return ScheduleRequest(
+        schedule_request.workers,
+        schedule_request.availability,
+        schedule_request.demand,
+        schedule_request.days,
+        schedule_request.shifts,
+    )
@@ -0,0 +1,189 @@
+# core/evaluate.py
+
+import numpy as np
+
+from scheduler.config.settings import TURN_HOURS
+from scheduler.core.domain import as_request
+from scheduler.core.matrix import VariableIndex, availability_array, demand_array
+from scheduler.core.restrictions import full_day
+from scheduler.core.solution import WEIGHTS, assignment_array
+
+# Reglas que el modelo no deja incumplir (no tienen peso propio en el
+# objetivo; max_hours sí lo tiene a través de viol_max)
+HARD_RULES = ("availability", "night_morning", "max_hours")
+
+
+class Evaluator:
+    """
+    Objetivo y violaciones de cualquier asignación x (W, D, T) sin
+    construir el modelo. Lo que sólo depende de la petición se prepara una
+    vez; breakdown() son unas pocas operaciones NumPy, para usarlo dentro
+    de la búsqueda local o al validar en vivo un horario editado a mano.
+
+    restrictions: con full_day.add_full_day_constraints_tight (como en
+    TIGHT_RESTRICTIONS) también se penaliza trabajar todos los turnos.
+    """
+
+    def __init__(self, schedule_request, restrictions=None, index=None):
+        self.request = as_request(schedule_request)
+        self.index = index or VariableIndex(self.request)
+        self.demand = demand_array(self.index, self.request)
+        self.available = availability_array(self.index, self.request) == 1
+        self.turn_hours = np.array([TURN_HOURS[t] for t in self.index.shifts])
+        self.max_hours = self.request.max_hours
+
+        T = len(self.index.shifts)
+        tight = restrictions and full_day.add_full_day_constraints_tight in restrictions
+        self.full_limit = T - 1 if tight else T
+        pos = {t: k for k, t in enumerate(self.index.shifts)}
+        self.pos = [pos.get(t) for t in (0, 1, 2, 3)]
+
+    def array(self, source):
+        """
+        x (W, D, T) a partir de las filas de load_schedule() o de un
+        resultado de solve_schedule; se ignoran trabajadores y días que ya
+        no están en la petición.
+        """
+        return assignment_array(source, self.request)
+
+    # -----------------------------------------
+    # Variables del modelo
+    # -----------------------------------------
+    def _shifts(self, x):
+        # turnos mañana, mediodía, tarde y noche (0 si no existen)
+        off = np.zeros(x.shape[:2], dtype=x.dtype)
+        return [off if k is None else x[:, :, k] for k in self.pos]
+
+    def families(self, x):
+        """
+        Valor de cada familia de variables (con las formas de VariableIndex)
+        para la asignación x, igual que las fijaría el solver.
+        """
+        x = np.asarray(x, dtype=int)
+        s0, s1, s2, s3 = self._shifts(x)
+        cover = x.sum(axis=0)
+        n = x.sum(axis=2)
+        work = (n > 0).astype(int)
+        free2 = 1 - np.maximum(work, np.roll(work, -1, axis=1))
+        return {
+            "x": x,
+            "deficit": np.maximum(0, self.demand - cover),
+            "y_full": np.maximum(0, n - self.full_limit),
+            "y_split_MT": np.maximum(0, s0 + s2 - s1 - 1),
+            "y_split_MN": np.maximum(0, s1 + s3 - s2 - 1),
+            "y_split_MnN": np.maximum(0, s0 + s3 - 1),
+            "z": (cover == 0).astype(int),
+            "work": work,
+            "free2": free2,
+            "viol_rest": (free2.sum(axis=1) == 0).astype(int),
+            "viol_max": (x.sum(axis=1) @ self.turn_hours > self.max_hours).astype(int),
+        }
+
+    def vector(self, x):
+        """Mismos valores que families(), como vector por columna de VariableIndex."""
+        values = np.zeros(self.index.n_cols)
+        for name, array in self.families(x).items():
+            values[getattr(self.index, name)] = array
+        return values
+
+    # -----------------------------------------
+    # Objetivo
+    # -----------------------------------------
+    def breakdown(self, x):
+        """
+        Contribución al objetivo de cada penalización (claves de WEIGHTS).
+        Mismo resultado que sumar families() pero sin construirlas.
+        """
+        x = np.asarray(x) != 0
+        s0, s1, s2, s3 = self._shifts(x)
+        cover = x.sum(axis=0)
+        n = x.sum(axis=2)
+        work = n > 0
+        rest_ok = (~(work | np.roll(work, -1, axis=1))).any(axis=1)
+        hours = x.sum(axis=1) @ self.turn_hours
+        counts = {
+            "cover": np.maximum(0, self.demand - cover).sum(),
+            "empty": np.count_nonzero(cover == 0),
+            "full": np.maximum(0, n - self.full_limit).sum(),
+            "split": np.count_nonzero(s0 & s2 & ~s1)
+            + np.count_nonzero(s1 & s3 & ~s2)
+            + np.count_nonzero(s0 & s3),
+            "rest": np.count_nonzero(~rest_ok),
+            "max_hours": np.count_nonzero(hours > self.max_hours),
+            "less": np.count_nonzero(x),
+        }
+        return {
+            name: float(weight * counts[name]) for name, (_, weight) in WEIGHTS.items()
+        }
+
+    def objective(self, x):
+        return sum(self.breakdown(x).values())
+
+    # -----------------------------------------
+    # Violaciones
+    # -----------------------------------------
+    def violations(self, x):
+        """
+        Lista de {rule, worker, day, shift, amount, penalty}: reglas duras
+        (HARD_RULES) y cada penalización del objetivo que se paga.
+        worker/day/shift son ids de la petición o None si no aplica.
+        """
+        x = np.asarray(x, dtype=int)
+        index = self.index
+        families = self.families(x)
+        hours = x.sum(axis=1) @ self.turn_hours
+        out = []
+
+        def add(rule, mask, axes, amount=1, penalty=0.0):
+            # amount y penalty: escalares o arrays con la forma de mask
+            amount = np.broadcast_to(amount, mask.shape)
+            penalty = np.broadcast_to(penalty, mask.shape)
+            for cell in zip(*np.nonzero(mask)):
+                keys = dict(zip(axes, cell))
+                out.append(
+                    {
+                        "rule": rule,
+                        "worker": _pick(index.worker_ids, keys.get("w")),
+                        "day": _pick(index.days, keys.get("d")),
+                        "shift": _pick(index.shifts, keys.get("t")),
+                        "amount": float(amount[cell]),
+                        "penalty": float(penalty[cell]),
+                    }
+                )
+
+        weights = {name: weight for name, (_, weight) in WEIGHTS.items()}
+
+        # duras
+        add("availability", (x == 1) & ~self.available, "wdt")
+        morning, night = self.pos[0], self.pos[3]
+        if morning is not None and night is not None:
+            clash = np.zeros(x.shape[:2], dtype=bool)
+            clash[:, :-1] = (x[:, :-1, night] == 1) & (x[:, 1:, morning] == 1)
+            add("night_morning", clash, "wd")
+        over = hours - self.max_hours
+        add("max_hours", over > 0, "w", over, weights["max_hours"])
+
+        # penalizaciones del objetivo
+        deficit = families["deficit"]
+        add("cover", deficit > 0, "dt", deficit, weights["cover"] * deficit)
+        add("empty", families["z"] == 1, "dt", penalty=weights["empty"])
+        add("full", families["y_full"] > 0, "wd", penalty=weights["full"])
+        for split in ("y_split_MT", "y_split_MN", "y_split_MnN"):
+            add(split, families[split] == 1, "wd", penalty=weights["split"])
+        add("rest", families["viol_rest"] == 1, "w", penalty=weights["rest"])
+        return out
+
+    def evaluate(self, x):
+        """objective, breakdown, violations y feasible (sin reglas duras)."""
+        breakdown = self.breakdown(x)
+        violations = self.violations(x)
+        return {
+            "objective": sum(breakdown.values()),
+            "breakdown": breakdown,
+            "violations": violations,
+            "feasible": not any(v["rule"] in HARD_RULES for v in violations),
+        }
+
+
+def _pick(values, position):
+    return None if position is None else values[position]
@@ -0,0 +1,199 @@
+# core/heuristic.py
+
+import numpy as np
+
+from scheduler.config.settings import P_COVER, P_EMPTY, P_LESS, P_REST, TURN_HOURS
+from scheduler.core.column_generation import day_patterns
+from scheduler.core.domain import as_request
+from scheduler.core.evaluate import Evaluator
+from scheduler.core.matrix import (
+    FAMILIES,
+    VariableIndex,
+    assign_values,
+    availability_array,
+    demand_array,
+)
+from scheduler.core.model import build_variables
+from scheduler.core.solution import ScheduleSolution
+from scheduler.core.stats import SolveStats
+
+TOLERANCE = 1e-9
+
+
+class LocalSearch:
+    """
+    Horario x (W, D, T) y el cambio de objetivo de cada movimiento, con los
+    mismos pesos P_* que set_objective:
+    - añadir (w, d, t) o quitarlo
+    - pasar (d, t) de un trabajador a otro (la cobertura no cambia)
+    Nunca se incumplen disponibilidad, noche→mañana ni max_hours.
+    """
+
+    def __init__(self, index, schedule_request, x=None):
+        schedule_request = as_request(schedule_request)
+        self.available = availability_array(index, schedule_request) == 1
+        self.demand = demand_array(index, schedule_request)
+        self.turn_hours = np.array([TURN_HOURS[t] for t in index.shifts])
+        self.max_hours = schedule_request.max_hours
+        self.bits, _, self.base = day_patterns(index.shifts)
+        self.weights = 1 << np.arange(len(index.shifts))
+        pos = {t: k for k, t in enumerate(index.shifts)}
+        self.morning, self.night = pos.get(0), pos.get(3)
+        self.x = np.zeros(index.x.shape, dtype=int) if x is None else x.astype(int)
+
+    # -----------------------------------------
+    # Parte de cada trabajador
+    # -----------------------------------------
+    def _rest_state(self):
+        free = self.x.sum(axis=2) == 0
+        free2 = free & np.roll(free, -1, axis=1)  # (d, d+1), modular
+        return free, free2, free2.sum(axis=1)
+
+    def add_delta(self):
+        """Cambio por añadir cada (w, d, t); inf si no se puede."""
+        x = self.x
+        sub = x @ self.weights
+        day = self.base[sub[:, :, None] | self.weights] - self.base[sub][:, :, None]
+
+        free, free2, pairs = self._rest_state()
+        free2 = free2.astype(int)
+        lost = free * (free2 + np.roll(free2, 1, axis=1))
+        rest = P_REST * ((pairs[:, None] - lost <= 0) & (pairs[:, None] > 0))
+
+        hours = x.sum(axis=1) @ self.turn_hours
+        ok = self.available & (x == 0)
+        ok &= (hours[:, None] + self.turn_hours <= self.max_hours[:, None])[:, None]
+        if self.morning is not None and self.night is not None:
+            ok[:, 1:, self.morning] &= x[:, :-1, self.night] == 0
+            ok[:, :-1, self.night] &= x[:, 1:, self.morning] == 0
+        return np.where(ok, day + rest[:, :, None], np.inf)
+
+    def remove_delta(self):
+        """Cambio por quitar cada (w, d, t) asignado; inf si no lo está."""
+        x = self.x
+        sub = x @ self.weights
+        day = self.base[sub[:, :, None] & ~self.weights] - self.base[sub][:, :, None]
+
+        free, _, pairs = self._rest_state()
+        if x.shape[1] == 1:
+            gained = np.ones(free.shape, dtype=int)
+        else:
+            gained = np.roll(free, 1, axis=1) + np.roll(free, -1, axis=1)
+        frees_day = x.sum(axis=2) == 1
+        rest = -P_REST * ((pairs[:, None] == 0) & (gained > 0) & frees_day)
+        return np.where(x == 1, day + rest[:, :, None], np.inf)
+
+    # -----------------------------------------
+    # Cobertura
+    # -----------------------------------------
+    def cover_delta(self):
+        """(añadir, quitar) un trabajador en cada (d, t)."""
+        cover = self.x.sum(axis=0)
+        add = -P_COVER * (cover < self.demand) - P_EMPTY * (cover == 0)
+        remove = P_COVER * (cover <= self.demand) + P_EMPTY * (cover == 1)
+        return add, remove
+
+    # -----------------------------------------
+    # Búsqueda
+    # -----------------------------------------
+    def best_move(self):
+        """(cambio, [(w, d, t, valor)]) del mejor movimiento."""
+        add, remove = self.add_delta(), self.remove_delta()
+        cover_add, cover_remove = self.cover_delta()
+
+        moves = []
+        total = add + cover_add
+        w, d, t = np.unravel_index(np.argmin(total), total.shape)
+        moves.append((total[w, d, t], [(w, d, t, 1)]))
+
+        total = remove + cover_remove
+        w, d, t = np.unravel_index(np.argmin(total), total.shape)
+        moves.append((total[w, d, t], [(w, d, t, 0)]))
+
+        # traspaso: mejor a quien quitar y mejor a quien dar en cada celda
+        giver, taker = remove.argmin(axis=0), add.argmin(axis=0)
+        total = remove.min(axis=0) + add.min(axis=0)
+        d, t = np.unravel_index(np.argmin(total), total.shape)
+        moves.append((total[d, t], [(giver[d, t], d, t, 0), (taker[d, t], d, t, 1)]))
+        return min(moves, key=lambda m: m[0])
+
+    def run(self, max_moves=None):
+        """Aplica el mejor movimiento mientras mejore; devuelve cuántos."""
+        moves = 0
+        while max_moves is None or moves < max_moves:
+            delta, changes = self.best_move()
+            if not delta < -TOLERANCE:
+                break
+            for w, d, t, v in changes:
+                self.x[w, d, t] = v
+            moves += 1
+        return moves
+
+
+def greedy_schedule(index, schedule_request):
+    """
+    Construcción voraz: recorre los turnos por orden y cubre demand[d][t]
+    (al menos 1 para no dejarlo vacío) con los trabajadores disponibles que
+    más horas libres tienen, sin noche→mañana ni turnos partidos.
+    """
+    search = LocalSearch(index, schedule_request)
+    W, D, T = index.x.shape
+    for d in range(D):
+        for t in range(T):
+            need = max(int(search.demand[d, t]), 1)
+            feasible = np.isfinite(search.add_delta()[:, d, t])
+            # sin turno partido: sólo cambia el -P_LESS del turno
+            sub = search.x[:, d] @ search.weights
+            split_free = np.isclose(
+                search.base[sub | search.weights[t]] - search.base[sub], -P_LESS
+            )
+            candidates = np.flatnonzero(feasible & split_free)
+            left = search.max_hours - search.x.sum(axis=1) @ search.turn_hours
+            ranked = candidates[np.argsort(-left[candidates], kind="stable")]
+            search.x[ranked[:need], d, t] = 1
+    return search.x
+
+
+def solve_heuristic(schedule_request, local_search=True, max_moves=None, compact=False):
+    """
+    Horario en milisegundos sin MIP: greedy_schedule y después búsqueda
+    local (LocalSearch) hasta que ningún movimiento mejora el objetivo.
+    Sirve como borrador rápido o como warm_start de solve_schedule.
+
+    Devuelve lo mismo que solve_schedule, con status "Heuristic" (hay
+    solución entera pero sin cota: no se sabe a qué distancia está del
+    óptimo), más "moves", los movimientos de la búsqueda local.
+    """
+    stats = SolveStats()
+    with stats.phase("build_variables"):
+        index = VariableIndex(schedule_request)
+    with stats.phase("greedy"):
+        x = greedy_schedule(index, schedule_request)
+    moves = 0
+    if local_search:
+        with stats.phase("local_search"):
+            search = LocalSearch(index, schedule_request, x)
+            moves = search.run(max_moves)
+            x = search.x
+    with stats.phase("extract"):
+        evaluator = Evaluator(schedule_request, index=index)
+        values = evaluator.vector(x)
+        objective = evaluator.objective(x)
+    stats.size = {"variables": index.n_cols}
+
+    if compact:
+        solution = ScheduleSolution.from_vector("Heuristic", objective, index, values)
+        solution.stats = stats.as_dict()
+        solution.moves = moves
+        return solution
+
+    variables = build_variables(schedule_request)
+    assign_values(variables, index, values)
+    return {
+        "status": "Heuristic",
+        "model": None,
+        "variables": dict(zip(FAMILIES, variables)),
+        "objective": objective,
+        "moves": moves,
+        "stats": stats.as_dict(),
+    }
@@ -0,0 +1,240 @@
+# core/lazy.py
+
+import numpy as np
+from pulp import LpAffineExpression, LpStatus, value
+from scipy.sparse import vstack
+
+from scheduler.core.backends import SolverOptions, get_engine, pulp_solver
+from scheduler.core.matrix import FAMILIES, VariableIndex, assign_values
+from scheduler.core.model import build_variables, create_model
+from scheduler.core.objective import objective_vector, set_objective
+from scheduler.core.presolve import PresolvedModel, feasible_cells
+from scheduler.core.restrictions import rest, split_shifts
+from scheduler.core.restrictions_manager import (
+    ACTIVE_RESTRICTIONS,
+    apply_restrictions,
+    build_matrix,
+)
+from scheduler.core.solution import ScheduleSolution
+from scheduler.core.stats import SolveStats
+from scheduler.core.warm_start import set_initial_values, start_values, start_vector
+
+# Filas que se dejan fuera y se añaden sólo si se violan. En las instancias
+# de bench_lazy (10-40 trabajadores) acaban añadiéndose el 75-95% y el modo
+# perezoso es más lento que el modelo completo (ver solve_lazy); sólo
+# compensa si en el óptimo quedan pocas activas.
+LAZY_RESTRICTIONS = [
+    rest.add_rest_constraints,
+    split_shifts.add_split_shift_constraints,
+]
+
+TOLERANCE = 1e-6
+
+
+def violated_rows(A, lb, ub, values):
+    """Índices de las filas de A con lb <= A v <= ub incumplida."""
+    activity = A @ values
+    return np.flatnonzero((activity > ub + TOLERANCE) | (activity < lb - TOLERANCE))
+
+
+def row_cells(index, A):
+    """(trabajador, día) de cada fila por su primera x, como posiciones."""
+    W, D, T = index.x.shape
+    first = np.full(A.shape[0], -1)
+    for r in range(A.shape[0]):
+        cols = A.indices[A.indptr[r] : A.indptr[r + 1]]
+        x_cols = cols[cols < index.x.size]
+        if len(x_cols):
+            first[r] = x_cols.min() - index.x.flat[0]
+    return first // (D * T), (first % (D * T)) // T
+
+
+def column_variables(index, variables):
+    """LpVariable de cada columna de index (None si la x no se creó)."""
+    columns = [None] * index.n_cols
+    for name, family in zip(FAMILIES, variables):
+        keys = index.keys(name)
+        if getattr(index, name).ndim == 1:
+            keys = [k[0] for k in keys]
+        for col, key in zip(getattr(index, name).ravel(), keys):
+            columns[col] = family.get(key)
+    return columns
+
+
+def _add_rows(model, columns, A, lb, ub, rows):
+    # las x que no existen están fijadas a 0 y se omiten
+    for r in rows:
+        start, end = A.indptr[r], A.indptr[r + 1]
+        expr = LpAffineExpression(
+            (columns[j], a)
+            for j, a in zip(A.indices[start:end], A.data[start:end])
+            if columns[j] is not None
+        )
+        if np.isfinite(ub[r]):
+            model += expr <= ub[r]
+        if np.isfinite(lb[r]):
+            model += expr >= lb[r]
+
+
+def solve_lazy(
+    schedule_request,
+    restrictions=None,
+    lazy=None,
+    backend="pulp",
+    engine="scipy",
+    options=None,
+    max_rounds=20,
+    neighborhood=1,
+    warm_start=False,
+    presolve=True,
+    compact=False,
+    on_round=None,
+):
+    """
+    Generación perezosa de filas: resuelve sin las restricciones de `lazy`
+    (por defecto descanso noche→mañana y turnos partidos), comprueba la
+    solución contra todas sus filas, añade las violadas y vuelve a
+    resolver.
+    Termina cuando no hay violaciones, así que el resultado es el mismo que
+    con el modelo completo. Si se agotan max_rounds se añaden todas las filas
+    pendientes y se resuelve una última vez (max_rounds >= 1).
+
+    Es opcional: solve_schedule, ScheduleSession y la interfaz resuelven el
+    modelo completo. En bench_lazy (perfil flat, 7 días, gap exacto) estas
+    filas están casi todas activas en el óptimo y el modo perezoso es más
+    lento; con neighborhood=0 se añaden menos filas pero hacen falta más
+    rondas y es peor aún:
+        trabajadores  completo  vecinos 1        vecinos 0
+        10            2.2 s     3.1 s (254/270)  10.5 s (214/270)
+        20            5.1 s     12.1 s (515/540) 16.8 s (425/540)
+        40            10.8 s    63.9 s (1030/1080) 86.1 s (818/1080)
+
+    backend: "pulp" (CBC con MIP start) o "matrix" con `engine` (el MIP
+    start sólo lo aprovechan highspy y ortools).
+    neighborhood: con cada fila violada se añaden las del mismo trabajador
+    a esa distancia en días (0 = sólo las violadas).
+    warm_start: arrancar cada ronda desde la solución anterior reparada
+    (start_values). Desactivado por defecto: con CBC el MIP start hizo más
+    lentas las rondas en bench_lazy.
+    on_round(ronda, filas_añadidas, objetivo) al terminar cada ronda.
+
+    Devuelve lo mismo que solve_schedule más "rounds" y "lazy_rows" (filas
+    perezosas añadidas frente al total).
+    """
+    if max_rounds < 1:
+        raise ValueError(f"max_rounds debe ser al menos 1: {max_rounds}")
+    restrictions = restrictions or ACTIVE_RESTRICTIONS
+    lazy = LAZY_RESTRICTIONS if lazy is None else lazy
+    core = [r for r in restrictions if r not in lazy]
+    lazy = [r for r in restrictions if r in lazy]
+    options = options or SolverOptions()
+    stats = SolveStats()
+
+    with stats.phase("build_variables"):
+        index = VariableIndex(schedule_request)
+    # todas las filas perezosas, para comprobar violaciones en bloque
+    with stats.phase("build_lazy"):
+        A_lazy, lb_lazy, ub_lazy = build_matrix(index, schedule_request, lazy)
+        row_worker, row_day = row_cells(index, A_lazy)
+    added = np.zeros(A_lazy.shape[0], dtype=bool)
+
+    if backend == "pulp":
+        with stats.phase("build_model"):
+            cells = feasible_cells(schedule_request) if presolve else None
+            model, variables = create_model(schedule_request, cells)
+            target = PresolvedModel(model) if presolve else model
+            apply_restrictions(target, variables, schedule_request, core)
+            set_objective(model, variables, schedule_request)
+            columns = column_variables(index, variables)
+        solver = pulp_solver(options)
+    elif backend == "matrix":
+        with stats.phase("build_model"):
+            c = objective_vector(index, schedule_request)
+            A_core, lb_core, ub_core = build_matrix(index, schedule_request, core)
+        solve_engine = get_engine(engine)
+    else:
+        raise ValueError(f"Backend no soportado en modo perezoso: {backend}")
+
+    rounds = []
+    start = None
+    for round_number in range(max_rounds + 1):
+        with stats.phase("solve"):
+            if backend == "pulp":
+                if start is not None:
+                    set_initial_values(variables, start)
+                    solver.optionsDict["warmStart"] = True
+                model.solve(solver)
+                status = LpStatus[model.status]
+                objective = value(model.objective)
+                values = np.array(
+                    [0.0 if v is None else v.value() or 0.0 for v in columns]
+                )
+            else:
+                A = vstack([A_core, A_lazy[added]], format="csr")
+                lb = np.concatenate([lb_core, lb_lazy[added]])
+                ub = np.concatenate([ub_core, ub_lazy[added]])
+                status, values, objective = solve_engine(
+                    c,
+                    index,
+                    A,
+                    lb,
+                    ub,
+                    options,
+                    start=None if start is None else start_vector(index, start),
+                )
+
+        with stats.phase("separate"):
+            violated = violated_rows(A_lazy, lb_lazy, ub_lazy, values)
+            # también las filas del mismo trabajador en los días vecinos: si
+            # sólo se añaden las violadas, el solver mueve el conflicto al
+            # día de al lado y hacen falta más rondas
+            near = np.zeros(A_lazy.shape[0], dtype=bool)
+            for shift in range(-neighborhood, neighborhood + 1):
+                cells = set(zip(row_worker[violated], row_day[violated] + shift))
+                near |= [cell in cells for cell in zip(row_worker, row_day)]
+            new = np.flatnonzero(near & ~added)
+            if round_number == max_rounds - 1 and len(new):
+                # última oportunidad: todas las pendientes
+                new = np.flatnonzero(~added)
+        rounds.append({"rows": len(new), "objective": objective, "status": status})
+        if on_round is not None:
+            on_round(round_number, len(new), objective)
+        if status != "Optimal" or not len(new):
+            break
+
+        with stats.phase("add_rows"):
+            added[new] = True
+            if backend == "pulp":
+                _add_rows(model, columns, A_lazy, lb_lazy, ub_lazy, new)
+        if warm_start:
+            with stats.phase("warm_start"):
+                current = ScheduleSolution.from_vector(status, objective, index, values)
+                start = start_values(current, schedule_request, restrictions)
+
+    stats.size = {
+        "variables": index.n_cols,
+        "lazy_rows": int(added.sum()),
+        "lazy_total": A_lazy.shape[0],
+    }
+
+    if compact:
+        with stats.phase("extract"):
+            solution = ScheduleSolution.from_vector(status, objective, index, values)
+        solution.stats = stats.as_dict()
+        solution.rounds = rounds
+        return solution
+
+    if backend == "matrix":
+        model = None
+        with stats.phase("extract"):
+            variables = build_variables(schedule_request)
+            assign_values(variables, index, values)
+    return {
+        "status": status,
+        "model": model,
+        "variables": dict(zip(FAMILIES, variables)),
+        "objective": objective,
+        "rounds": rounds,
+        "lazy_rows": (int(added.sum()), A_lazy.shape[0]),
+        "stats": stats.as_dict(),
+    }
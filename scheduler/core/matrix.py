@@ -0,0 +1,193 @@
+# core/matrix.py
+
+from itertools import product
+
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, milp
+from scipy.sparse import coo_matrix, vstack
+
+from scheduler.core.domain import as_request
+
+# Mismo orden que la tupla devuelta por build_variables
+FAMILIES = (
+    "x",
+    "deficit",
+    "y_full",
+    "y_split_MT",
+    "y_split_MN",
+    "y_split_MnN",
+    "z",
+    "work",
+    "free2",
+    "viol_rest",
+    "viol_max",
+)
+
+CONTINUOUS = ("deficit",)
+
+# Prefijo del nombre de la LpVariable cuando no coincide con la familia
+NAME_PREFIX = {"z": "empty"}
+
+
+class VariableIndex:
+    """
+    Numeración contigua de las columnas del modelo, familia a familia.
+    Cada familia es un array de índices con la forma natural de sus claves:
+    - x: (workers, days, shifts)
+    - deficit, z: (days, shifts)
+    - y_*, work, free2: (workers, days)
+    - viol_*: (workers,)
+    """
+
+    def __init__(self, schedule_request):
+        self.worker_ids = [w.id for w in schedule_request.workers]
+        self.days = list(schedule_request.days)
+        self.shifts = list(schedule_request.shifts)
+
+        W, D, T = len(self.worker_ids), len(self.days), len(self.shifts)
+        shapes = {
+            "x": (W, D, T),
+            "deficit": (D, T),
+            "z": (D, T),
+            "viol_rest": (W,),
+            "viol_max": (W,),
+        }
+
+        offset = 0
+        for name in FAMILIES:
+            shape = shapes.get(name, (W, D))
+            size = int(np.prod(shape))
+            setattr(self, name, np.arange(offset, offset + size).reshape(shape))
+            offset += size
+        self.n_cols = offset
+
+    def keys(self, name):
+        """Claves de la familia en el mismo orden que sus columnas."""
+        ndim = getattr(self, name).ndim
+        if ndim == 3:
+            return list(product(self.worker_ids, self.days, self.shifts))
+        if name in ("deficit", "z"):
+            return list(product(self.days, self.shifts))
+        if ndim == 2:
+            return list(product(self.worker_ids, self.days))
+        return [(wid,) for wid in self.worker_ids]
+
+    def names(self):
+        """Nombres de las LpVariable de build_variables, por columna."""
+        names = []
+        for name in FAMILIES:
+            prefix = NAME_PREFIX.get(name, name)
+            names.extend(
+                prefix + "_" + "_".join(str(k) for k in key) for key in self.keys(name)
+            )
+        return names
+
+    def shift_pos(self, t):
+        # posición del turno t en el eje de turnos
+        return self.shifts.index(t)
+
+    def integrality(self):
+        integrality = np.ones(self.n_cols, dtype=np.uint8)
+        for name in CONTINUOUS:
+            integrality[getattr(self, name).ravel()] = 0
+        return integrality
+
+    def bounds(self):
+        lb = np.zeros(self.n_cols)
+        ub = np.ones(self.n_cols)
+        for name in CONTINUOUS:
+            ub[getattr(self, name).ravel()] = np.inf
+        return lb, ub
+
+
+def availability_array(index, schedule_request):
+    """a[w, d, t] como array (1 = disponible), en el orden de index."""
+    return as_request(schedule_request).available.astype(float)
+
+
+def demand_array(index, schedule_request):
+    return as_request(schedule_request).demand_matrix.astype(float)
+
+
+def build_block(n_rows, n_cols, entries, lb, ub):
+    """
+    Ensambla un bloque de restricciones lb <= A @ v <= ub en formato CSR.
+    entries: lista de (rows, cols, coef) con arrays del mismo tamaño
+    (coef puede ser escalar).
+    """
+    rows, cols, vals = [], [], []
+    for r, c, v in entries:
+        c = np.asarray(c)
+        rows.append(np.broadcast_to(r, c.shape).ravel())
+        cols.append(c.ravel())
+        vals.append(np.broadcast_to(np.asarray(v, dtype=float), c.shape).ravel())
+
+    A = coo_matrix(
+        (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(n_rows, n_cols),
+    ).tocsr()
+    lb = np.broadcast_to(np.asarray(lb, dtype=float), (n_rows,))
+    ub = np.broadcast_to(np.asarray(ub, dtype=float), (n_rows,))
+    return A, lb, ub
+
+
+def stack_blocks(blocks, n_cols):
+    if not blocks:
+        return coo_matrix((0, n_cols)).tocsr(), np.zeros(0), np.zeros(0)
+    A = vstack([b[0] for b in blocks], format="csr")
+    lb = np.concatenate([b[1] for b in blocks])
+    ub = np.concatenate([b[2] for b in blocks])
+    return A, lb, ub
+
+
+def solve_matrix(
+    c, index, A, row_lb, row_ub, time_limit=None, gap=None, node_limit=None
+):
+    """
+    Resuelve min c·v s.a. row_lb <= A v <= row_ub con HiGHS (scipy.optimize.milp),
+    pasando la matriz CSR directamente, sin fichero intermedio.
+    Devuelve (status, valores, objetivo) con status al estilo de LpStatus.
+    """
+    lb, ub = index.bounds()
+    options = {"disp": False}
+    if time_limit is not None:
+        options["time_limit"] = time_limit
+    if gap is not None:
+        options["mip_rel_gap"] = gap
+    if node_limit is not None:
+        options["node_limit"] = node_limit
+
+    res = milp(
+        c,
+        integrality=index.integrality(),
+        bounds=Bounds(lb, ub),
+        constraints=LinearConstraint(A, row_lb, row_ub) if A.shape[0] else None,
+        options=options,
+    )
+
+    # Igual que PULP_CBC_CMD: si para por tiempo con solución entera, "Optimal"
+    if res.x is not None and res.status in (0, 1):
+        status = "Optimal"
+    elif res.status == 2:
+        status = "Infeasible"
+    elif res.status == 3:
+        status = "Unbounded"
+    else:
+        status = "Not Solved"
+
+    if res.x is None:
+        return status, np.zeros(index.n_cols), None
+
+    # redondear binarios (HiGHS devuelve 0.9999999...)
+    integrality = index.integrality().astype(bool)
+    values = np.where(integrality, np.round(res.x), res.x)
+    return status, values, res.fun
+
+
+def assign_values(variables, index, values):
+    """Vuelca el vector solución sobre las LpVariable de build_variables."""
+    for name, family in zip(FAMILIES, variables):
+        cols = getattr(index, name).ravel()
+        # build_variables recorre las claves en el mismo orden que los índices
+        for var, val in zip(family.values(), values[cols]):
+            var.varValue = float(val)
@@ -3,77 +3,100 @@
 from pulp import LpBinary, LpContinuous, LpProblem, LpVariable
 
 
-def build_variables(schedule_request):
-    workers = schedule_request.workers
-    days = schedule_request.days
-    shifts = schedule_request.shifts
-
-    # Decision variables
+def build_worker_variables(w, days, shifts, cells=None):
+    """
+    Variables propias de un trabajador (su bloque de columnas).
+    cells: si se indica, sólo se crean las x de esas celdas (w, d, t).
+    """
     x = {
         (w.id, d, t): LpVariable(f"x_{w.id}_{d}_{t}", cat=LpBinary)
-        for w in workers
         for d in days
         for t in shifts
+        if cells is None or (w.id, d, t) in cells
     }
 
-    # Slack variables
-    deficit = {
-        (d, t): LpVariable(f"deficit_{d}_{t}", lowBound=0, cat=LpContinuous)
-        for d in days
-        for t in shifts
-    }
-
-    y_full = {
-        (w.id, d): LpVariable(f"y_full_{w.id}_{d}", cat=LpBinary)
-        for w in workers
-        for d in days
-    }
+    y_full = {(w.id, d): LpVariable(f"y_full_{w.id}_{d}", cat=LpBinary) for d in days}
 
     y_split_MT = {
-        (w.id, d): LpVariable(f"y_split_MT_{w.id}_{d}", cat=LpBinary)
-        for w in workers
-        for d in days
+        (w.id, d): LpVariable(f"y_split_MT_{w.id}_{d}", cat=LpBinary) for d in days
     }
 
     y_split_MN = {
-        (w.id, d): LpVariable(f"y_split_MN_{w.id}_{d}", cat=LpBinary)
-        for w in workers
-        for d in days
+        (w.id, d): LpVariable(f"y_split_MN_{w.id}_{d}", cat=LpBinary) for d in days
     }
 
     y_split_MnN = {
-        (w.id, d): LpVariable(f"y_split_MnN_{w.id}_{d}", cat=LpBinary)
-        for w in workers
-        for d in days
-    }
-
-    z = {  # Indica si un turno está vacío
-        (d, t): LpVariable(f"empty_{d}_{t}", cat=LpBinary) for d in days for t in shifts
+        (w.id, d): LpVariable(f"y_split_MnN_{w.id}_{d}", cat=LpBinary) for d in days
     }
 
     work = {  # Indica si un trabajador trabaja ese día
         (w.id, d): LpVariable(f"work_{w.id}_{d}", lowBound=0, upBound=1, cat=LpBinary)
-        for w in workers
         for d in days
     }
 
     free2 = {  # Ventana de 2 días libres
         (w.id, d): LpVariable(f"free2_{w.id}_{d}", lowBound=0, upBound=1, cat=LpBinary)
-        for w in workers
         for d in days
     }
 
     viol_rest = {  # Violación de descanso mínimo
         w.id: LpVariable(f"viol_rest_{w.id}", lowBound=0, upBound=1, cat=LpBinary)
-        for w in workers
     }
 
     viol_max = {
         w.id: LpVariable(f"viol_max_{w.id}", lowBound=0, upBound=1, cat=LpBinary)
-        for w in workers
+    }
+
+    return (
+        x,
+        y_full,
+        y_split_MT,
+        y_split_MN,
+        y_split_MnN,
+        work,
+        free2,
+        viol_rest,
+        viol_max,
+    )
+
+
+def build_variables(schedule_request, cells=None):
+    workers = schedule_request.workers
+    days = schedule_request.days
+    shifts = schedule_request.shifts
+
+    # Slack variables
+    deficit = {
+        (d, t): LpVariable(f"deficit_{d}_{t}", lowBound=0, cat=LpContinuous)
+        for d in days
+        for t in shifts
+    }
+
+    z = {  # Indica si un turno está vacío
+        (d, t): LpVariable(f"empty_{d}_{t}", cat=LpBinary) for d in days for t in shifts
     }
     # z = LpVariable.dicts("empty", (days, shifts), cat="Binary")
 
+    # Decision variables y variables por trabajador
+    x, y_full, y_split_MT, y_split_MN, y_split_MnN = {}, {}, {}, {}, {}
+    work, free2, viol_rest, viol_max = {}, {}, {}, {}
+    per_worker = (
+        x,
+        y_full,
+        y_split_MT,
+        y_split_MN,
+        y_split_MnN,
+        work,
+        free2,
+        viol_rest,
+        viol_max,
+    )
+    for w in workers:
+        for family, block in zip(
+            per_worker, build_worker_variables(w, days, shifts, cells)
+        ):
+            family.update(block)
+
     return (
         x,
         deficit,
@@ -89,7 +112,7 @@ def build_variables(schedule_request):
     )
 
 
-def create_model(schedule_request):
+def create_model(schedule_request, cells=None):
     model = LpProblem("Horario_Camareros_Soft")
-    variables = build_variables(schedule_request)
+    variables = build_variables(schedule_request, cells)
     return model, variables
@@ -1,5 +1,6 @@
 # core/objective.py
 
+import numpy as np
 from pulp import lpSum
 
 from scheduler.config.settings import (
@@ -59,7 +60,24 @@ def set_objective(
 
     # Maximizar número de horas trabajadas (minimizar diferencia de x)
     obj += lpSum(
-        -1 * P_LESS * x[(w.id, d, t)] for w in workers for d in days for t in shifts
+        -1 * P_LESS * x.get((w.id, d, t), 0)
+        for w in workers
+        for d in days
+        for t in shifts
     )
 
     model += obj
+
+
+def objective_vector(index, schedule_request):
+    """Mismo objetivo que set_objective, como vector de costes por columna."""
+    c = np.zeros(index.n_cols)
+    c[index.deficit.ravel()] = P_COVER
+    c[index.z.ravel()] = P_EMPTY
+    c[index.y_full.ravel()] = P_FULL
+    for y in (index.y_split_MT, index.y_split_MN, index.y_split_MnN):
+        c[y.ravel()] = P_SPLIT
+    c[index.viol_rest] = P_REST
+    c[index.viol_max] = P_MAX_HOURS
+    c[index.x.ravel()] = -1 * P_LESS
+    return c
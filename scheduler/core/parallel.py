@@ -0,0 +1,31 @@
+# core/parallel.py
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from scheduler.core.solve import solve_schedule
+
+
+def _solve_one(key, schedule_request, kwargs):
+    # se ejecuta en el proceso hijo: construye, resuelve y devuelve sólo arrays
+    return key, solve_schedule(schedule_request, compact=True, **kwargs)
+
+
+def solve_many(requests, max_workers=None, **kwargs):
+    """
+    Resuelve varios ScheduleRequest independientes (p. ej. un local cada uno)
+    en un ProcessPoolExecutor.
+
+    requests: dict {clave: ScheduleRequest} o lista (la clave es la posición).
+    kwargs: se pasan a solve_schedule (backend, restrictions, warm_start...).
+    Genera (clave, ScheduleSolution) a medida que termina cada uno.
+    """
+    if not isinstance(requests, dict):
+        requests = dict(enumerate(requests))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_solve_one, key, request, kwargs)
+            for key, request in requests.items()
+        ]
+        for future in as_completed(futures):
+            yield future.result()
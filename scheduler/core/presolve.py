@@ -0,0 +1,118 @@
+# core/presolve.py
+
+import math
+import time
+
+import numpy as np
+from pulp import LpConstraint, LpConstraintGE, LpConstraintLE
+
+from scheduler.core.domain import as_request
+
+from scheduler.core.model import create_model
+from scheduler.core.objective import set_objective
+from scheduler.core.restrictions_manager import apply_restrictions
+
+
+def feasible_cells(schedule_request):
+    """
+    Celdas (w, d, t) en las que el trabajador está disponible. Las demás x
+    están fijadas a 0 y no se crean: las restricciones usan x.get(..., 0)
+    y el cero queda plegado en cobertura, día completo, partidos y descanso.
+    """
+    request = as_request(schedule_request)
+    i, j, k = np.nonzero(request.available)
+    return set(
+        zip(
+            np.array(request.worker_ids)[i].tolist(),
+            np.array(request.days)[j].tolist(),
+            np.array(request.shifts)[k].tolist(),
+        )
+    )
+
+
+def _activity_bounds(constraint):
+    # mínimo y máximo de expr + constante según las cotas de las variables
+    low = high = constraint.constant
+    for var, coef in constraint.items():
+        lb = -math.inf if var.lowBound is None else var.lowBound
+        ub = math.inf if var.upBound is None else var.upBound
+        if coef >= 0:
+            low += coef * lb
+            high += coef * ub
+        else:
+            low += coef * ub
+            high += coef * lb
+    return low, high
+
+
+def is_redundant(constraint):
+    """La fila se cumple para cualquier valor dentro de las cotas."""
+    low, high = _activity_bounds(constraint)
+    if constraint.sense == LpConstraintLE:
+        return high <= 0
+    if constraint.sense == LpConstraintGE:
+        return low >= 0
+    return low == high == 0
+
+
+class PresolvedModel:
+    """
+    Hace de `model` para las restricciones y descarta las filas que ya se
+    cumplen trivialmente (p. ej. x <= 1, o filas que sólo tenían x fijadas a 0).
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.kept = 0
+        self.dropped = 0
+
+    def __iadd__(self, other):
+        constraint = other[0] if isinstance(other, tuple) else other
+        if constraint is True or (
+            isinstance(constraint, LpConstraint) and is_redundant(constraint)
+        ):
+            self.dropped += 1
+            return self
+        self.model += other
+        self.kept += 1
+        return self
+
+
+def build_presolved(schedule_request, restrictions=None):
+    """Modelo PuLP completo sólo con las x factibles y sin filas triviales."""
+    cells = feasible_cells(schedule_request)
+    model, variables = create_model(schedule_request, cells)
+    presolved = PresolvedModel(model)
+    apply_restrictions(presolved, variables, schedule_request, restrictions)
+    set_objective(model, variables, schedule_request)
+    return model, variables
+
+
+def presolve_report(schedule_request, restrictions=None):
+    """
+    Construye el modelo con y sin presolve y compara variables, filas y
+    tiempo de construcción.
+    """
+    start = time.perf_counter()
+    model, variables = create_model(schedule_request)
+    apply_restrictions(model, variables, schedule_request, restrictions)
+    set_objective(model, variables, schedule_request)
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reduced, reduced_variables = build_presolved(schedule_request, restrictions)
+    reduced_time = time.perf_counter() - start
+
+    return {
+        "variables": (
+            sum(len(f) for f in variables),
+            sum(len(f) for f in reduced_variables),
+        ),
+        "x": (len(variables[0]), len(reduced_variables[0])),
+        "rows": (len(model.constraints), len(reduced.constraints)),
+        "nonzeros": (
+            sum(len(c) for c in model.constraints.values()),
+            sum(len(c) for c in reduced.constraints.values()),
+        ),
+        "build_time": (full_time, reduced_time),
+    }
@@ -1,5 +1,10 @@
 # core/restrictions/availability.py
 
+import numpy as np
+
+from scheduler.core.domain import as_request
+from scheduler.core.matrix import availability_array, build_block
+
 
 def add_availability_constraints(model, variables, schedule_request):
     (
@@ -15,20 +20,28 @@ def add_availability_constraints(model, variables, schedule_request):
         viol_rest,
         viol_max,
     ) = variables
-    av = schedule_request.availability
-    workers = schedule_request.workers
-    days = schedule_request.days
-    shifts = schedule_request.shifts
+    request = as_request(schedule_request)
+    a = request.available.tolist()
+
+    for i, wid in enumerate(request.worker_ids):
+        for j, d in enumerate(request.days):
+            for k, t in enumerate(request.shifts):
+                model += x.get((wid, d, t), 0) <= a[i][j][k]
 
-    for w in workers:
-        for d in days:
-            for t in shifts:
-                # default = available
-                available = 1
 
-                if w.id in av and d in av[w.id] and t in av[w.id][d]:
-                    available = av[w.id][d][t]  # = 0
+def availability_block(index, schedule_request):
+    # x[w,d,t] <= a[w][d][t]
+    n = index.x.size
+    return build_block(
+        n,
+        index.n_cols,
+        [(np.arange(n).reshape(index.x.shape), index.x, 1.0)],
+        -np.inf,
+        availability_array(index, schedule_request).ravel(),
+    )
 
-                model += x[(w.id, d, t)] <= available
 
-                # a[str(w.id)][str(d)][str(t)]
+def availability_rows(index, schedule_request):
+    a = availability_array(index, schedule_request)
+    for col, available in zip(index.x.ravel().tolist(), a.ravel().tolist()):
+        yield "L", [col], [1.0], available
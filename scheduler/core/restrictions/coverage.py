@@ -1,7 +1,11 @@
 # core/restrictions/coverage.py
 
+import numpy as np
 from pulp import lpSum
 
+from scheduler.core.domain import as_request
+from scheduler.core.matrix import build_block, demand_array
+
 
 def add_coverage_constraints(model, variables, schedule_request):
     (
@@ -17,15 +21,15 @@ def add_coverage_constraints(model, variables, schedule_request):
         viol_rest,
         viol_max,
     ) = variables
-    workers = schedule_request.workers
-    m = schedule_request.demand
-    days = schedule_request.days
-    shifts = schedule_request.shifts
+    request = as_request(schedule_request)
+    workers = request.workers
+    m = request.demand_matrix.tolist()
 
-    for d in days:
-        for t in shifts:
+    for j, d in enumerate(request.days):
+        for k, t in enumerate(request.shifts):
             model += (
-                lpSum(x[(w.id, d, t)] for w in workers) + deficit[(d, t)] >= m[d][t]
+                lpSum(x.get((w.id, d, t), 0) for w in workers) + deficit[(d, t)]
+                >= m[j][k]
             )
 
 
@@ -53,7 +57,54 @@ def add_empty_turn_penalty(model, variables, schedule_request):
     # Con Big-M:
     for d in days:
         for t in shifts:
-            model += lpSum(x[(w.id, d, t)] for w in workers) + z[(d, t)] >= 1
+            model += lpSum(x.get((w.id, d, t), 0) for w in workers) + z[(d, t)] >= 1
             # model += lpSum(x[(w.id, d, t)] for w in workers)  <= (len(workers)) * (
             #     1 - z[(d, t)]
             # )
+
+
+def coverage_block(index, schedule_request):
+    # sum_w x[w,d,t] + deficit[d,t] >= m[d][t]
+    W, D, T = index.x.shape
+    rows = np.arange(D * T).reshape(D, T)
+    return build_block(
+        D * T,
+        index.n_cols,
+        [
+            (rows, index.x, 1.0),
+            (rows, index.deficit, 1.0),
+        ],
+        demand_array(index, schedule_request).ravel(),
+        np.inf,
+    )
+
+
+def empty_turn_block(index, schedule_request):
+    # sum_w x[w,d,t] + z[d,t] >= 1
+    W, D, T = index.x.shape
+    rows = np.arange(D * T).reshape(D, T)
+    return build_block(
+        D * T,
+        index.n_cols,
+        [
+            (rows, index.x, 1.0),
+            (rows, index.z, 1.0),
+        ],
+        1.0,
+        np.inf,
+    )
+
+
+def coverage_rows(index, schedule_request):
+    m = as_request(schedule_request).demand_matrix.tolist()
+    for j in range(len(index.days)):
+        for k in range(len(index.shifts)):
+            cols = index.x[:, j, k].tolist() + [int(index.deficit[j, k])]
+            yield "G", cols, [1.0] * len(cols), m[j][k]
+
+
+def empty_turn_rows(index, schedule_request):
+    for j in range(len(index.days)):
+        for k in range(len(index.shifts)):
+            cols = index.x[:, j, k].tolist() + [int(index.z[j, k])]
+            yield "G", cols, [1.0] * len(cols), 1
@@ -1,7 +1,11 @@
 # core/restrictions/full_day.py
 
+import numpy as np
 from pulp import lpSum
 
+from scheduler.core.domain import as_request
+from scheduler.core.matrix import build_block
+
 
 def add_full_day_constraints(model, variables, schedule_request):
     (
@@ -17,13 +21,78 @@ def add_full_day_constraints(model, variables, schedule_request):
         viol_rest,
         viol_max,
     ) = variables
-    workers = schedule_request.workers
-    days = schedule_request.days
-    shifts = schedule_request.shifts
+    request = as_request(schedule_request)
+    shifts = request.shifts
 
-    for w in workers:
-        for d in days:
+    for wid in request.worker_ids:
+        for d in request.days:
             model += (
-                lpSum(x[(w.id, d, t)] for t in shifts)
-                <= len(shifts) + y_full[(w.id, d)]
+                lpSum(x.get((wid, d, t), 0) for t in shifts)
+                <= len(shifts) + y_full[(wid, d)]
             )
+
+
+def full_day_block(index, schedule_request):
+    # sum_t x[w,d,t] - y_full[w,d] <= len(shifts)
+    W, D, T = index.x.shape
+    rows = np.arange(W * D).reshape(W, D)
+    return build_block(
+        W * D,
+        index.n_cols,
+        [
+            (rows[:, :, None], index.x, 1.0),
+            (rows, index.y_full, -1.0),
+        ],
+        -np.inf,
+        T,
+    )
+
+
+def full_day_rows(index, schedule_request):
+    T = len(index.shifts)
+    for i in range(len(index.worker_ids)):
+        for j in range(len(index.days)):
+            cols = index.x[i, j].tolist() + [int(index.y_full[i, j])]
+            yield "L", cols, [1.0] * T + [-1.0], T
+
+
+def add_full_day_constraints_tight(model, variables, schedule_request):
+    """
+    y_full = 1 si el trabajador hace todos los turnos del día:
+    sum_t x[w,d,t] <= len(shifts) - 1 + y_full[w,d]. (La versión de
+    ACTIVE_RESTRICTIONS tiene lado derecho len(shifts) + y_full y nunca
+    obliga a y_full, así que el día completo no se penaliza.)
+    """
+    (
+        x,
+        deficit,
+        y_full,
+        y_split_MT,
+        y_split_MN,
+        y_split_MnN,
+        z,
+        work,
+        free2,
+        viol_rest,
+        viol_max,
+    ) = variables
+    request = as_request(schedule_request)
+    shifts = request.shifts
+
+    for wid in request.worker_ids:
+        for d in request.days:
+            model += (
+                lpSum(x.get((wid, d, t), 0) for t in shifts)
+                <= len(shifts) - 1 + y_full[(wid, d)]
+            )
+
+
+def full_day_tight_block(index, schedule_request):
+    # sum_t x[w,d,t] - y_full[w,d] <= len(shifts) - 1
+    A, lb, ub = full_day_block(index, schedule_request)
+    return A, lb, ub - 1
+
+
+def full_day_tight_rows(index, schedule_request):
+    for sense, cols, coefs, rhs in full_day_rows(index, schedule_request):
+        yield sense, cols, coefs, rhs - 1
@@ -1,7 +1,11 @@
 # core/restrictions/hours.py
 
+import numpy as np
 from pulp import lpSum
 
+from scheduler.core.domain import as_request
+from scheduler.core.matrix import build_block
+
 from scheduler.config.settings import TURN_HOURS
 
 
@@ -19,13 +23,37 @@ def add_hour_constraints(model, variables, schedule_request):
         viol_rest,
         viol_max,
     ) = variables
-    workers = schedule_request.workers
-    days = schedule_request.days
-    shifts = schedule_request.shifts
+    request = as_request(schedule_request)
+    days, shifts = request.days, request.shifts
 
-    for w in workers:
+    for wid, max_hours in zip(request.worker_ids, request.max_hours.tolist()):
         model += (
-            lpSum(TURN_HOURS[t] * x[(w.id, d, t)] for d in days for t in shifts)
-            + viol_max[w.id]
-            <= w.max_hours
+            lpSum(TURN_HOURS[t] * x.get((wid, d, t), 0) for d in days for t in shifts)
+            + viol_max[wid]
+            <= max_hours
         )
+
+
+def hour_block(index, schedule_request):
+    # sum_{d,t} h[t] x[w,d,t] + viol_max[w] <= max_hours[w]
+    W, D, T = index.x.shape
+    rows = np.arange(W)
+    hours = np.array([TURN_HOURS[t] for t in index.shifts], float)
+    return build_block(
+        W,
+        index.n_cols,
+        [
+            (rows[:, None, None], index.x, hours),
+            (rows, index.viol_max, 1.0),
+        ],
+        -np.inf,
+        as_request(schedule_request).max_hours,
+    )
+
+
+def hour_rows(index, schedule_request):
+    hours = [float(TURN_HOURS[t]) for t in index.shifts] * len(index.days)
+    max_hours = as_request(schedule_request).max_hours.tolist()
+    for i in range(len(index.worker_ids)):
+        cols = index.x[i].ravel().tolist() + [int(index.viol_max[i])]
+        yield "L", cols, hours + [1.0], max_hours[i]
@@ -1,5 +1,10 @@
 # core/restrictions/rest.py
 
+import numpy as np
+
+from scheduler.core.domain import as_request
+from scheduler.core.matrix import build_block
+
 
 def add_rest_constraints(model, variables, schedule_request):
     (
@@ -15,9 +20,32 @@ def add_rest_constraints(model, variables, schedule_request):
         viol_rest,
         viol_max,
     ) = variables
-    workers = schedule_request.workers
-    days = schedule_request.days
+    request = as_request(schedule_request)
+    days = request.days
 
-    for w in workers:
+    for wid in request.worker_ids:
         for d in days[:-1]:
-            model += x[(w.id, d, 3)] + x[(w.id, d + 1, 0)] <= 1
+            model += x.get((wid, d, 3), 0) + x.get((wid, d + 1, 0), 0) <= 1
+
+
+def rest_block(index, schedule_request):
+    # x[w,d,Noche] + x[w,d+1,Mañana] <= 1
+    W, D, T = index.x.shape
+    rows = np.arange(W * (D - 1)).reshape(W, D - 1)
+    night = index.x[:, :-1, index.shift_pos(3)]
+    morning = index.x[:, 1:, index.shift_pos(0)]
+    return build_block(
+        rows.size,
+        index.n_cols,
+        [(rows, night, 1.0), (rows, morning, 1.0)],
+        -np.inf,
+        1.0,
+    )
+
+
+def rest_rows(index, schedule_request):
+    night, morning = index.shift_pos(3), index.shift_pos(0)
+    for i in range(len(index.worker_ids)):
+        for j in range(len(index.days) - 1):
+            cols = [int(index.x[i, j, night]), int(index.x[i, j + 1, morning])]
+            yield "L", cols, [1.0, 1.0], 1
@@ -1,7 +1,11 @@
 # core/restrictions/rest2days.py
 
+import numpy as np
 from pulp import lpSum
 
+from scheduler.core.domain import as_request
+from scheduler.core.matrix import build_block, stack_blocks
+
 
 def add_rest2days_constraints(model, variables, schedule_request):
     (
@@ -17,40 +21,243 @@ def add_rest2days_constraints(model, variables, schedule_request):
         viol_rest,
         viol_max,
     ) = variables
-    workers = schedule_request.workers
-    days = schedule_request.days
-    shifts = schedule_request.shifts
+    request = as_request(schedule_request)
+    worker_ids, days, shifts = request.worker_ids, request.days, request.shifts
 
     # 1) work[w,d] = 1 si trabaja cualquier turno
-    for w in workers:
+    for wid in worker_ids:
         for d in days:
             # si hay cualquier turno asignado => work=1
             model += (
-                lpSum(x[(w.id, d, t)] for t in shifts) <= len(shifts) * work[(w.id, d)]
+                lpSum(x.get((wid, d, t), 0) for t in shifts)
+                <= len(shifts) * work[(wid, d)]
             )
             # si no hay turnos => work=0
             # model += (
-            #     lpSum(x[(w.id, d, t)] for t in shifts) >= work[(w.id, d)]
+            #     lpSum(x[(wid, d, t)] for t in shifts) >= work[(wid, d)]
             # )
 
     # 2) detectar bloques de 2 días de descanso consecutivos
-    for w in workers:
+    for wid in worker_ids:
         for d in days[:-1]:
             # free2 = 1 si no trabaja ni d ni d+1
-            model += free2[(w.id, d)] <= 1 - work[(w.id, d)]
-            model += free2[(w.id, d)] <= 1 - work[(w.id, d + 1)]
-            # model += free2[(w.id, d)] >= 1 - work[(w.id, d)]
-            # model += free2[(w.id, d)] >= 1 - work[(w.id, d + 1)]
-            # model += free2[(w.id, d)] >= 1 - 0.5 * (
-            #     work[(w.id, d)] + work[(w.id, d + 1)]
+            model += free2[(wid, d)] <= 1 - work[(wid, d)]
+            model += free2[(wid, d)] <= 1 - work[(wid, d + 1)]
+            # model += free2[(wid, d)] >= 1 - work[(wid, d)]
+            # model += free2[(wid, d)] >= 1 - work[(wid, d + 1)]
+            # model += free2[(wid, d)] >= 1 - 0.5 * (
+            #     work[(wid, d)] + work[(wid, d + 1)]
             # )
 
         # ultimo dia y primer dia (es modular)
         d = days[-1]
-        model += free2[(w.id, d)] <= 1 - work[(w.id, d)]
-        model += free2[(w.id, d)] <= 1 - work[(w.id, days[0])]
-        # model += free2[(w.id, d)] >= 1 - 0.5 * (work[(w.id, d)] + work[(w.id, days[0])])
+        model += free2[(wid, d)] <= 1 - work[(wid, d)]
+        model += free2[(wid, d)] <= 1 - work[(wid, days[0])]
+        # model += free2[(wid, d)] >= 1 - 0.5 * (work[(wid, d)] + work[(wid, days[0])])
 
     # 3) al menos una ventana libre, o viol_rest = 1
-    for w in workers:
-        model += lpSum(free2[(w.id, d)] for d in days) + viol_rest[w.id] >= 1
+    for wid in worker_ids:
+        model += lpSum(free2[(wid, d)] for d in days) + viol_rest[wid] >= 1
+
+
+def rest2days_block(index, schedule_request):
+    W, D, T = index.x.shape
+    n = index.n_cols
+
+    # 1) sum_t x[w,d,t] - T * work[w,d] <= 0
+    rows = np.arange(W * D).reshape(W, D)
+    link = build_block(
+        W * D,
+        n,
+        [
+            (rows[:, :, None], index.x, 1.0),
+            (rows, index.work, -float(T)),
+        ],
+        -np.inf,
+        0.0,
+    )
+
+    # 2) free2[w,d] + work[w,d] <= 1 y free2[w,d] + work[w,d+1] <= 1 (modular)
+    same = np.arange(W * D).reshape(W, D) * 2
+    nxt = same + 1
+    next_day = np.roll(index.work, -1, axis=1)
+    windows = build_block(
+        2 * W * D,
+        n,
+        [
+            (same, index.free2, 1.0),
+            (same, index.work, 1.0),
+            (nxt, index.free2, 1.0),
+            (nxt, next_day, 1.0),
+        ],
+        -np.inf,
+        1.0,
+    )
+
+    # 3) sum_d free2[w,d] + viol_rest[w] >= 1
+    rows = np.arange(W)
+    at_least_one = build_block(
+        W,
+        n,
+        [
+            (rows[:, None], index.free2, 1.0),
+            (rows, index.viol_rest, 1.0),
+        ],
+        1.0,
+        np.inf,
+    )
+
+    return stack_blocks([link, windows, at_least_one], n)
+
+
+def rest2days_rows(index, schedule_request):
+    W, D, T = index.x.shape
+    work, free2 = index.work, index.free2
+
+    for i in range(W):
+        for j in range(D):
+            cols = index.x[i, j].tolist() + [int(work[i, j])]
+            yield "L", cols, [1.0] * T + [-float(T)], 0
+
+    for i in range(W):
+        # el último día enlaza con el primero (modular)
+        for j in range(D):
+            yield "L", [int(free2[i, j]), int(work[i, j])], [1.0, 1.0], 1
+            nxt = (j + 1) % D
+            yield "L", [int(free2[i, j]), int(work[i, nxt])], [1.0, 1.0], 1
+
+    for i in range(W):
+        cols = free2[i].tolist() + [int(index.viol_rest[i])]
+        yield "G", cols, [1.0] * (D + 1), 1
+
+
+def add_rest2days_constraints_tight(model, variables, schedule_request):
+    """
+    Misma lógica que add_rest2days_constraints con una relajación LP más
+    ajustada:
+    - x[w,d,t] <= work[w,d] por turno en lugar de sum_t x <= T * work, y
+      work <= sum_t x (work es exactamente "trabaja ese día")
+    - free2[d] + free2[d+1] + work[d+1] <= 1. No es una desigualdad
+      válida: quita puntos enteros factibles (con tres días libres seguidos,
+      free2[d] = free2[d+1] = 1). El óptimo no cambia sólo porque free2 no
+      tiene coste y para viol_rest basta una ventana; si free2 pasara a
+      tener peso en el objetivo habría que quitar esta fila. start_values
+      deja una sola ventana por trabajador para cumplirla.
+    """
+    (
+        x,
+        deficit,
+        y_full,
+        y_split_MT,
+        y_split_MN,
+        y_split_MnN,
+        z,
+        work,
+        free2,
+        viol_rest,
+        viol_max,
+    ) = variables
+    request = as_request(schedule_request)
+    worker_ids, days, shifts = request.worker_ids, request.days, request.shifts
+
+    # 1) work[w,d] = max_t x[w,d,t]
+    for wid in worker_ids:
+        for d in days:
+            cells = [x[(wid, d, t)] for t in shifts if (wid, d, t) in x]
+            for var in cells:
+                model += var <= work[(wid, d)]
+            model += work[(wid, d)] <= lpSum(cells)
+
+    # 2) ventanas de 2 días libres (modular, como en la versión base)
+    for wid in worker_ids:
+        for i, d in enumerate(days):
+            nxt = days[(i + 1) % len(days)]
+            model += free2[(wid, d)] <= 1 - work[(wid, d)]
+            model += free2[(wid, d)] <= 1 - work[(wid, nxt)]
+            if len(days) >= 3:
+                model += free2[(wid, d)] + free2[(wid, nxt)] + work[(wid, nxt)] <= 1
+
+    # 3) al menos una ventana libre, o viol_rest = 1
+    for wid in worker_ids:
+        model += lpSum(free2[(wid, d)] for d in days) + viol_rest[wid] >= 1
+
+
+def rest2days_tight_block(index, schedule_request):
+    W, D, T = index.x.shape
+    n = index.n_cols
+
+    # 1) x[w,d,t] - work[w,d] <= 0 y work[w,d] - sum_t x[w,d,t] <= 0
+    rows = np.arange(W * D * T).reshape(W, D, T)
+    upper = build_block(
+        W * D * T,
+        n,
+        [
+            (rows, index.x, 1.0),
+            (rows, np.broadcast_to(index.work[:, :, None], rows.shape), -1.0),
+        ],
+        -np.inf,
+        0.0,
+    )
+    rows = np.arange(W * D).reshape(W, D)
+    lower = build_block(
+        W * D,
+        n,
+        [(rows, index.work, 1.0), (rows[:, :, None], index.x, -1.0)],
+        -np.inf,
+        0.0,
+    )
+
+    # 2) free2[w,d] + work[w,d] <= 1, free2[w,d] + work[w,d+1] <= 1 y
+    #    free2[w,d] + free2[w,d+1] + work[w,d+1] <= 1 (modular)
+    next_work = np.roll(index.work, -1, axis=1)
+    next_free = np.roll(index.free2, -1, axis=1)
+    rows = np.arange(W * D).reshape(W, D)
+    entries = [
+        [(rows, index.free2, 1.0), (rows, index.work, 1.0)],
+        [(rows, index.free2, 1.0), (rows, next_work, 1.0)],
+    ]
+    if D >= 3:
+        entries.append(
+            [(rows, index.free2, 1.0), (rows, next_free, 1.0), (rows, next_work, 1.0)]
+        )
+    windows = [build_block(W * D, n, e, -np.inf, 1.0) for e in entries]
+
+    # 3) sum_d free2[w,d] + viol_rest[w] >= 1
+    rows = np.arange(W)
+    at_least_one = build_block(
+        W,
+        n,
+        [
+            (rows[:, None], index.free2, 1.0),
+            (rows, index.viol_rest, 1.0),
+        ],
+        1.0,
+        np.inf,
+    )
+
+    return stack_blocks([upper, lower, *windows, at_least_one], n)
+
+
+def rest2days_tight_rows(index, schedule_request):
+    W, D, T = index.x.shape
+    work, free2 = index.work, index.free2
+
+    for i in range(W):
+        for j in range(D):
+            for k in range(T):
+                yield "L", [int(index.x[i, j, k]), int(work[i, j])], [1.0, -1.0], 0
+            cols = [int(work[i, j])] + index.x[i, j].tolist()
+            yield "L", cols, [1.0] + [-1.0] * T, 0
+
+    for i in range(W):
+        for j in range(D):
+            nxt = (j + 1) % D
+            yield "L", [int(free2[i, j]), int(work[i, j])], [1.0, 1.0], 1
+            yield "L", [int(free2[i, j]), int(work[i, nxt])], [1.0, 1.0], 1
+            if D >= 3:
+                cols = [int(free2[i, j]), int(free2[i, nxt]), int(work[i, nxt])]
+                yield "L", cols, [1.0, 1.0, 1.0], 1
+
+    for i in range(W):
+        cols = free2[i].tolist() + [int(index.viol_rest[i])]
+        yield "G", cols, [1.0] * (D + 1), 1
@@ -1,5 +1,10 @@
 # core/restrictions/split_shifts.py
 
+import numpy as np
+
+from scheduler.core.domain import as_request
+from scheduler.core.matrix import build_block
+
 
 def add_split_shift_constraints(model, variables, schedule_request):
     (
@@ -15,26 +20,79 @@ def add_split_shift_constraints(model, variables, schedule_request):
         viol_rest,
         viol_max,
     ) = variables
-    workers = schedule_request.workers
-    days = schedule_request.days
+    request = as_request(schedule_request)
+    worker_ids, days = request.worker_ids, request.days
 
     # Mañana-Tarde sin Mediodía
-    for w in workers:
+    for wid in worker_ids:
         for d in days:
             model += (
-                x[(w.id, d, 0)] + x[(w.id, d, 2)] - x[(w.id, d, 1)]
-                <= 1 + y_split_MT[(w.id, d)]
+                x.get((wid, d, 0), 0) + x.get((wid, d, 2), 0) - x.get((wid, d, 1), 0)
+                <= 1 + y_split_MT[(wid, d)]
             )
 
     # Mediodía-Noche sin Tarde
-    for w in workers:
+    for wid in worker_ids:
         for d in days:
             model += (
-                x[(w.id, d, 1)] + x[(w.id, d, 3)] - x[(w.id, d, 2)]
-                <= 1 + y_split_MN[(w.id, d)]
+                x.get((wid, d, 1), 0) + x.get((wid, d, 3), 0) - x.get((wid, d, 2), 0)
+                <= 1 + y_split_MN[(wid, d)]
             )
 
     # Mañana-Noche prohibido
-    for w in workers:
+    for wid in worker_ids:
         for d in days:
-            model += x[(w.id, d, 0)] + x[(w.id, d, 3)] <= 1 + y_split_MnN[(w.id, d)]
+            model += (
+                x.get((wid, d, 0), 0) + x.get((wid, d, 3), 0)
+                <= 1 + y_split_MnN[(wid, d)]
+            )
+
+
+def split_shift_block(index, schedule_request):
+    W, D, T = index.x.shape
+    rows = np.arange(W * D).reshape(W, D)
+    x = {t: index.x[:, :, index.shift_pos(t)] for t in (0, 1, 2, 3)}
+    MT, MN, MnN = rows, rows + W * D, rows + 2 * W * D
+    return build_block(
+        3 * W * D,
+        index.n_cols,
+        [
+            # Mañana-Tarde sin Mediodía
+            (MT, x[0], 1.0),
+            (MT, x[2], 1.0),
+            (MT, x[1], -1.0),
+            (MT, index.y_split_MT, -1.0),
+            # Mediodía-Noche sin Tarde
+            (MN, x[1], 1.0),
+            (MN, x[3], 1.0),
+            (MN, x[2], -1.0),
+            (MN, index.y_split_MN, -1.0),
+            # Mañana-Noche
+            (MnN, x[0], 1.0),
+            (MnN, x[3], 1.0),
+            (MnN, index.y_split_MnN, -1.0),
+        ],
+        -np.inf,
+        1.0,
+    )
+
+
+def split_shift_rows(index, schedule_request):
+    M, Md, T, N = (index.shift_pos(t) for t in (0, 1, 2, 3))
+    W, D = len(index.worker_ids), len(index.days)
+    patterns = [
+        # (y, turnos con +1, turno con -1)
+        (index.y_split_MT, (M, T), Md),
+        (index.y_split_MN, (Md, N), T),
+        (index.y_split_MnN, (M, N), None),
+    ]
+    for y, (a, b), minus in patterns:
+        for i in range(W):
+            for j in range(D):
+                x = index.x[i, j]
+                cols = [int(x[a]), int(x[b])]
+                coefs = [1.0, 1.0]
+                if minus is not None:
+                    cols.append(int(x[minus]))
+                    coefs.append(-1.0)
+                yield "L", cols + [int(y[i, j])], coefs + [-1.0], 1
@@ -0,0 +1,87 @@
+# core/restrictions/symmetry.py
+
+import numpy as np
+from pulp import lpSum
+
+from scheduler.core.domain import as_request
+from scheduler.core.matrix import build_block
+
+
+def symmetry_groups(schedule_request):
+    """
+    Grupos de trabajadores intercambiables: mismo max_hours y mismas celdas
+    no disponibles. Sólo se devuelven grupos de 2 o más, en el orden de
+    schedule_request.workers.
+    """
+    request = as_request(schedule_request)
+
+    groups = {}
+    for w, available in zip(request.workers, request.available):
+        groups.setdefault((w.max_hours, available.tobytes()), []).append(w)
+    return [g for g in groups.values() if len(g) > 1]
+
+
+def add_symmetry_breaking(model, variables, schedule_request):
+    """
+    Dentro de cada grupo intercambiable ordena los trabajadores por número
+    de turnos asignados: cualquier horario se puede permutar para cumplirlo,
+    así el solver no explora las permutaciones equivalentes.
+    (Ordenar por horas o por un peso distinto por celda rompe más simetría
+    pero empeora la relajación y en la práctica resuelve más lento.)
+    """
+    (
+        x,
+        deficit,
+        y_full,
+        y_split_MT,
+        y_split_MN,
+        y_split_MnN,
+        z,
+        work,
+        free2,
+        viol_rest,
+        viol_max,
+    ) = variables
+    days = schedule_request.days
+    shifts = schedule_request.shifts
+
+    for group in symmetry_groups(schedule_request):
+        for a, b in zip(group, group[1:]):
+            model += (
+                lpSum(
+                    x.get((a.id, d, t), 0) - x.get((b.id, d, t), 0)
+                    for d in days
+                    for t in shifts
+                )
+                >= 0
+            )
+
+
+def symmetry_block(index, schedule_request):
+    # sum_{d,t} (x[a,d,t] - x[b,d,t]) >= 0 para trabajadores consecutivos
+    pos = {wid: i for i, wid in enumerate(index.worker_ids)}
+    pairs = [
+        (pos[a.id], pos[b.id])
+        for group in symmetry_groups(schedule_request)
+        for a, b in zip(group, group[1:])
+    ]
+    first = np.array([a for a, _ in pairs], dtype=int)
+    second = np.array([b for _, b in pairs], dtype=int)
+    rows = np.arange(len(pairs))[:, None, None]
+    return build_block(
+        len(pairs),
+        index.n_cols,
+        [(rows, index.x[first], 1.0), (rows, index.x[second], -1.0)],
+        0.0,
+        np.inf,
+    )
+
+
+def symmetry_rows(index, schedule_request):
+    pos = {wid: i for i, wid in enumerate(index.worker_ids)}
+    n = len(index.days) * len(index.shifts)
+    for group in symmetry_groups(schedule_request):
+        for a, b in zip(group, group[1:]):
+            cols = index.x[pos[a.id]].ravel().tolist()
+            cols += index.x[pos[b.id]].ravel().tolist()
+            yield "G", cols, [1.0] * n + [-1.0] * n, 0
@@ -1,5 +1,8 @@
 # core/restrictions_manager.py
 
+from contextlib import nullcontext
+
+from scheduler.core.matrix import stack_blocks
 from scheduler.core.restrictions import (
     availability,
     coverage,
@@ -8,6 +11,7 @@ from scheduler.core.restrictions import (
     rest,
     rest2days,
     split_shifts,
+    symmetry,
 )
 
 ACTIVE_RESTRICTIONS = [
@@ -21,9 +25,86 @@ ACTIVE_RESTRICTIONS = [
     rest2days.add_rest2days_constraints,
 ]
 
+# Opcional: ACTIVE_RESTRICTIONS + orden entre trabajadores intercambiables
+SYMMETRY_RESTRICTIONS = ACTIVE_RESTRICTIONS + [symmetry.add_symmetry_breaking]
+
+# Opcional: formulación ajustada de día completo y 2 días libres (relajación
+# LP más cercana al entero; ver benchmarks/bench_tight.py). El día completo
+# sí se penaliza aquí, así que el óptimo puede diferir de ACTIVE_RESTRICTIONS.
+TIGHT_RESTRICTIONS = [
+    coverage.add_coverage_constraints,
+    coverage.add_empty_turn_penalty,
+    availability.add_availability_constraints,
+    hours.add_hour_constraints,
+    full_day.add_full_day_constraints_tight,
+    split_shifts.add_split_shift_constraints,
+    rest.add_rest_constraints,
+    rest2days.add_rest2days_constraints_tight,
+]
+
+
+def _phase(stats, add):
+    # tiempo por restricción si se pasa un SolveStats
+    return stats.phase(add.__name__) if stats is not None else nullcontext()
+
+
+def apply_restrictions(
+    model, variables, schedule_request, restrictions=None, stats=None
+):
+    if not restrictions:
+        restrictions = ACTIVE_RESTRICTIONS
+    for add in restrictions:
+        with _phase(stats, add):
+            add(model, variables, schedule_request)
+
+
+# Bloque CSR equivalente a cada restricción (backend "matrix")
+MATRIX_BLOCKS = {
+    coverage.add_coverage_constraints: coverage.coverage_block,
+    coverage.add_empty_turn_penalty: coverage.empty_turn_block,
+    availability.add_availability_constraints: availability.availability_block,
+    hours.add_hour_constraints: hours.hour_block,
+    full_day.add_full_day_constraints: full_day.full_day_block,
+    split_shifts.add_split_shift_constraints: split_shifts.split_shift_block,
+    rest.add_rest_constraints: rest.rest_block,
+    rest2days.add_rest2days_constraints: rest2days.rest2days_block,
+    full_day.add_full_day_constraints_tight: full_day.full_day_tight_block,
+    rest2days.add_rest2days_constraints_tight: rest2days.rest2days_tight_block,
+    symmetry.add_symmetry_breaking: symmetry.symmetry_block,
+}
+
+# Generador de filas (sense, cols, coefs, rhs) de cada restricción (backend "mps")
+ROW_GENERATORS = {
+    coverage.add_coverage_constraints: coverage.coverage_rows,
+    coverage.add_empty_turn_penalty: coverage.empty_turn_rows,
+    availability.add_availability_constraints: availability.availability_rows,
+    hours.add_hour_constraints: hours.hour_rows,
+    full_day.add_full_day_constraints: full_day.full_day_rows,
+    split_shifts.add_split_shift_constraints: split_shifts.split_shift_rows,
+    rest.add_rest_constraints: rest.rest_rows,
+    rest2days.add_rest2days_constraints: rest2days.rest2days_rows,
+    full_day.add_full_day_constraints_tight: full_day.full_day_tight_rows,
+    rest2days.add_rest2days_constraints_tight: rest2days.rest2days_tight_rows,
+    symmetry.add_symmetry_breaking: symmetry.symmetry_rows,
+}
+
+
+def build_matrix(index, schedule_request, restrictions=None, stats=None):
+    if not restrictions:
+        restrictions = ACTIVE_RESTRICTIONS
+    blocks = []
+    for add in restrictions:
+        if add not in MATRIX_BLOCKS:
+            raise ValueError(f"Restricción sin bloque matricial: {add.__name__}")
+        with _phase(stats, add):
+            blocks.append(MATRIX_BLOCKS[add](index, schedule_request))
+    return stack_blocks(blocks, index.n_cols)
+
 
-def apply_restrictions(model, variables, schedule_request, restrictions=None):
+def iter_rows(index, schedule_request, restrictions=None):
     if not restrictions:
         restrictions = ACTIVE_RESTRICTIONS
     for add in restrictions:
-        add(model, variables, schedule_request)
+        if add not in ROW_GENERATORS:
+            raise ValueError(f"Restricción sin generador de filas: {add.__name__}")
+        yield from ROW_GENERATORS[add](index, schedule_request)
@@ -0,0 +1,328 @@
+# core/session.py
+
+import copy
+import threading
+from itertools import product
+
+from pulp import LpProblem, LpStatus, value
+
+from scheduler.core.backends import pulp_solver, warm_start_solver
+from scheduler.core.cbc import gap_reached, solve_pulp
+from scheduler.core.domain import ScheduleRequest, Worker
+from scheduler.core.matrix import FAMILIES
+from scheduler.core.model import build_variables, build_worker_variables
+from scheduler.core.objective import set_objective
+from scheduler.core.restrictions import availability, coverage, hours
+from scheduler.core.restrictions_manager import ACTIVE_RESTRICTIONS
+from scheduler.core.stats import SolveStats, instrument_pulp, pulp_model_size
+from scheduler.core.warm_start import set_initial_values, start_values
+
+# Restricciones con una fila por (día, turno) que suman x sobre todos los
+# trabajadores; el resto son filas propias de cada trabajador.
+SHARED_RESTRICTIONS = (
+    coverage.add_coverage_constraints,
+    coverage.add_empty_turn_penalty,
+)
+
+# Índices de las familias por trabajador dentro de la tupla de variables
+_WORKER_FAMILIES = [
+    FAMILIES.index(name)
+    for name in (
+        "x",
+        "y_full",
+        "y_split_MT",
+        "y_split_MN",
+        "y_split_MnN",
+        "work",
+        "free2",
+        "viol_rest",
+        "viol_max",
+    )
+]
+
+
+class _Recorder:
+    """Hace de `model` para una restricción y guarda las filas que añade."""
+
+    def __init__(self, model):
+        self.model = model
+        self.rows = []
+
+    def __iadd__(self, other):
+        self.model += other
+        if not isinstance(other, (bool, tuple)):
+            self.rows.append(other)
+        return self
+
+
+class ScheduleSession:
+    """
+    Mantiene el modelo PuLP construido entre ediciones pequeñas:
+    - disponibilidad → cotas de x[(w, d, t)] (sin filas de availability)
+    - demanda m[d][t] → lado derecho de la fila de cobertura
+    - max_hours → lado derecho de la fila de horas del trabajador
+    - alta / baja de trabajador → se añade o quita su bloque de columnas y filas
+    y vuelve a resolver partiendo de la última solución.
+
+    lock: quien edite y resuelva la sesión desde otro hilo (la app lo hace
+    en segundo plano) debe tenerlo durante toda la secuencia; la sesión no
+    admite dos solves a la vez.
+    """
+
+    def __init__(self, schedule_request, restrictions=None, solver=None, options=None):
+        self.lock = threading.Lock()
+        self.workers = [
+            Worker(w.id, getattr(w, "name", str(w.id)), w.max_hours)
+            for w in schedule_request.workers
+        ]
+        self.availability = copy.deepcopy(schedule_request.availability)
+        self.demand = copy.deepcopy(schedule_request.demand)
+        self._request = None
+        self.days = self.request.days
+        self.shifts = self.request.shifts
+
+        restrictions = restrictions or ACTIVE_RESTRICTIONS
+        # la disponibilidad se aplica como cota de x
+        restrictions = [
+            r
+            for r in restrictions
+            if r is not availability.add_availability_constraints
+        ]
+        self.shared = [r for r in restrictions if r in SHARED_RESTRICTIONS]
+        self.per_worker = [r for r in restrictions if r not in SHARED_RESTRICTIONS]
+
+        self.solver = solver
+        self.options = options
+        self.result = None
+        self._build()
+
+    @property
+    def request(self):
+        # ScheduleRequest con los datos actuales; las ediciones lo invalidan
+        if self._request is None:
+            self._request = ScheduleRequest(
+                self.workers, self.availability, self.demand
+            )
+        return self._request
+
+    # -----------------------------------------
+    # Construcción
+    # -----------------------------------------
+    def _build(self):
+        self.model = LpProblem("Horario_Camareros_Soft")
+        self.variables = build_variables(self.request)
+
+        # filas compartidas, por restricción y (día, turno)
+        self._shared_rows = {}
+        for add in self.shared:
+            recorder = _Recorder(self.model)
+            add(recorder, self.variables, self.request)
+            cells = product(self.days, self.shifts)
+            self._shared_rows[add] = dict(zip(cells, recorder.rows))
+
+        self._worker_rows = {}
+        for w in self.workers:
+            self._add_worker_rows(w)
+
+        set_objective(self.model, self.variables, self.request)
+
+        for w in self.workers:
+            for d, t in product(self.days, self.shifts):
+                self._apply_bound(w.id, d, t)
+
+        self._dirty = False
+
+    def _add_worker_rows(self, w):
+        sub_request = ScheduleRequest([w], self.availability, self.demand)
+        rows = {}
+        for add in self.per_worker:
+            recorder = _Recorder(self.model)
+            add(recorder, self.variables, sub_request)
+            rows[add] = recorder.rows
+        self._worker_rows[w.id] = rows
+
+    def _worker_variables(self, wid):
+        return [
+            var
+            for i in _WORKER_FAMILIES
+            for key, var in self.variables[i].items()
+            if (key[0] if isinstance(key, tuple) else key) == wid
+        ]
+
+    def _rebuild_model(self):
+        # reensambla el LpProblem con las filas ya construidas
+        model = LpProblem(self.model.name)
+        model += self.model.objective
+        for rows in self._shared_rows.values():
+            for row in rows.values():
+                model += row
+        for rows in self._worker_rows.values():
+            for group in rows.values():
+                for row in group:
+                    model += row
+        self.model = model
+        self._dirty = False
+
+    def _apply_bound(self, wid, d, t):
+        available = self.availability.get(wid, {}).get(d, {}).get(t, 1)
+        self.variables[0][(wid, d, t)].upBound = available
+
+    # -----------------------------------------
+    # Ediciones
+    # -----------------------------------------
+    def set_availability(self, worker_id, day, shift, available):
+        self.availability.setdefault(worker_id, {}).setdefault(day, {})[
+            shift
+        ] = available
+        self._request = None
+        self._apply_bound(worker_id, day, shift)
+
+    def set_worker_availability(self, worker_id, availability):
+        """Sustituye toda la disponibilidad del trabajador {day: {shift: 0/1}}."""
+        self.availability[worker_id] = copy.deepcopy(availability)
+        self._request = None
+        for d, t in product(self.days, self.shifts):
+            self._apply_bound(worker_id, d, t)
+
+    def set_demand(self, day, shift, min_workers):
+        self.demand[day][shift] = min_workers
+        self._request = None
+        row = self._shared_rows.get(coverage.add_coverage_constraints, {})
+        if (day, shift) in row:
+            row[(day, shift)].changeRHS(min_workers)
+
+    def set_max_hours(self, worker_id, max_hours):
+        w = next(w for w in self.workers if w.id == worker_id)
+        w.max_hours = max_hours
+        self._request = None
+        for row in self._worker_rows[worker_id].get(hours.add_hour_constraints, []):
+            row.changeRHS(max_hours)
+
+    def add_worker(self, worker, availability=None):
+        if any(w.id == worker.id for w in self.workers):
+            raise ValueError(f"El trabajador {worker.id} ya está en la sesión")
+
+        w = Worker(worker.id, getattr(worker, "name", str(worker.id)), worker.max_hours)
+        self.workers.append(w)
+        if availability is not None:
+            self.availability[w.id] = copy.deepcopy(availability)
+        self._request = None
+
+        block = build_worker_variables(w, self.days, self.shifts)
+        for i, family in zip(_WORKER_FAMILIES, block):
+            self.variables[i].update(family)
+
+        x = block[0]
+        for rows in self._shared_rows.values():
+            for (d, t), row in rows.items():
+                row.expr.addterm(x[(w.id, d, t)], 1)
+
+        # añade sus filas al modelo
+        self._add_worker_rows(w)
+
+        # términos del objetivo del nuevo trabajador
+        partial = LpProblem("worker")
+        sub_variables = [{} for _ in FAMILIES]
+        for i, family in zip(_WORKER_FAMILIES, block):
+            sub_variables[i] = family
+        sub_request = ScheduleRequest([w], self.availability, self.demand)
+        set_objective(partial, tuple(sub_variables), sub_request)
+        self.model.objective.addInPlace(partial.objective)
+
+        for d, t in product(self.days, self.shifts):
+            self._apply_bound(w.id, d, t)
+
+    def remove_worker(self, worker_id):
+        variables = self._worker_variables(worker_id)
+
+        for rows in self._shared_rows.values():
+            for row in rows.values():
+                for var in variables:
+                    row.expr.pop(var, None)
+        for var in variables:
+            self.model.objective.pop(var, None)
+
+        for i in _WORKER_FAMILIES:
+            family = self.variables[i]
+            for key in [
+                k for k in family if (k[0] if isinstance(k, tuple) else k) == worker_id
+            ]:
+                del family[key]
+
+        del self._worker_rows[worker_id]
+        self.workers[:] = [w for w in self.workers if w.id != worker_id]
+        self.availability.pop(worker_id, None)
+        self._request = None
+        self._dirty = True
+
+    def update(self, schedule_request):
+        """
+        Aplica como diferencias un ScheduleRequest completo (p. ej. el que
+        reconstruye la app en cada ejecución) con los mismos días y turnos.
+        """
+        if schedule_request.days != self.days or schedule_request.shifts != self.shifts:
+            raise ValueError("La sesión no admite cambiar días o turnos")
+
+        new_workers = {w.id: w for w in schedule_request.workers}
+        for w in list(self.workers):
+            if w.id not in new_workers:
+                self.remove_worker(w.id)
+
+        current = {w.id: w for w in self.workers}
+        new_av = schedule_request.availability
+        for wid, w in new_workers.items():
+            if wid not in current:
+                self.add_worker(w, new_av.get(wid, {}))
+                continue
+            if w.max_hours != current[wid].max_hours:
+                self.set_max_hours(wid, w.max_hours)
+            if new_av.get(wid, {}) != self.availability.get(wid, {}):
+                self.set_worker_availability(wid, new_av.get(wid, {}))
+
+        for d in self.days:
+            for t in self.shifts:
+                m = schedule_request.demand[d][t]
+                if m != self.demand[d][t]:
+                    self.set_demand(d, t, m)
+
+    # -----------------------------------------
+    # Resolución
+    # -----------------------------------------
+    def solve(self, warm_start=True, on_phase=None, progress=None):
+        """
+        warm_start: True para partir de la última solución de la sesión, o
+        cualquier origen admitido por solve_schedule (filas de BD, resultado).
+        on_phase: callback de SolveStats y progress: CbcProgress, como en
+        solve_schedule.
+        """
+        stats = SolveStats(callback=on_phase)
+        if self._dirty:
+            with stats.phase("rebuild_model"):
+                self._rebuild_model()
+
+        source = self.result if warm_start is True else warm_start
+        solver = self.solver or pulp_solver(self.options)
+        if source:
+            with stats.phase("warm_start"):
+                values = start_values(
+                    source, self.request, self.shared + self.per_worker
+                )
+                set_initial_values(self.variables, values)
+            solver = warm_start_solver(solver)
+
+        stats.size = pulp_model_size(self.model, self.variables)
+        with instrument_pulp(self.model, solver, stats):
+            if progress is None:
+                self.model.solve(solver)
+            else:
+                solve_pulp(self.model, solver, progress)
+
+        self.result = {
+            "status": LpStatus[self.model.status],
+            "gap_reached": gap_reached(self.model),
+            "model": self.model,
+            "variables": dict(zip(FAMILIES, self.variables)),
+            "objective": value(self.model.objective),
+            "stats": stats.as_dict(),
+        }
+        return self.result
@@ -0,0 +1,172 @@
+# core/solution.py
+
+import numpy as np
+
+from scheduler.config.settings import (
+    P_COVER,
+    P_EMPTY,
+    P_FULL,
+    P_LESS,
+    P_MAX_HOURS,
+    P_REST,
+    P_SPLIT,
+    TURN_HOURS,
+)
+from scheduler.core.domain import as_request
+from scheduler.core.matrix import CONTINUOUS, FAMILIES, VariableIndex
+
+# Peso de cada familia en el objetivo (mismo que set_objective)
+WEIGHTS = {
+    "cover": ("deficit", P_COVER),
+    "empty": ("z", P_EMPTY),
+    "full": ("y_full", P_FULL),
+    "split": (("y_split_MT", "y_split_MN", "y_split_MnN"), P_SPLIT),
+    "rest": ("viol_rest", P_REST),
+    "max_hours": ("viol_max", P_MAX_HOURS),
+    "less": ("x", -1 * P_LESS),
+}
+
+
+class ScheduleSolution:
+    """
+    Resultado compacto de un solve, sin objetos PuLP:
+    - x: array uint8 (workers, days, shifts)
+    - slack: {familia: array} con el resto de variables (deficit en float,
+      las binarias en uint8) con las formas de VariableIndex
+    - breakdown: contribución al objetivo de cada penalización
+    Se puede guardar en session_state o enviar entre procesos sin coste.
+    """
+
+    def __init__(self, status, objective, worker_ids, days, shifts, x, slack):
+        self.status = status
+        self.objective = objective
+        self.worker_ids = list(worker_ids)
+        self.days = list(days)
+        self.shifts = list(shifts)
+        self.x = x
+        self.slack = slack
+        self.stats = None  # SolveStats.as_dict() del solve, si se conoce
+        # True si CBC paró por el gap y no por el límite de tiempo; None
+        # si el backend no lo informa (matrix, mps, heurísticas)
+        self.gap_reached = None
+        self.breakdown = {
+            name: float(
+                weight
+                * sum(
+                    self.family(f).sum()
+                    for f in (families if isinstance(families, tuple) else (families,))
+                )
+            )
+            for name, (families, weight) in WEIGHTS.items()
+        }
+
+    # -----------------------------------------
+    # Construcción
+    # -----------------------------------------
+    @classmethod
+    def from_vector(cls, status, objective, index, values):
+        """values: vector por columna de VariableIndex (backends matrix y mps)."""
+        arrays = {}
+        for name in FAMILIES:
+            v = np.asarray(values)[getattr(index, name)]
+            arrays[name] = v if name in CONTINUOUS else np.rint(v).astype(np.uint8)
+        x = arrays.pop("x")
+        return cls(
+            status, objective, index.worker_ids, index.days, index.shifts, x, arrays
+        )
+
+    @classmethod
+    def from_result(cls, result, schedule_request):
+        """A partir del dict de solve_schedule (variables PuLP ya resueltas)."""
+        index = VariableIndex(schedule_request)
+        values = np.zeros(index.n_cols)
+        for name in FAMILIES:
+            family = result["variables"][name]
+            keys = index.keys(name)
+            if getattr(index, name).ndim == 1:
+                keys = [k[0] for k in keys]
+            # con presolve faltan las x fijadas a 0
+            values[getattr(index, name).ravel()] = [
+                family[k].value() or 0 if k in family else 0 for k in keys
+            ]
+        solution = cls.from_vector(result["status"], result["objective"], index, values)
+        solution.stats = result.get("stats")
+        solution.gap_reached = result.get("gap_reached")
+        return solution
+
+    # -----------------------------------------
+    # Consulta
+    # -----------------------------------------
+    def family(self, name):
+        return self.x if name == "x" else self.slack[name]
+
+    def assignments(self):
+        """Lista de (w, d, t) asignados, en orden (trabajador, día, turno)."""
+        i, j, k = np.nonzero(self.x)
+        return [
+            (self.worker_ids[a], self.days[b], self.shifts[c])
+            for a, b, c in zip(i.tolist(), j.tolist(), k.tolist())
+        ]
+
+    def hours(self):
+        """Horas asignadas por trabajador, en el orden de worker_ids."""
+        turn_hours = np.array([TURN_HOURS[t] for t in self.shifts])
+        return self.x.sum(axis=1) @ turn_hours
+
+
+def is_solution(result):
+    """
+    Como as_request: también reconoce un ScheduleSolution de la misma clase
+    importada por otra ruta (core.solution / scheduler.core.solution).
+    """
+    return isinstance(result, ScheduleSolution) or hasattr(result, "slack")
+
+
+def _assigned_keys(x):
+    # una sola pasada por las x PuLP leyendo varValue (redondeado)
+    return [key for key, var in x.items() if (var.varValue or 0) > 0.5]
+
+
+def assignments(result):
+    """(w, d, t) asignados, para un ScheduleSolution o el dict de solve_schedule."""
+    if is_solution(result):
+        return result.assignments()
+    return _assigned_keys(result["variables"]["x"])
+
+
+def assignment_array(result, schedule_request):
+    """
+    x (workers, days, shifts) uint8 en el orden de schedule_request, para
+    un ScheduleSolution, el dict de solve_schedule o las filas de
+    load_schedule(). Es la única lectura de la solución que necesitan las
+    salidas (DataFrame, consola, BD); se ignoran trabajadores que ya no
+    están en la petición.
+    """
+    request = as_request(schedule_request)
+    if is_solution(result) and (
+        result.worker_ids == request.worker_ids
+        and result.days == request.days
+        and result.shifts == request.shifts
+    ):
+        return result.x
+
+    x = np.zeros(request.available.shape, dtype=np.uint8)
+    for w, d, t in assigned_cells(result):
+        i = request.worker_pos.get(w)
+        j, k = request.day_pos.get(d), request.shift_pos.get(t)
+        if i is not None and j is not None and k is not None:
+            x[i, j, k] = 1
+    return x
+
+
+def assigned_cells(source):
+    """
+    Celdas (w, d, t) asignadas en:
+    - las filas de SchedulerRepository.load_schedule() [{day, shift, worker_id}]
+    - un resultado previo de solve_schedule (dict o ScheduleSolution)
+    """
+    if is_solution(source) or (
+        isinstance(source, dict) and "variables" in source
+    ):
+        return set(assignments(source))
+    return {(r["worker_id"], r["day"], r["shift"]) for r in source}
@@ -1,19 +1,159 @@
-from pulp import PULP_CBC_CMD, LpStatus
+from pulp import LpStatus, value
 
-from scheduler.config.settings import SOLVER_TIME_LIMIT
-from scheduler.core.model import create_model
-from scheduler.core.objective import set_objective
-from scheduler.core.restrictions_manager import apply_restrictions
+from scheduler.core.backends import (
+    SolverOptions,
+    get_engine,
+    pulp_solver,
+    warm_start_solver,
+)
+from scheduler.core.cbc import gap_reached, solve_mps, solve_pulp
+from scheduler.core.matrix import VariableIndex, assign_values
+from scheduler.core.model import build_variables, create_model
+from scheduler.core.objective import objective_vector, set_objective
+from scheduler.core.presolve import PresolvedModel, feasible_cells
+from scheduler.core.restrictions_manager import apply_restrictions, build_matrix
+from scheduler.core.solution import ScheduleSolution
+from scheduler.core.stats import SolveStats, instrument_pulp, pulp_model_size
+from scheduler.core.warm_start import set_initial_values, start_values, start_vector
 
+BACKENDS = ("pulp", "matrix", "mps")
 
-def solve_schedule(schedule_request, solver=None, restrictions=None):
-    model, variables = create_model(schedule_request)
 
-    apply_restrictions(model, variables, schedule_request, restrictions)
-    set_objective(model, variables, schedule_request)
+def solve_schedule(
+    schedule_request,
+    solver=None,
+    restrictions=None,
+    backend="pulp",
+    warm_start=None,
+    compact=False,
+    presolve=True,
+    on_phase=None,
+    profile_memory=False,
+    engine="scipy",
+    options=None,
+    progress=None,
+):
+    """
+    backend:
+    - "pulp": modelo PuLP restricción a restricción, resuelto con `solver`
+      (PULP_CBC_CMD por defecto)
+    - "matrix": bloques CSR por familia de restricciones, resueltos en
+      proceso por `engine` (ver core/backends.py: "scipy", "highspy",
+      "ortools"). `solver` no se usa.
+    - "mps": filas generadas en streaming y escritas directamente a un MPS
+      idéntico al de PuLP, resuelto con el CBC de `solver`.
 
-    solver = solver or PULP_CBC_CMD(msg=False, timeLimit=SOLVER_TIME_LIMIT)
-    model.solve(solver)
+    options: SolverOptions (tiempo, gap, hilos) para el CBC por defecto o
+    el motor de "matrix". Si se pasa `solver`, manda su configuración.
+    Sin options se resuelve hasta el óptimo exacto o SOLVER_TIME_LIMIT (el
+    gap del 5% es sólo el valor inicial de la interfaz).
+
+    warm_start: filas de SchedulerRepository.load_schedule() o un resultado
+    previo de solve_schedule. Se pasa como MIP start (CBC, highspy y
+    OR-Tools; HiGHS vía scipy no admite solución inicial).
+
+    presolve: (backend "pulp") sólo crea las x de celdas disponibles y
+    descarta las filas que se cumplen trivialmente (ver core/presolve.py).
+
+    compact: devuelve un ScheduleSolution (arrays NumPy) en lugar del dict
+    con el modelo y las LpVariable, que se liberan tras el solve.
+
+    progress: CbcProgress (core/cbc.py) que recibe la mejor solución, la
+    cota y el gap mientras CBC resuelve y permite pararlo quedándose con la
+    mejor solución encontrada (backends "pulp" y "mps").
+
+    El resultado lleva "stats" (SolveStats.as_dict): tiempo por fase y por
+    restricción y tamaño del modelo. on_phase(nombre, registro) se llama al
+    terminar cada fase; profile_memory añade la memoria de cada fase.
+
+    "gap_reached" (backend "pulp") distingue un "Optimal" en el que CBC
+    alcanzó el gap de uno en el que paró por el límite de tiempo con la
+    mejor solución encontrada; los otros backends lo dejan en None.
+    """
+    stats = SolveStats(memory=profile_memory, callback=on_phase)
+    start = None
+    if warm_start is not None:
+        with stats.phase("warm_start"):
+            start = start_values(warm_start, schedule_request, restrictions)
+
+    if backend == "pulp":
+        with stats.phase("build_variables"):
+            cells = feasible_cells(schedule_request) if presolve else None
+            model, variables = create_model(schedule_request, cells)
+
+        target = PresolvedModel(model) if presolve else model
+        apply_restrictions(target, variables, schedule_request, restrictions, stats)
+        with stats.phase("set_objective"):
+            set_objective(model, variables, schedule_request)
+        stats.size = pulp_model_size(model, variables)
+
+        solver = solver or pulp_solver(options)
+        if start is not None:
+            set_initial_values(variables, start)
+            solver = warm_start_solver(solver)
+        with instrument_pulp(model, solver, stats):
+            if progress is None:
+                model.solve(solver)
+            else:
+                solve_pulp(model, solver, progress)
+        status = LpStatus[model.status]
+        reached = gap_reached(model)
+        objective = value(model.objective)
+    elif backend in ("matrix", "mps"):
+        model = None
+        reached = None
+        with stats.phase("build_variables"):
+            index = VariableIndex(schedule_request)
+        with stats.phase("set_objective"):
+            c = objective_vector(index, schedule_request)
+
+        if backend == "matrix":
+            A, row_lb, row_ub = build_matrix(
+                index, schedule_request, restrictions, stats
+            )
+            stats.size = {
+                "variables": index.n_cols,
+                "constraints": A.shape[0],
+                "nonzeros": A.nnz,
+            }
+            solve_engine = get_engine(engine)
+            with stats.phase(engine):
+                status, values, objective = solve_engine(
+                    c,
+                    index,
+                    A,
+                    row_lb,
+                    row_ub,
+                    options or SolverOptions(),
+                    start=None if start is None else start_vector(index, start),
+                )
+        else:
+            # escritura en streaming, CBC y lectura en un solo paso
+            stats.size = {"variables": index.n_cols}
+            with stats.phase("write_mps_and_cbc"):
+                status, values, objective = solve_mps(
+                    index,
+                    schedule_request,
+                    c,
+                    restrictions,
+                    solver or pulp_solver(options),
+                    start=None if start is None else start_vector(index, start),
+                    progress=progress,
+                )
+
+        if compact:
+            with stats.phase("extract"):
+                solution = ScheduleSolution.from_vector(
+                    status, objective, index, values
+                )
+            stats.stop()
+            solution.stats = stats.as_dict()
+            return solution
+        with stats.phase("extract"):
+            variables = build_variables(schedule_request)
+            assign_values(variables, index, values)
+    else:
+        raise ValueError(f"Backend desconocido: {backend} (opciones: {BACKENDS})")
 
     # unpack variables tuple
     (
@@ -44,4 +184,19 @@ def solve_schedule(schedule_request, solver=None, restrictions=None):
         "viol_max": viol_max,
     }
 
-    return {"status": LpStatus[model.status], "model": model, "variables": variables}
+    result = {
+        "status": status,
+        "gap_reached": reached,
+        "model": model,
+        "variables": variables,
+        "objective": objective,
+    }
+    if compact:
+        with stats.phase("extract"):
+            solution = ScheduleSolution.from_result(result, schedule_request)
+        stats.stop()
+        solution.stats = stats.as_dict()
+        return solution
+    stats.stop()
+    result["stats"] = stats.as_dict()
+    return result
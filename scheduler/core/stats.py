@@ -0,0 +1,127 @@
+# core/stats.py
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class SolveStats:
+    """
+    Tiempo (y opcionalmente memoria) por fase de un solve, más el tamaño
+    del modelo.
+
+    memory: mide con tracemalloc la memoria Python que deja cada fase
+    ("memory") y su pico ("peak"), en bytes. Ralentiza la construcción del
+    modelo, por eso va desactivado por defecto. CBC es un proceso aparte:
+    en Unix la fase "cbc" lleva "children_peak_rss_kb", el pico de memoria
+    de todos los procesos hijos que ha lanzado Python hasta ahora (no sólo
+    este CBC; es una cota superior de su memoria). En Windows no se da.
+    callback: on_phase(nombre, registro) al terminar cada fase.
+    """
+
+    def __init__(self, memory=False, callback=None):
+        self.memory = memory
+        self.callback = callback
+        self.phases = {}
+        self.size = {}
+        self._started_tracing = False
+
+    @contextmanager
+    def phase(self, name):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.memory:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record = {"time": time.perf_counter() - start}
+            if self.memory:
+                current, peak = tracemalloc.get_traced_memory()
+                record["memory"] = current - before
+                record["peak"] = peak - before
+            # una fase repetida (p. ej. dos escrituras) acumula
+            if name in self.phases:
+                for key, val in record.items():
+                    self.phases[name][key] = self.phases[name].get(key, 0) + val
+            else:
+                self.phases[name] = record
+            if self.callback is not None:
+                self.callback(name, record)
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def as_dict(self):
+        return {
+            "phases": self.phases,
+            "size": self.size,
+            "total_time": sum(p["time"] for p in self.phases.values()),
+        }
+
+
+def pulp_model_size(model, variables):
+    return {
+        "variables": sum(len(family) for family in variables),
+        "constraints": len(model.constraints),
+        "nonzeros": sum(len(c) for c in model.constraints.values()),
+    }
+
+
+@contextmanager
+def instrument_pulp(model, solver, stats):
+    """
+    Separa model.solve(solver) de PULP_CBC_CMD en "write_mps", "cbc" y
+    "read_solution" envolviendo los métodos de esta instancia del modelo y
+    del solver: CBC es el tiempo entre el fin de la escritura y el inicio
+    de la lectura de la solución.
+    """
+    written = []
+
+    def write(fn):
+        def wrapper(*args, **kwargs):
+            with stats.phase("write_mps"):
+                out = fn(*args, **kwargs)
+            written.append(time.perf_counter())
+            return out
+
+        return wrapper
+
+    def read(fn):
+        def wrapper(*args, **kwargs):
+            if written:
+                record = {"time": time.perf_counter() - written[-1]}
+                if stats.memory and resource is not None:
+                    # pico de toda la vida del proceso, no de esta fase
+                    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+                    record["children_peak_rss_kb"] = usage.ru_maxrss
+                stats.phases["cbc"] = record
+                if stats.callback is not None:
+                    stats.callback("cbc", record)
+            with stats.phase("read_solution"):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    wrapped = [
+        (model, "writeMPS", write),
+        (model, "writeLP", write),
+        (solver, "readsol_MPS", read),
+    ]
+    for obj, attr, wrap in wrapped:
+        setattr(obj, attr, wrap(getattr(obj, attr)))
+    try:
+        yield
+    finally:
+        for obj, attr, _ in wrapped:
+            obj.__dict__.pop(attr, None)
@@ -0,0 +1,118 @@
+# core/warm_start.py
+
+import numpy as np
+
+from scheduler.config.settings import TURN_HOURS
+from scheduler.core.domain import as_request
+from scheduler.core.matrix import FAMILIES
+from scheduler.core.restrictions import full_day, rest2days
+from scheduler.core.solution import assigned_cells
+
+
+def start_values(source, schedule_request, restrictions=None):
+    """
+    Valores iniciales de todas las variables del modelo a partir de una
+    asignación previa. Se descartan las celdas que ya no son válidas
+    (trabajador eliminado, no disponible, noche→mañana o exceso de horas)
+    para que CBC acepte el punto de partida.
+    restrictions: las del modelo que se va a resolver. Con las versiones
+    tight (TIGHT_RESTRICTIONS) y_full vale 1 ya con todos los turnos del
+    día, y free2 se deja en una sola ventana por trabajador, porque
+    free2[d] + free2[d+1] + work[d+1] <= 1 no admite dos seguidas.
+    Devuelve {familia: {clave: valor}} con las mismas claves que solve_schedule.
+    """
+    restrictions = restrictions or ()
+    request = as_request(schedule_request)
+    workers = request.workers
+    a = request.available.tolist()
+    m = request.demand_matrix.tolist()
+    days = request.days
+    shifts = request.shifts
+    cells = assigned_cells(source)
+
+    x = {}
+    for i, w in enumerate(workers):
+        hours = 0
+        for j, d in enumerate(days):
+            for k, t in enumerate(shifts):
+                on = (w.id, d, t) in cells
+                if on and a[i][j][k] == 0:
+                    on = False
+                # descanso noche → mañana
+                if on and t == 0 and x.get((w.id, d - 1, 3)) == 1:
+                    on = False
+                if on and hours + TURN_HOURS[t] > w.max_hours:
+                    on = False
+                if on:
+                    hours += TURN_HOURS[t]
+                x[(w.id, d, t)] = 1 if on else 0
+
+    deficit, z = {}, {}
+    for j, d in enumerate(days):
+        for k, t in enumerate(shifts):
+            cover = sum(x[(w.id, d, t)] for w in workers)
+            deficit[(d, t)] = max(0, m[j][k] - cover)
+            z[(d, t)] = 1 if cover == 0 else 0
+
+    # mismo umbral que Evaluator.full_limit
+    tight = full_day.add_full_day_constraints_tight in restrictions
+    full_limit = len(shifts) - 1 if tight else len(shifts)
+    y_full, y_split_MT, y_split_MN, y_split_MnN, work = {}, {}, {}, {}, {}
+    for w in workers:
+        for d in days:
+            s = {t: x.get((w.id, d, t), 0) for t in (0, 1, 2, 3)}
+            n = sum(x[(w.id, d, t)] for t in shifts)
+            y_full[(w.id, d)] = max(0, n - full_limit)
+            y_split_MT[(w.id, d)] = max(0, s[0] + s[2] - s[1] - 1)
+            y_split_MN[(w.id, d)] = max(0, s[1] + s[3] - s[2] - 1)
+            y_split_MnN[(w.id, d)] = max(0, s[0] + s[3] - 1)
+            work[(w.id, d)] = 1 if n > 0 else 0
+
+    one_window = rest2days.add_rest2days_constraints_tight in restrictions
+    free2, viol_rest, viol_max = {}, {}, {}
+    for w in workers:
+        found = False
+        for i, d in enumerate(days):
+            nxt = days[(i + 1) % len(days)]
+            free = 1 - max(work[(w.id, d)], work[(w.id, nxt)])
+            if one_window and found:
+                free = 0
+            found = found or free == 1
+            free2[(w.id, d)] = free
+        viol_rest[w.id] = 0 if any(free2[(w.id, d)] for d in days) else 1
+        viol_max[w.id] = 0
+
+    return {
+        "x": x,
+        "deficit": deficit,
+        "y_full": y_full,
+        "y_split_MT": y_split_MT,
+        "y_split_MN": y_split_MN,
+        "y_split_MnN": y_split_MnN,
+        "z": z,
+        "work": work,
+        "free2": free2,
+        "viol_rest": viol_rest,
+        "viol_max": viol_max,
+    }
+
+
+def set_initial_values(variables, values):
+    """variables: tupla de build_variables; values: salida de start_values."""
+    for name, family in zip(FAMILIES, variables):
+        start = values[name]
+        for key, var in family.items():
+            var.setInitialValue(start[key])
+
+
+def start_vector(index, values):
+    """Mismos valores que start_values, como vector por columna de VariableIndex."""
+    v = np.zeros(index.n_cols)
+    for name in FAMILIES:
+        start = values[name]
+        cols = getattr(index, name).ravel()
+        keys = index.keys(name)
+        if getattr(index, name).ndim == 1:
+            keys = [k[0] for k in keys]
+        v[cols] = [start[k] for k in keys]
+    return v
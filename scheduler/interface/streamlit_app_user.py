@@ -1,3 +1,4 @@
+import os
 import sys
 import threading
 import time
@@ -21,16 +22,28 @@ from scheduler.config.constants import (
     SHIFT_TO_IDX,
     SHIFT_UI_NAMES,
 )
-from scheduler.config.settings import SOLVER_TIME_LIMIT, TURN_HOURS
-from scheduler.core.solve import solve_schedule
+from scheduler.config.settings import (
+    APP_SOLVER_GAP_REL,
+    SOLVER_CUTS,
+    SOLVER_HEURISTICS,
+    SOLVER_MAX_NODES,
+    SOLVER_THREADS,
+    SOLVER_TIME_LIMIT,
+)
+from scheduler.core.backends import CUT_LEVELS, SolverOptions
+from scheduler.core.cbc import CbcProgress
+from scheduler.core.evaluate import HARD_RULES, Evaluator
+from scheduler.core.heuristic import solve_heuristic
+from scheduler.core.session import ScheduleSession
+from scheduler.core.solution import ScheduleSolution
 from scheduler.interface.utils import (
-    day_worker_matrix,
-    hours_per_worker,
-    result_to_df,
-    schedule_db_to_df,
-    schedule_pivot,
+    matrix_css,
+    stats_to_df,
+    violations_to_df,
 )
+from scheduler.interface.views import ViewCache
 from scheduler.services.builder import RequestBuilder
+from scheduler.services.cache import SolveCache, request_key
 from scheduler.services.repository import SchedulerRepository
 
 
@@ -52,6 +65,15 @@ def pastel_colors(names):
     return colors
 
 
+def progress_text(progress):
+    if progress.incumbent is None:
+        return "Buscando un primer horario..."
+    text = f"Mejor horario: {progress.incumbent:.1f}"
+    if progress.bound is not None:
+        text += f" · Cota: {progress.bound:.1f} · Gap: {100 * progress.gap:.1f}%"
+    return text
+
+
 # ------------------------------------------
 # Configuración inicial
 # ------------------------------------------
@@ -59,6 +81,7 @@ st.set_page_config(page_title="Generador de Horarios", layout="wide")
 st.title("🧮 Generador de Horarios")
 
 repo = SchedulerRepository()
+solve_cache = SolveCache(str(Path(repo.db_path).with_name("solve_cache.db")))
 
 
 # -------------------------
@@ -83,7 +106,7 @@ def save_one_worker(name: str, max_hours: int):
         max_id = max([w.get("id", 0) for w in workers], default=0)
         workers.append({"id": max_id + 1, "name": name, "max_hours": max_hours})
 
-    repo.save_workers(workers)
+    repo.save_workers(workers, mode="diff")
 
 
 def normalize_cell(x):
@@ -125,7 +148,7 @@ def save_no_availability(worker_id: int, no_av_rows: list[dict]):
             t_idx = SHIFT_TO_IDX[shift]
             av_dict.setdefault(worker_id, {}).setdefault(d_idx, {})[t_idx] = 0
 
-    repo.save_availability(av_dict)
+    repo.save_availability(av_dict, mode="diff")
 
 
 def worker_no_availability_to_df(availability: dict, worker_id: int) -> pd.DataFrame:
@@ -180,7 +203,7 @@ def replace_worker_no_availability(
             t_idx = SHIFT_TO_IDX[shift]
             av_dict.setdefault(worker_id, {}).setdefault(d_idx, {})[t_idx] = 0
 
-    repo.save_availability(av_dict)
+    repo.save_availability(av_dict, mode="diff")
 
 
 def build_full_demand_df(demand_dict):
@@ -351,7 +374,7 @@ with st.expander("🛠️ Modificar / eliminar un trabajador", expanded=False):
                             w["name"] = upd_name
                             w["max_hours"] = int(upd_max_hours)
                             break
-                    repo.save_workers(workers)
+                    repo.save_workers(workers, mode="diff")
                     st.success("Datos del trabajador actualizados.")
                     st.rerun()
 
@@ -397,13 +420,13 @@ with st.expander("🛠️ Modificar / eliminar un trabajador", expanded=False):
         ):
             # 1) eliminar de workers
             new_workers = [w for w in workers if w["id"] != selected_wid]
-            repo.save_workers(new_workers)
+            repo.save_workers(new_workers, mode="diff")
 
             # 2) eliminar su disponibilidad
             availability_all = repo.load_availability() or {}
             if selected_wid in availability_all:
                 availability_all.pop(selected_wid)
-                repo.save_availability(availability_all)
+                repo.save_availability(availability_all, mode="diff")
 
             # (opcional) podrías también invalidar el schedule guardado si depende de ese worker
             st.success("Trabajador eliminado.")
@@ -503,12 +526,12 @@ with col_save:
             # if int(min_val) != int(default_val):
             dem_dict.setdefault(d_idx, {})[t_idx] = int(min_val)
 
-        repo.save_demand(dem_dict)
+        repo.save_demand(dem_dict, mode="diff")
         st.success("Demanda guardada.")
 
 with col_clear:
     if st.button("🧹 Vaciar demanda", key="btn_clear_demand"):
-        repo.save_demand({})
+        repo.save_demand({}, mode="diff")
         st.warning("Demanda vaciada.")
 
 
@@ -524,20 +547,21 @@ demand = repo.load_demand() or {}
 loaded = repo.load_schedule()
 if loaded and workers and demand:
     request = RequestBuilder.from_dict(workers, availability, demand)
-    df_loaded = schedule_db_to_df(loaded, request)
+    views_loaded = st.session_state.setdefault("views_loaded", ViewCache())
+    view_loaded = views_loaded.get(loaded, request)
 
-    pivot_loaded = schedule_pivot(df_loaded.copy())
+    pivot_loaded = view_loaded.pivot().copy()
     pivot_loaded.index = pivot_loaded.index.map(IDX_TO_DAY)
     pivot_loaded.columns = pivot_loaded.columns.map(IDX_TO_SHIFT)
 
     st.subheader("📅 Horario guardado en base de datos")
     st.dataframe(pivot_loaded, use_container_width=True)
 
-    summary_loaded = hours_per_worker(df_loaded.copy(), TURN_HOURS)
+    summary_loaded = view_loaded.hours()
     st.subheader("🕒 Horas totales por trabajador")
     st.dataframe(summary_loaded, use_container_width=True)
 
-    matrix_loaded = day_worker_matrix(df_loaded.copy())
+    matrix_loaded = view_loaded.matrix().copy()
     matrix_loaded["Día"] = matrix_loaded["Día"].map(IDX_TO_DAY)
     matrix_loaded.rename(columns=IDX_TO_SHIFT, inplace=True)
 
@@ -549,77 +573,224 @@ if loaded and workers and demand:
     )
     st.dataframe(styled_loaded, use_container_width=True)
 
+    # Validación en vivo contra la petición actual (sin resolver nada)
+    with st.expander("✅ Validación"):
+        evaluator = Evaluator(request)
+        report = evaluator.evaluate(view_loaded.x)
+        c1, c2 = st.columns(2)
+        c1.metric("Objetivo", f"{report['objective']:.1f}")
+        c2.metric("Penalizaciones", len(report["violations"]))
+        if report["feasible"]:
+            st.success("Cumple disponibilidad, descanso noche→mañana y horas máximas.")
+        else:
+            broken = {v["rule"] for v in report["violations"]} & set(HARD_RULES)
+            st.error(f"Incumple reglas duras: {', '.join(sorted(broken))}")
+        if report["violations"]:
+            st.dataframe(
+                violations_to_df(report["violations"], request),
+                use_container_width=True,
+            )
+
     st.divider()
 else:
     st.info("No hay horario guardado todavía (o faltan datos).")
 
 # Crear nuevo
-if st.button("🚀 Crear horario"):
+use_previous = st.checkbox(
+    "Partir del horario anterior (más rápido tras pequeños cambios)",
+    value=True,
+    key="chk_warm_start",
+)
+# El ScheduleSession guarda el modelo PuLP entero (variables, filas y
+# objetivo): ~18 MB con 200 trabajadores frente a ~16 KB de la solución
+# compacta. Sólo se conserva entre ejecuciones si se va a reutilizar.
+if not use_previous:
+    st.session_state.pop("schedule_session", None)
+
+with st.expander("⚙️ Opciones del solver"):
+    c1, c2, c3 = st.columns(3)
+    opt_time = c1.number_input(
+        "Tiempo máximo (s)", min_value=5, value=SOLVER_TIME_LIMIT, step=5
+    )
+    opt_threads = c2.number_input(
+        "Hilos (0 = los de CBC)",
+        min_value=0,
+        max_value=os.cpu_count() or 1,
+        value=SOLVER_THREADS or 0,
+    )
+    opt_gap = c3.number_input(
+        "Gap relativo (%)",
+        min_value=0.0,
+        max_value=20.0,
+        value=100 * APP_SOLVER_GAP_REL,
+        step=0.1,
+        help="Parar cuando la solución esté a este % del óptimo",
+    )
+    c4, c5, c6 = st.columns(3)
+    opt_nodes = c4.number_input(
+        "Máx. nodos (0 = sin límite)", min_value=0, value=SOLVER_MAX_NODES or 0
+    )
+    opt_cuts = c5.selectbox("Cortes", CUT_LEVELS, index=CUT_LEVELS.index(SOLVER_CUTS))
+    opt_heuristics = c6.checkbox("Heurísticas", value=SOLVER_HEURISTICS)
+
+solver_options = SolverOptions(
+    time_limit=int(opt_time),
+    gap=opt_gap / 100,
+    threads=int(opt_threads) or None,
+    max_nodes=int(opt_nodes) or None,
+    cuts=opt_cuts,
+    heuristics=opt_heuristics,
+)
+
+# Un solo solve a la vez: mientras haya uno en curso el botón no hace nada
+solve_running = "solve_job" in st.session_state
+if st.button("🚀 Crear horario", disabled=solve_running):
     if not workers:
         st.error("Faltan trabajadores.")
     elif not demand:
         st.error("Falta demanda mínima.")
     else:
         request = RequestBuilder.from_dict(workers, availability, demand)
+
+        # Si ya hay un modelo construido en esta sesión, se aplican sólo los
+        # cambios y se resuelve desde la última solución; si no, se parte
+        # del horario guardado en BD
+        session = st.session_state.get("schedule_session")
+        reuse = (
+            use_previous
+            and session is not None
+            and session.days == request.days
+            and session.shifts == request.shifts
+        )
+        warm_start = (loaded or None) if use_previous else None
+        cache_key = request_key(request, options=solver_options)
+
         # Añadir un spinner mientras se resuelve
         # with st.spinner("Generando horario..."):
         #     result = solve_schedule(request)
         # st.session_state["result"] = result
         # st.session_state["request"] = request
-        # Contenedor y placeholders UI
-        status_ph = st.empty()
-        progress_ph = st.empty()
-
-        # Estado compartido con el thread
-        done = threading.Event()
-        result_holder = {"result": None, "error": None}
+        # Estado compartido con el thread. Se guarda en session_state porque
+        # el botón de parar provoca un rerun mientras el solver sigue vivo
+        job = {
+            "done": threading.Event(),
+            "progress": CbcProgress(),
+            "start": time.time(),
+            "time_limit": solver_options.time_limit,
+            "request": request,
+            "result": None,
+            "error": None,
+            "session": None,
+            "keep_session": use_previous,
+        }
 
         def run_solver():
             try:
-                result_holder["result"] = solve_schedule(request)
+                # mismo contenido ya resuelto: se devuelve sin llamar al solver
+                cached = solve_cache.get(cache_key)
+                if cached is not None:
+                    # la última solución de la sesión no es la de la caché:
+                    # no se conserva para no partir de otro horario
+                    job["result"] = cached
+                    return
+                if reuse:
+                    # la sesión es compartida entre reruns: se edita y
+                    # resuelve con su lock
+                    with session.lock:
+                        session.options = solver_options
+                        session.update(request)
+                        raw = session.solve(progress=job["progress"])
+                    job["session"] = session
+                else:
+                    new_session = ScheduleSession(request, options=solver_options)
+                    raw = new_session.solve(
+                        warm_start=warm_start, progress=job["progress"]
+                    )
+                    job["session"] = new_session
+                # en session_state sólo se guarda la solución compacta
+                job["result"] = ScheduleSolution.from_result(raw, request)
+                # sólo si CBC alcanzó el gap: parado a mano o por el límite
+                # de tiempo no es el resultado de estas opciones
+                if job["result"].gap_reached and not job["progress"].stopped:
+                    solve_cache.put(cache_key, job["result"])
             except Exception as e:
-                result_holder["error"] = e
+                job["error"] = e
             finally:
-                done.set()
+                job["done"].set()
 
         # Lanzar solver en background thread
         t = threading.Thread(target=run_solver, daemon=True)
         t.start()
+        st.session_state["solve_job"] = job
 
-        # Barra de progreso “fake” hasta SOLVER_TIME_LIMIT
-        start = time.time()
-        progress = progress_ph.progress(0, text="Generando horario...")
-        progress_value = 0
-
-        # animación normal mientras no termina
-        while not done.is_set():
-            elapsed = time.time() - start
 
-            if elapsed < SOLVER_TIME_LIMIT:
-                frac = elapsed / SOLVER_TIME_LIMIT
-                progress_value = min(int(frac * 100), 99)
-                progress_ph.progress(
-                    progress_value, text=f"Generando horario... {int(elapsed)}s"
-                )
-            else:
-                # tiempo máximo alcanzado
-                progress_value = 99
-                progress_ph.progress(99, text="Terminando...")
-
-            time.sleep(0.15)
-
-        # Si terminó: animación rápida hasta 100%
-        current = progress_ph.progress(99, text="Finalizando...")
-        for p in range(progress_value, 101):
-            progress_ph.progress(p, text="Finalizando...")
-            time.sleep(0.01)
-
-        # Mostrar estado final
-        if result_holder["error"] is not None:
-            st.error(f"Error en el solver: {result_holder['error']}")
+# Borrador sin solver: heurística voraz + búsqueda local, al instante
+if st.button("⚡ Borrador rápido", help="Sin solver: no garantiza el óptimo"):
+    if not workers:
+        st.error("Faltan trabajadores.")
+    elif not demand:
+        st.error("Falta demanda mínima.")
+    else:
+        request = RequestBuilder.from_dict(workers, availability, demand)
+        st.session_state["result"] = solve_heuristic(request, compact=True)
+        st.session_state["request"] = request
+
+
+# Solve en curso (también tras el rerun que provoca el botón de parar)
+job = st.session_state.get("solve_job")
+if job is not None:
+    if st.button("⏹️ Parar y usar el mejor horario encontrado", key="btn_stop"):
+        job["progress"].stop()
+
+    # Contenedor y placeholders UI
+    status_ph = st.empty()
+    progress_ph = st.empty()
+    live_ph = st.empty()
+
+    # Barra de progreso por tiempo hasta el tiempo máximo elegido; el texto
+    # muestra la mejor solución, la cota y el gap que va dando CBC
+    progress_value = 0
+
+    # animación normal mientras no termina
+    while not job["done"].is_set():
+        elapsed = time.time() - job["start"]
+
+        if job["progress"].stopped:
+            progress_value = 99
+            progress_ph.progress(99, text="Parando...")
+        elif elapsed < job["time_limit"]:
+            frac = elapsed / job["time_limit"]
+            progress_value = min(int(frac * 100), 99)
+            progress_ph.progress(
+                progress_value, text=f"Generando horario... {int(elapsed)}s"
+            )
+        else:
+            # tiempo máximo alcanzado
+            progress_value = 99
+            progress_ph.progress(99, text="Terminando...")
+        live_ph.caption(progress_text(job["progress"]))
+
+        time.sleep(0.15)
+
+    # Si terminó: animación rápida hasta 100%
+    for p in range(progress_value, 101):
+        progress_ph.progress(p, text="Finalizando...")
+        time.sleep(0.01)
+    del st.session_state["solve_job"]
+
+    # Mostrar estado final
+    if job["error"] is not None:
+        st.error(f"Error en el solver: {job['error']}")
+    else:
+        st.session_state["result"] = job["result"]
+        st.session_state["request"] = job["request"]
+        if job["keep_session"] and job["session"] is not None:
+            st.session_state["schedule_session"] = job["session"]
+        else:
+            st.session_state.pop("schedule_session", None)
+        if job["progress"].stopped:
+            status_ph.success("Parado: se usa el mejor horario encontrado ✅")
         else:
-            st.session_state["result"] = result_holder["result"]
-            st.session_state["request"] = request
             status_ph.success("Horario generado ✅")
 
 # Mostrar resultado si existe
@@ -627,56 +798,83 @@ if "result" in st.session_state and "request" in st.session_state:
     result = st.session_state["result"]
     request = st.session_state["request"]
 
-    st.subheader(f"Estado solver: {result['status']}")
-    df_raw = result_to_df(result, request)
-    pivot = schedule_pivot(df_raw)
+    st.subheader(f"Estado solver: {result.status}")
+    if result.stats:
+        with st.expander("⏱️ Tiempos del solver"):
+            size = result.stats["size"]
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric("Total (s)", f"{result.stats['total_time']:.2f}")
+            c2.metric("Variables", size.get("variables", 0))
+            c3.metric("Restricciones", size.get("constraints", 0))
+            c4.metric("No ceros", size.get("nonzeros", 0))
+            st.dataframe(stats_to_df(result.stats), use_container_width=True)
+    # Vistas calculadas una vez por solución; las ediciones las actualizan
+    views = st.session_state.setdefault("views", ViewCache())
+    view = views.get(result, request)
+    pivot = view.pivot()
 
     st.subheader("📅 Horario generado")
     st.dataframe(pivot, use_container_width=True)
 
-    summary = hours_per_worker(df_raw.copy(), TURN_HOURS)
+    summary = view.hours()
     st.subheader("🕒 Horas totales por trabajador")
     st.dataframe(summary, use_container_width=True)
 
-    matrix = day_worker_matrix(df_raw.copy())
-    matrix["Día"] = matrix["Día"].map(IDX_TO_DAY)
-    matrix.rename(columns=IDX_TO_SHIFT, inplace=True)
+    def labelled_matrix():
+        matrix = view.matrix().copy()
+        matrix["Día"] = matrix["Día"].map(IDX_TO_DAY)
+        matrix.rename(columns=IDX_TO_SHIFT, inplace=True)
+        return matrix
+
+    def styled_matrix():
+        matrix = labelled_matrix()
+        WORKER_COLORS = pastel_colors(matrix["Trabajador"].unique())
+        css = matrix_css(
+            matrix,
+            WORKER_COLORS,
+            DAY_COLORS,
+            yes_css="background-color:rgb(190, 247, 179)",
+            no_css="background-color:rgb(248, 185, 185)",
+        )
+        return matrix.style.apply(lambda _: css, axis=None)
 
     st.subheader("📋 Detalle Día × Trabajador")
-    WORKER_COLORS = pastel_colors(matrix["Trabajador"].unique())
-
-    turno_cols = matrix.columns[2:]
-
-    def color_turno(v):
-        if v == "Sí":
-            return "background-color:rgb(190, 247, 179)"
-        elif v == "No":
-            return "background-color:rgb(248, 185, 185)"
-        return ""
-
-    def color_dia(col):
-        return [DAY_COLORS.get(v, "") for v in col]
-
-    def color_trabajador(col):
-        return [WORKER_COLORS.get(v, "") for v in col]
-
-    styled = (
-        matrix.style
-        # Día
-        .apply(color_dia, subset=["Día"])
-        # Trabajador
-        .apply(color_trabajador, subset=["Trabajador"])
-        # Turnos
-        .applymap(color_turno, subset=turno_cols)
-    )
-
-    st.dataframe(styled, use_container_width=True)
+    st.dataframe(view.memo("matrix_styled", styled_matrix), use_container_width=True)
+
+    # Edición de una celda: sólo se recalcula lo que cambia
+    with st.expander("✏️ Editar una asignación"):
+        names = {w.id: w.name for w in request.workers}
+        c1, c2, c3 = st.columns(3)
+        edit_worker = c1.selectbox(
+            "Trabajador", list(names), format_func=names.get, key="edit_worker"
+        )
+        edit_day = c2.selectbox(
+            "Día", request.days, format_func=IDX_TO_DAY.get, key="edit_day"
+        )
+        edit_shift = c3.selectbox(
+            "Turno", request.shifts, format_func=IDX_TO_SHIFT.get, key="edit_shift"
+        )
+        i = view.worker_pos[edit_worker]
+        j, k = view.day_pos[edit_day], view.shift_pos[edit_shift]
+        assigned = bool(view.x[i, j, k])
+        label = "Quitar turno" if assigned else "Asignar turno"
+        if st.button(label, key="edit_apply"):
+            view.set_cell(edit_worker, edit_day, edit_shift, not assigned)
+            st.rerun()
+        if view.version:
+            objective = Evaluator(request).objective(view.x)
+            st.metric(
+                "Objetivo con las ediciones",
+                f"{objective:.1f}",
+                delta=f"{objective - result.objective:.1f}",
+                delta_color="inverse",
+            )
 
     col_save, col_dl = st.columns([1, 1])
 
     with col_save:
         if st.button("💾 Guardar horario en base de datos"):
-            repo.save_schedule_from_result(result)
+            repo.save_schedule(view.rows())
             st.success("Horario guardado en base de datos.")
 
     with col_dl:
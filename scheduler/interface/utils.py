@@ -1,29 +1,46 @@
+import numpy as np
 import pandas as pd
 
 from scheduler.config.constants import (
     IDX_TO_DAY,
     IDX_TO_SHIFT,
 )
+from scheduler.core.solution import assignment_array
+from scheduler.interface.views import join_names
 
 
 def result_to_df(result, schedule_request):
-    variables = result["variables"]
-    x = variables["x"]
-    workers = {w.id: w.name for w in schedule_request.workers}
-
-    rows = []
-    for (w, d, t), val in x.items():
-        if val.value() == 1:
-            rows.append({"Día": d, "Turno": t, "Trabajador": workers[w]})
-    df = pd.DataFrame(rows)
-    return df
+    # result: dict de solve_schedule o ScheduleSolution
+    return assignment_df(assignment_array(result, schedule_request), schedule_request)
+
+
+def assignment_df(x, schedule_request):
+    """
+    x: array (workers, days, shifts) de assignment_array
+    return: dataframe Día | Turno | Trabajador, en orden (trabajador, día, turno)
+    """
+    names = np.array([w.name for w in schedule_request.workers], dtype=object)
+    i, j, k = np.nonzero(x)
+    return pd.DataFrame(
+        {
+            "Día": np.asarray(schedule_request.days)[j],
+            "Turno": np.asarray(schedule_request.shifts)[k],
+            "Trabajador": names[i],
+        }
+    )
 
 
 def schedule_pivot(df):
-    # Agrupar trabajadores en un string
-    agg = df.groupby(["Día", "Turno"])["Trabajador"].apply(lambda x: ", ".join(x))
-    pivot = agg.unstack(fill_value="")
-    return pivot
+    # Día × Turno con los trabajadores de cada celda separados por comas
+    # (mismo kernel que ScheduleView.pivot); sólo los días y turnos con algo
+    days, j = np.unique(df["Día"].to_numpy(), return_inverse=True)
+    shifts, k = np.unique(df["Turno"].to_numpy(), return_inverse=True)
+    cells = join_names(df["Trabajador"].to_numpy(), j, k, (len(days), len(shifts)))
+    return pd.DataFrame(
+        cells,
+        index=pd.Index(days, name="Día"),
+        columns=pd.Index(shifts, name="Turno"),
+    )
 
 
 def schedule_db_to_pivot(rows, request):
@@ -36,20 +53,9 @@ def schedule_db_to_pivot(rows, request):
     if not rows:
         return None
 
-    # map worker_id → name
-    workers = {w.id: w.name for w in request.workers}
-
-    df = pd.DataFrame(rows)
-    df["Trabajador"] = df["worker_id"].map(workers)
-    df["Día"] = df["day"].map(IDX_TO_DAY)
-    df["Turno"] = df["shift"].map(IDX_TO_SHIFT)
-
-    pivot = (
-        df.groupby(["Día", "Turno"])["Trabajador"]
-        .apply(lambda x: ", ".join(x))
-        .unstack(fill_value="")
-    )
-
+    pivot = schedule_pivot(schedule_db_to_df(rows, request))
+    pivot.index = pivot.index.map(IDX_TO_DAY)
+    pivot.columns = pivot.columns.map(IDX_TO_SHIFT)
     return pivot
 
 
@@ -76,17 +82,14 @@ def day_worker_matrix(df_raw, sort_by_worker=False):
     df_raw:
     Día | Turno | Trabajador
     """
-    # Crear columna con valor "Sí"
-    df_raw["Asignado"] = "Sí"
-
-    # Pivot → filas (Día, Trabajador), columnas (Turno)
-    matrix = df_raw.pivot_table(
-        index=["Día", "Trabajador"],
-        columns="Turno",
-        values="Asignado",
-        aggfunc=lambda x: "Sí",
-        fill_value="No",
+    # Pivot → filas (Día, Trabajador), columnas (Turno), "Sí" si está asignado
+    assigned = df_raw.drop_duplicates(["Día", "Trabajador", "Turno"])
+    matrix = (
+        assigned.assign(Asignado="Sí")
+        .set_index(["Día", "Trabajador", "Turno"])["Asignado"]
+        .unstack("Turno", fill_value="No")
     )
+    matrix.columns.name = "Turno"
 
     # Ordenar índices y columnas
     matrix = matrix.sort_index()
@@ -113,3 +116,56 @@ def schedule_db_to_df(rows, request):
     df["Día"] = df["day"]
     df["Turno"] = df["shift"]
     return df[["Día", "Turno", "Trabajador"]]
+
+
+def stats_to_df(stats):
+    """
+    stats: bloque "stats" de solve_schedule / ScheduleSession.solve
+    return: dataframe Fase | Tiempo (s) | % | Memoria (MB)
+    """
+    phases = stats["phases"]
+    total = stats["total_time"] or 1
+    df = pd.DataFrame(
+        {
+            "Fase": list(phases),
+            "Tiempo (s)": [p["time"] for p in phases.values()],
+        }
+    )
+    df["%"] = (100 * df["Tiempo (s)"] / total).round(1)
+    if any("memory" in p for p in phases.values()):
+        df["Memoria (MB)"] = [p.get("memory", 0) / 2**20 for p in phases.values()]
+    return df
+
+
+def violations_to_df(violations, request):
+    """
+    violations: lista de Evaluator.violations / evaluate()["violations"]
+    return: dataframe Regla | Trabajador | Día | Turno | Cantidad | Penalización
+    """
+    workers = {w.id: w.name for w in request.workers}
+    df = pd.DataFrame(
+        {
+            "Regla": [v["rule"] for v in violations],
+            "Trabajador": [workers.get(v["worker"], "") for v in violations],
+            "Día": [IDX_TO_DAY.get(v["day"], "") for v in violations],
+            "Turno": [IDX_TO_SHIFT.get(v["shift"], "") for v in violations],
+            "Cantidad": [v["amount"] for v in violations],
+            "Penalización": [v["penalty"] for v in violations],
+        }
+    )
+    return df
+
+
+def matrix_css(matrix, worker_colors, day_colors, yes_css, no_css):
+    """
+    CSS de cada celda de day_worker_matrix / ScheduleView.matrix() (ya con
+    nombres de día y turno), para Styler.apply(..., axis=None): se calcula
+    toda la tabla de una vez en lugar de una llamada por celda.
+    """
+    css = pd.DataFrame("", index=matrix.index, columns=matrix.columns)
+    css["Día"] = matrix["Día"].map(day_colors).fillna("")
+    css["Trabajador"] = matrix["Trabajador"].map(worker_colors).fillna("")
+    turns = matrix.columns[2:]
+    values = matrix[turns].to_numpy()
+    css[turns] = np.select([values == "Sí", values == "No"], [yes_css, no_css], "")
+    return css
@@ -0,0 +1,193 @@
+# interface/views.py
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from scheduler.config.settings import TURN_HOURS
+from scheduler.core.domain import as_request
+from scheduler.core.solution import assignment_array
+
+
+def join_names(names, j, k, shape):
+    """
+    Celdas (D, T) con los nombres de cada (j, k) separados por comas, en el
+    orden en que llegan. Una ordenación estable agrupa las celdas y sólo se
+    hace un join por celda con nombres (no un groupby de pandas).
+    """
+    cells = np.full(shape, "", dtype=object)
+    flat = np.asarray(j, dtype=int) * shape[1] + np.asarray(k, dtype=int)
+    if not len(flat):
+        return cells
+    order = np.argsort(flat, kind="stable")
+    flat = flat[order]
+    names = np.asarray(names, dtype=object)[order]
+    starts = np.flatnonzero(np.r_[True, flat[1:] != flat[:-1]])
+    for cell, group in zip(flat[starts], np.split(names, starts[1:])):
+        cells.flat[cell] = ", ".join(group)
+    return cells
+
+
+class ScheduleView:
+    """
+    Vistas de la página de resultados a partir de x (W, D, T):
+    - pivot(): día × turno con los nombres asignados
+    - hours(): horas por trabajador
+    - matrix(): detalle día × trabajador con "Sí" / "No" por turno
+    Los textos de cada celda del pivot y las horas se mantienen como
+    arrays; set_cell sólo recalcula la celda y el trabajador afectados.
+    Los DataFrames (y lo que se guarde con memo) se construyen al pedirlos
+    y se reutilizan hasta la siguiente edición.
+    """
+
+    def __init__(self, x, schedule_request):
+        request = as_request(schedule_request)
+        self.x = np.array(x, dtype=np.uint8)
+        self.worker_ids = list(request.worker_ids)
+        self.names = np.array([w.name for w in request.workers], dtype=object)
+        self.days = list(request.days)
+        self.shifts = list(request.shifts)
+        self.worker_pos = request.worker_pos
+        self.day_pos = request.day_pos
+        self.shift_pos = request.shift_pos
+        self.turn_hours = np.array([TURN_HOURS[t] for t in self.shifts])
+
+        i, j, k = np.nonzero(self.x)
+        self.cells = join_names(self.names[i], j, k, (len(self.days), len(self.shifts)))
+        self.worker_hours = self.x.sum(axis=1) @ self.turn_hours
+        self.version = 0
+        self._memo = {}
+
+    @classmethod
+    def from_result(cls, result, schedule_request):
+        """result: dict de solve_schedule, ScheduleSolution o filas de BD."""
+        return cls(assignment_array(result, schedule_request), schedule_request)
+
+    def _join_cell(self, j, k):
+        self.cells[j, k] = ", ".join(self.names[self.x[:, j, k] == 1])
+
+    # -----------------------------------------
+    # Edición
+    # -----------------------------------------
+    def set_cell(self, worker_id, day, shift, value):
+        """Asigna (1) o quita (0) un turno; devuelve si ha cambiado algo."""
+        i = self.worker_pos[worker_id]
+        j, k = self.day_pos[day], self.shift_pos[shift]
+        value = 1 if value else 0
+        if self.x[i, j, k] == value:
+            return False
+        self.x[i, j, k] = value
+        self._join_cell(j, k)
+        self.worker_hours[i] += self.turn_hours[k] if value else -self.turn_hours[k]
+        self.version += 1
+        self._memo.clear()
+        return True
+
+    def memo(self, name, build):
+        """build() guardado hasta la siguiente edición (p. ej. estilos)."""
+        if name not in self._memo:
+            self._memo[name] = build()
+        return self._memo[name]
+
+    # -----------------------------------------
+    # Vistas
+    # -----------------------------------------
+    def pivot(self):
+        """Día × Turno con los trabajadores separados por comas."""
+        return self.memo(
+            "pivot",
+            lambda: pd.DataFrame(
+                self.cells,
+                index=pd.Index(self.days, name="Día"),
+                columns=pd.Index(self.shifts, name="Turno"),
+            ),
+        )
+
+    def hours(self):
+        """Trabajador | Horas de quien tiene algún turno, de más a menos horas."""
+
+        def build():
+            worked = np.flatnonzero(self.x.any(axis=(1, 2)))
+            df = pd.DataFrame(
+                {"Trabajador": self.names[worked], "Horas": self.worker_hours[worked]}
+            )
+            return df.sort_values("Horas", ascending=False, kind="stable").reset_index(
+                drop=True
+            )
+
+        return self.memo("hours", build)
+
+    def matrix(self):
+        """Día | Trabajador | un "Sí"/"No" por turno, para cada par con turnos."""
+
+        def build():
+            w, d = np.nonzero(self.x.any(axis=2))
+            # por día y, dentro del día, por nombre
+            rank = np.argsort(np.argsort(self.names, kind="stable"), kind="stable")
+            order = np.lexsort((rank[w], d))
+            w, d = w[order], d[order]
+            df = pd.DataFrame(
+                {
+                    "Día": np.asarray(self.days)[d],
+                    "Trabajador": self.names[w],
+                }
+            )
+            flags = np.where(self.x[w, d] == 1, "Sí", "No")
+            for k, t in enumerate(self.shifts):
+                df[t] = flags[:, k]
+            return df
+
+        return self.memo("matrix", build)
+
+    def rows(self):
+        """Día | Turno | worker_id, para SchedulerRepository.save_schedule."""
+        i, j, k = np.nonzero(self.x)
+        return pd.DataFrame(
+            {
+                "Día": np.asarray(self.days)[j],
+                "Turno": np.asarray(self.shifts)[k],
+                "worker_id": np.asarray(self.worker_ids)[i],
+            }
+        )
+
+
+def view_key(x, schedule_request):
+    """Hash de la asignación y de los ejes/nombres con los que se muestra."""
+    request = as_request(schedule_request)
+    digest = hashlib.sha256(np.ascontiguousarray(x, dtype=np.uint8).tobytes())
+    for part in (
+        [(w.id, w.name) for w in request.workers],
+        request.days,
+        request.shifts,
+    ):
+        digest.update(repr(part).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ViewCache:
+    """
+    ScheduleView por solución (view_key), como st.cache_data: se guardan
+    las max_entries más recientes. Las ediciones con set_cell se hacen
+    sobre la vista guardada, así que se conservan al volver a la misma
+    solución.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._views = OrderedDict()
+
+    def get(self, result, schedule_request):
+        x = assignment_array(result, schedule_request)
+        key = view_key(x, schedule_request)
+        view = self._views.pop(key, None)
+        if view is None:
+            view = ScheduleView(x, schedule_request)
+        self._views[key] = view
+        while len(self._views) > self.max_entries:
+            self._views.popitem(last=False)
+        return view
+
+    def __len__(self):
+        return len(self._views)
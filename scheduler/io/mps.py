@@ -0,0 +1,168 @@
+# io/mps.py
+
+import os
+import tempfile
+from itertools import islice
+
+import numpy as np
+
+from scheduler.core.restrictions_manager import iter_rows
+
+CHUNK_ROWS = 20000  # filas por bloque
+CHUNK_COLS = 50000  # columnas por fichero temporal
+
+_INTORG = "    MARK      'MARKER'                 'INTORG'\n"
+_INTEND = "    MARK      'MARKER'                 'INTEND'\n"
+_TRIPLET = np.dtype([("col", np.int64), ("row", np.int64), ("coef", np.float64)])
+
+
+def _fmt(name, row, value):
+    return "    %-8s  %-8s  % .12e\n" % (name, row, value)
+
+
+def write_mps(
+    path,
+    index,
+    schedule_request,
+    c,
+    restrictions=None,
+    chunk_rows=CHUNK_ROWS,
+    chunk_cols=CHUNK_COLS,
+):
+    """
+    Escribe el modelo en MPS con el mismo formato y nombres normalizados
+    (MODEL, C0000000, X0000000, OBJ) que PuLP usa para PULP_CBC_CMD, sin construir
+    LpAffineExpression.
+
+    Las filas llegan de los generadores de restrictions_manager en bloques
+    de `chunk_rows`: la sección ROWS y RHS se escribe al vuelo y los
+    coeficientes se vuelcan a ficheros temporales por rango de columnas,
+    que luego se ordenan uno a uno para la sección COLUMNS.
+
+    Devuelve el índice de columna de cada variable en orden de escritura
+    (X0000000, X0000001, ...).
+    """
+    integer = index.integrality().astype(bool)
+
+    # PuLP escribe las columnas ordenadas por nombre de variable
+    names = np.array(index.names())
+    order = np.argsort(names, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    n_buckets = max(1, -(-index.n_cols // chunk_cols))
+
+    used = c != 0
+    rows = iter_rows(index, schedule_request, restrictions)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rows_path = os.path.join(tmp, "rows")
+        rhs_path = os.path.join(tmp, "rhs")
+        buckets = [os.path.join(tmp, f"cols_{b}") for b in range(n_buckets)]
+        handles = [open(b, "wb") for b in buckets]
+
+        n_rows = 0
+        with open(rows_path, "w") as f_rows, open(rhs_path, "w") as f_rhs:
+            while True:
+                chunk = list(islice(rows, chunk_rows))
+                if not chunk:
+                    break
+
+                sizes = [len(cols) for _, cols, _, _ in chunk]
+                triplets = np.empty(sum(sizes), dtype=_TRIPLET)
+                triplets["row"] = np.repeat(
+                    np.arange(n_rows, n_rows + len(chunk)), sizes
+                )
+                triplets["col"] = rank[
+                    np.fromiter(
+                        (col for _, cols, _, _ in chunk for col in cols),
+                        dtype=np.int64,
+                        count=len(triplets),
+                    )
+                ]
+                triplets["coef"] = np.fromiter(
+                    (v for _, _, coefs, _ in chunk for v in coefs),
+                    dtype=np.float64,
+                    count=len(triplets),
+                )
+                used[order[triplets["col"]]] = True
+
+                for r, (sense, _, _, rhs) in enumerate(chunk, start=n_rows):
+                    name = "C%07d" % r
+                    f_rows.write(f" {sense}  {name}\n")
+                    f_rhs.write(
+                        "    RHS       %-8s  % .12e\n" % (name, rhs if rhs != 0 else 0)
+                    )
+                n_rows += len(chunk)
+
+                bucket = triplets["col"] // chunk_cols
+                for b in np.unique(bucket):
+                    triplets[bucket == b].tofile(handles[b])
+
+        for h in handles:
+            h.close()
+
+        # Sólo aparecen las variables usadas en objetivo o restricciones
+        written = np.cumsum(used[order]) - 1
+
+        with open(path, "w") as f:
+            f.write("*SENSE:Minimize\n")
+            f.write("NAME          MODEL\n")
+            f.write("ROWS\n")
+            f.write(" N  OBJ\n")
+            _copy(rows_path, f)
+
+            f.write("COLUMNS\n")
+            for b, bucket_path in enumerate(buckets):
+                first = b * chunk_cols
+                last = min(first + chunk_cols, index.n_cols)
+                cols, rows_, coefs = _load_bucket(bucket_path)
+                starts = np.searchsorted(cols, np.arange(first, last + 1)).tolist()
+                rows_, coefs = rows_.tolist(), coefs.tolist()
+
+                for r in range(first, last):
+                    col = order[r]
+                    if not used[col]:
+                        continue
+                    name = "X%07d" % written[r]
+                    lo, hi = starts[r - first], starts[r - first + 1]
+                    lines = [
+                        _fmt(name, "C%07d" % rows_[k], coefs[k]) for k in range(lo, hi)
+                    ]
+                    if c[col] != 0:
+                        lines.append(_fmt(name, "OBJ", c[col]))
+                    if integer[col]:
+                        lines.insert(0, _INTORG)
+                        lines.append(_INTEND)
+                    f.write("".join(lines))
+
+            f.write("RHS\n")
+            _copy(rhs_path, f)
+
+            f.write("BOUNDS\n")
+            lb, ub = index.bounds()
+            for r in range(index.n_cols):
+                col = order[r]
+                if used[col] and integer[col] and lb[col] == 0 and ub[col] == 1:
+                    f.write(" BV BND       %-8s\n" % ("X%07d" % written[r]))
+            f.write("ENDATA\n")
+
+    return order[used[order]]
+
+
+def _load_bucket(path):
+    triplets = np.fromfile(path, dtype=_TRIPLET)
+    triplets = triplets[np.lexsort((triplets["row"], triplets["col"]))]
+    cols, rows, coefs = triplets["col"], triplets["row"], triplets["coef"]
+
+    # PuLP suma los coeficientes repetidos de una misma variable en una fila
+    new_key = (cols[1:] != cols[:-1]) | (rows[1:] != rows[:-1])
+    if not new_key.all():
+        starts = np.flatnonzero(np.r_[True, new_key])
+        return cols[starts], rows[starts], np.add.reduceat(coefs, starts)
+    return cols, rows, coefs
+
+
+def _copy(src, dst, block=1 << 20):
+    with open(src) as f:
+        while data := f.read(block):
+            dst.write(data)
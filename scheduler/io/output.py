@@ -1,18 +1,17 @@
 # io/output.py
 
+import numpy as np
+
+from scheduler.core.solution import assignment_array
+
 
 def print_schedule(result, schedule_request):
-    x = result["x"]
-    days = schedule_request.days
-    shifts = schedule_request.shifts
-    workers = {w.id: w for w in schedule_request.workers}
+    """result: dict de solve_schedule o ScheduleSolution."""
+    x = assignment_array(result, schedule_request)
+    names = np.array([w.name for w in schedule_request.workers], dtype=object)
 
-    for d in days:
+    for j, d in enumerate(schedule_request.days):
         print(f"\n=== Día {d} ===")
-        for t in shifts:
-            assigned = [
-                workers[w].name
-                for (w, dd, tt) in x
-                if dd == d and tt == t and x[(w, d, t)].value() == 1
-            ]
+        for k, t in enumerate(schedule_request.shifts):
+            assigned = names[x[:, j, k] == 1].tolist()
             print(f" Turno {t}: {assigned}")
@@ -1,6 +1,11 @@
 # scheduler/services/builder.py
 
-from scheduler.core.domain import ScheduleRequest, Worker
+from scheduler.core.domain import (
+    ScheduleRequest,
+    Worker,
+    availability_to_dict,
+    demand_to_dict,
+)
 
 
 class RequestBuilder:
@@ -24,3 +29,20 @@ class RequestBuilder:
         return ScheduleRequest(
             workers=worker_objs, availability=availability, demand=demand
         )
+
+    @staticmethod
+    def to_dict(schedule_request):
+        """
+        Inverso de from_dict: (workers, availability, demand) con las mismas
+        estructuras; la disponibilidad sólo con las celdas no disponibles.
+        """
+        request = schedule_request
+        workers = [
+            {"id": w.id, "name": w.name, "max_hours": w.max_hours}
+            for w in request.workers
+        ]
+        availability = availability_to_dict(
+            request.worker_ids, request.days, request.shifts, request.available
+        )
+        demand = demand_to_dict(request.days, request.shifts, request.demand_matrix)
+        return workers, availability, demand
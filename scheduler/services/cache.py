@@ -0,0 +1,200 @@
+# scheduler/services/cache.py
+
+import hashlib
+import json
+import pickle
+import time
+
+import numpy as np
+
+from scheduler.config import settings
+from scheduler.core.backends import SolverOptions
+from scheduler.core.domain import as_request
+from scheduler.core.restrictions_manager import ACTIVE_RESTRICTIONS
+from scheduler.core.solve import solve_schedule
+from scheduler.services.db import get_pool, init_once
+
+
+def request_key(
+    schedule_request,
+    restrictions=None,
+    backend="pulp",
+    options=None,
+    presolve=True,
+    engine="scipy",
+):
+    """
+    Hash estable del contenido que determina el modelo:
+    - trabajadores (id y max_hours; el nombre no cambia la solución)
+    - disponibilidad (sólo las celdas a 0; las ausentes o a 1 son lo mismo)
+    - demanda por (día, turno)
+    - TURN_HOURS, las penalizaciones P_* y la lista de restricciones
+    - las opciones del solver que cambian la solución (gap, límites)
+    - backend, presolve y engine (entre soluciones igual de buenas cada
+      modelo puede devolver una distinta)
+    """
+    restrictions = restrictions or ACTIVE_RESTRICTIONS
+    request = as_request(schedule_request)
+    days = list(request.days)
+    shifts = list(request.shifts)
+    workers = sorted((w.id, w.max_hours) for w in request.workers)
+    i, j, k = np.nonzero(request.available == 0)
+
+    content = {
+        "workers": workers,
+        "days": days,
+        "shifts": shifts,
+        "unavailable": sorted(
+            zip(
+                np.array(request.worker_ids)[i].tolist(),
+                np.array(days)[j].tolist(),
+                np.array(shifts)[k].tolist(),
+            )
+        ),
+        "demand": request.demand_matrix.tolist(),
+        "turn_hours": sorted(settings.TURN_HOURS.items()),
+        "penalties": sorted(
+            (name, getattr(settings, name))
+            for name in dir(settings)
+            if name.startswith("P_")
+        ),
+        "restrictions": [
+            r.__module__.rsplit(".", 1)[-1] + "." + r.__qualname__ for r in restrictions
+        ],
+        "backend": backend,
+        "presolve": presolve,
+        "engine": engine,
+        "options": _result_options(options),
+    }
+    raw = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _create_tables(conn):
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS solutions (
+        key TEXT PRIMARY KEY,
+        payload BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        last_used REAL NOT NULL
+    );
+    """)
+
+
+class SolveCache:
+    """
+    Caché en disco (SQLite) de ScheduleSolution por request_key.
+    Expulsa las entradas menos usadas recientemente cuando se supera
+    max_entries o max_bytes.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "solve_cache.db",
+        max_entries: int = 200,
+        max_bytes: int = 50 * 1024 * 1024,
+    ):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._init_schema()
+
+    def _connection(self):
+        return get_pool(self.db_path).connection()
+
+    def _init_schema(self):
+        init_once(self.db_path, "solve_cache", _create_tables)
+
+    def get(self, key):
+        with self._connection() as conn, conn:
+            row = conn.execute(
+                "SELECT payload FROM solutions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE solutions SET last_used = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        return None if row is None else pickle.loads(row[0])
+
+    def put(self, key, solution):
+        payload = pickle.dumps(solution, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._connection() as conn, conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO solutions(key, payload, size, last_used)
+                VALUES (?, ?, ?, ?)
+                """,
+                (key, payload, len(payload), time.time()),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn):
+        rows = conn.execute(
+            "SELECT key, size FROM solutions ORDER BY last_used DESC"
+        ).fetchall()
+        total = 0
+        stale = []
+        for i, (key, size) in enumerate(rows):
+            total += size
+            if i >= self.max_entries or total > self.max_bytes:
+                stale.append((key,))
+        conn.executemany("DELETE FROM solutions WHERE key = ?", stale)
+
+    def clear(self):
+        with self._connection() as conn, conn:
+            conn.execute("DELETE FROM solutions")
+
+
+def _result_options(options):
+    # hilos, cortes, heurísticas y log sólo cambian lo que tarda
+    options = options or SolverOptions()
+    return {
+        key: getattr(options, key)
+        for key in ("time_limit", "gap", "gap_abs", "max_nodes")
+    }
+
+
+def solve_cached(
+    schedule_request,
+    cache,
+    restrictions=None,
+    backend="pulp",
+    options=None,
+    presolve=True,
+    engine="scipy",
+    on_phase=None,
+    profile_memory=False,
+    progress=None,
+):
+    """
+    solve_schedule compacto con caché: si el contenido ya se resolvió se
+    devuelve la solución guardada sin llamar al solver. Sólo se guardan
+    las soluciones en las que CBC alcanzó el gap (gap_reached): una parada
+    por el límite de tiempo depende de la máquina y de la carga, y no es
+    "la" solución de estas opciones. Los backends que no lo informan
+    (matrix, mps) no se guardan.
+
+    No admite `solver` ni `warm_start` de solve_schedule: no entran en la
+    clave y cambiarían la solución guardada (pasa las opciones en options).
+    """
+    key = request_key(
+        schedule_request, restrictions, backend, options, presolve, engine
+    )
+    solution = cache.get(key)
+    if solution is None:
+        solution = solve_schedule(
+            schedule_request,
+            restrictions=restrictions,
+            backend=backend,
+            options=options,
+            compact=True,
+            presolve=presolve,
+            engine=engine,
+            on_phase=on_phase,
+            profile_memory=profile_memory,
+            progress=progress,
+        )
+        if solution.gap_reached:
+            cache.put(key, solution)
+    return solution
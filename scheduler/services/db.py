@@ -0,0 +1,88 @@
+# scheduler/services/db.py
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Pragmas por conexión:
+# - WAL: los lectores no bloquean al escritor ni al revés
+# - synchronous=NORMAL: seguro con WAL y sin fsync en cada commit
+# - busy_timeout: espera al lock en lugar de fallar con "database is locked"
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+)
+
+POOL_SIZE = 4
+
+_pools = {}
+_initialized = set()
+_lock = threading.RLock()
+
+
+class ConnectionPool:
+    """
+    Conexiones SQLite reutilizables entre hilos (p. ej. las sesiones de
+    Streamlit). Cada conexión la usa un solo hilo a la vez.
+    """
+
+    def __init__(self, db_path: str, size: int = POOL_SIZE):
+        self.db_path = db_path
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _open(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def connection(self):
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._open()
+            try:
+                yield conn
+            finally:
+                # no devolver al pool una transacción a medias
+                if conn.in_transaction:
+                    conn.rollback()
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    """Un pool por fichero, compartido por todos los repositorios del proceso."""
+    key = os.path.abspath(db_path)
+    with _lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(db_path)
+        return _pools[key]
+
+
+def init_once(db_path: str, name: str, init):
+    """Ejecuta init(conn) una sola vez por fichero y esquema en el proceso."""
+    key = (os.path.abspath(db_path), name)
+    if key in _initialized:
+        return
+    with _lock:
+        if key in _initialized:
+            return
+        with get_pool(db_path).connection() as conn:
+            init(conn)
+            conn.commit()
+        _initialized.add(key)
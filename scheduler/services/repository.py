@@ -1,9 +1,55 @@
 # scheduler/services/repository.py
 
-import sqlite3
 from typing import Any, Dict, List
 
 from scheduler.config.settings import DEFAULT_MAX_HOURS
+from scheduler.core.solution import assignments
+from scheduler.services.db import get_pool, init_once
+
+
+def _create_tables(conn):
+    cur = conn.cursor()
+
+    # Tabla de trabajadores
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS workers (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        max_hours INTEGER NOT NULL
+    );
+    """)
+
+    # Disponibilidad: worker-day-shift
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS availability (
+        worker_id INTEGER,
+        day INTEGER,
+        shift INTEGER,
+        available INTEGER,
+        PRIMARY KEY(worker_id, day, shift),
+        FOREIGN KEY(worker_id) REFERENCES workers(id)
+    );
+    """)
+
+    # Demanda por day-shift
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS demand (
+        day INTEGER,
+        shift INTEGER,
+        min_workers INTEGER,
+        PRIMARY KEY(day, shift)
+    );
+    """)
+
+    # Horario generado
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS schedule (
+        day INTEGER,
+        shift INTEGER,
+        worker_id INTEGER,
+        FOREIGN KEY(worker_id) REFERENCES workers(id)
+    );
+    """)
 
 
 class SchedulerRepository:
@@ -21,71 +67,57 @@ class SchedulerRepository:
     # -----------------------------------------
     # Conexión
     # -----------------------------------------
-    def _connect(self):
-        return sqlite3.connect(self.db_path)
+    def _connection(self):
+        # conexión del pool del fichero (WAL, compartida entre hilos)
+        return get_pool(self.db_path).connection()
 
     # -----------------------------------------
-    # Crear tablas si no existen
+    # Crear tablas si no existen (una vez por fichero y proceso)
     # -----------------------------------------
     def _init_schema(self):
-        conn = self._connect()
-        cur = conn.cursor()
-
-        # Tabla de trabajadores
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS workers (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            max_hours INTEGER NOT NULL
-        );
-        """)
-
-        # Disponibilidad: worker-day-shift
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS availability (
-            worker_id INTEGER,
-            day INTEGER,
-            shift INTEGER,
-            available INTEGER,
-            PRIMARY KEY(worker_id, day, shift),
-            FOREIGN KEY(worker_id) REFERENCES workers(id)
-        );
-        """)
-
-        # Demanda por day-shift
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS demand (
-            day INTEGER,
-            shift INTEGER,
-            min_workers INTEGER,
-            PRIMARY KEY(day, shift)
-        );
-        """)
-
-        # Horario generado
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS schedule (
-            day INTEGER,
-            shift INTEGER,
-            worker_id INTEGER,
-            FOREIGN KEY(worker_id) REFERENCES workers(id)
-        );
-        """)
-
-        conn.commit()
-        conn.close()
+        init_once(self.db_path, "scheduler", _create_tables)
 
     # -----------------------------------------
     # Métodos de persistencia
     # -----------------------------------------
-    def save_workers(self, workers: List[Dict[str, Any]]):
-        conn = self._connect()
-        cur = conn.cursor()
-
-        cur.execute("DELETE FROM workers;")
-
-        # print(workers)
+    def _sync(self, table, key_cols, value_cols, rows, mode="replace"):
+        """
+        Escribe `rows` (tuplas key_cols + value_cols) en una sola transacción.
+        - "replace": DELETE de la tabla + executemany de todas las filas
+        - "diff": sólo borra las claves que ya no están e inserta/reemplaza
+          las filas nuevas o con valores distintos
+        """
+        if mode not in ("replace", "diff"):
+            raise ValueError(f"Modo desconocido: {mode} (opciones: replace, diff)")
+
+        cols = key_cols + value_cols
+        insert = (
+            f"INSERT OR REPLACE INTO {table}({', '.join(cols)}) "
+            f"VALUES ({', '.join('?' * len(cols))})"
+        )
+        with self._connection() as conn, conn:
+            if mode == "replace":
+                conn.execute(f"DELETE FROM {table}")
+                conn.executemany(insert, rows)
+            else:
+                n = len(key_cols)
+                current = {
+                    r[:n]: r[n:]
+                    for r in conn.execute(f"SELECT {', '.join(cols)} FROM {table}")
+                }
+                new = {r[:n]: r[n:] for r in rows}
+                where = " AND ".join(f"{c} = ?" for c in key_cols)
+                conn.executemany(
+                    f"DELETE FROM {table} WHERE {where}",
+                    [k for k in current if k not in new],
+                )
+                conn.executemany(
+                    insert,
+                    [k + v for k, v in new.items() if current.get(k) != v],
+                )
 
+    def save_workers(self, workers: List[Dict[str, Any]], mode: str = "replace"):
+        rows = []
         for w in workers:
             # cleanup de tipos
             wid = w.get("id")
@@ -119,78 +151,42 @@ class SchedulerRepository:
             if not name:
                 name = f"Worker_{wid}"
 
-            # print(f"Inserting worker: id={wid}, name={name}, max_hours={maxh}")
+            rows.append((wid, name, maxh))
 
-            cur.execute(
-                """
-                INSERT INTO workers(id, name, max_hours)
-                VALUES (?, ?, ?)
-            """,
-                (wid, name, maxh),
-            )
+        self._sync("workers", ("id",), ("name", "max_hours"), rows, mode)
 
-        conn.commit()
-        conn.close()
-
-    def save_availability(self, availability):
-        conn = self._connect()
-        cur = conn.cursor()
-
-        cur.execute("DELETE FROM availability")
-
-        for wid, days in availability.items():
-            for day_idx, shifts in days.items():
-                for shift_idx in shifts.keys():
-                    cur.execute(
-                        """
-                        INSERT INTO availability(worker_id, day, shift, available)
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        (int(wid), int(day_idx), int(shift_idx), 0),
-                    )
-
-        conn.commit()
-        conn.close()
-
-    def save_demand(self, demand: Dict[int, Dict[int, int]]):
-        conn = self._connect()
-        cur = conn.cursor()
-
-        cur.execute("DELETE FROM demand;")
-        print(demand)
-        for d, shifts in demand.items():
-            for t, val in shifts.items():
-                cur.execute(
-                    """
-                    INSERT INTO demand(day, shift, min_workers)
-                    VALUES (?, ?, ?)
-                """,
-                    (d, t, val),
-                )
+    def save_availability(self, availability, mode: str = "replace"):
+        # se guardan sólo las celdas no disponibles
+        rows = [
+            (int(wid), int(day_idx), int(shift_idx), 0)
+            for wid, days in availability.items()
+            for day_idx, shifts in days.items()
+            for shift_idx in shifts.keys()
+        ]
+        self._sync(
+            "availability", ("worker_id", "day", "shift"), ("available",), rows, mode
+        )
 
-        conn.commit()
-        conn.close()
+    def save_demand(self, demand: Dict[int, Dict[int, int]], mode: str = "replace"):
+        rows = [
+            (d, t, val) for d, shifts in demand.items() for t, val in shifts.items()
+        ]
+        self._sync("demand", ("day", "shift"), ("min_workers",), rows, mode)
 
     # -----------------------------------------
     # Métodos de lectura
     # -----------------------------------------
     def load_workers(self) -> List[Dict[str, Any]]:
-        conn = self._connect()
-        cur = conn.cursor()
-
-        rows = cur.execute("SELECT id, name, max_hours FROM workers").fetchall()
-        conn.close()
+        with self._connection() as conn:
+            rows = conn.execute("SELECT id, name, max_hours FROM workers").fetchall()
 
         return [{"id": r[0], "name": r[1], "max_hours": r[2]} for r in rows]
 
     def load_availability(self) -> Dict[int, Dict[int, Dict[int, int]]]:
-        conn = self._connect()
-        cur = conn.cursor()
-
-        rows = cur.execute(
-            "SELECT worker_id, day, shift, available FROM availability"
-        ).fetchall()
-        conn.close()
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT worker_id, day, shift, available FROM availability"
+            ).fetchall()
 
         result = {}
         for wid, d, t, val in rows:
@@ -199,11 +195,8 @@ class SchedulerRepository:
         return result
 
     def load_demand(self) -> Dict[int, Dict[int, int]]:
-        conn = self._connect()
-        cur = conn.cursor()
-
-        rows = cur.execute("SELECT day, shift, min_workers FROM demand").fetchall()
-        conn.close()
+        with self._connection() as conn:
+            rows = conn.execute("SELECT day, shift, min_workers FROM demand").fetchall()
 
         result = {}
         for d, t, val in rows:
@@ -211,59 +204,28 @@ class SchedulerRepository:
 
         return result
 
-    def save_schedule(self, df):
-        conn = self._connect()
-        cur = conn.cursor()
-
-        cur.execute("DELETE FROM schedule;")
-
-        for _, row in df.iterrows():
-            cur.execute(
-                """
-                INSERT INTO schedule(day, shift, worker_id)
-                VALUES (?, ?, ?)
-                """,
-                (int(row["Día"]), int(row["Turno"]), int(row["worker_id"])),
+    def save_schedule(self, df, mode: str = "replace"):
+        rows = list(
+            zip(
+                df["Día"].astype(int).tolist(),
+                df["Turno"].astype(int).tolist(),
+                df["worker_id"].astype(int).tolist(),
             )
+        )
+        self._sync("schedule", ("day", "shift", "worker_id"), (), rows, mode)
 
-        conn.commit()
-        conn.close()
-
-    def save_schedule_from_result(self, result):
-        variables = result["variables"]
-        x = variables["x"]
-        conn = self._connect()
-        cur = conn.cursor()
-
-        # print(variables)
-
-        cur.execute("DELETE FROM schedule;")
-
-        for (wid, d, t), val in x.items():
-            if val.value() == 1:
-                cur.execute(
-                    """
-                    INSERT INTO schedule(day, shift, worker_id)
-                    VALUES (?,?,?)
-                    """,
-                    (d, t, wid),
-                )
-
-        conn.commit()
-        conn.close()
+    def save_schedule_from_result(self, result, mode: str = "replace"):
+        # result: dict de solve_schedule o ScheduleSolution
+        rows = [(d, t, wid) for wid, d, t in assignments(result)]
+        self._sync("schedule", ("day", "shift", "worker_id"), (), rows, mode)
 
     def load_schedule(self):
-        conn = self._connect()
-        cur = conn.cursor()
-
-        cur.execute("""
-            SELECT day, shift, worker_id
-            FROM schedule
-            ORDER BY day, shift
-        """)
-
-        rows = cur.fetchall()
-        conn.close()
+        with self._connection() as conn:
+            rows = conn.execute("""
+                SELECT day, shift, worker_id
+                FROM schedule
+                ORDER BY day, shift
+            """).fetchall()
 
         # devolver una lista de dicts
         return [{"day": r[0], "shift": r[1], "worker_id": r[2]} for r in rows]
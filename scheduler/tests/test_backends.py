@@ -0,0 +1,83 @@
+import pytest
+from core.backends import (
+    ENGINES,
+    SolverOptions,
+    get_engine,
+    pulp_solver,
+    solve_ortools,
+)
+from core.domain import ScheduleRequest, Worker
+from core.solve import solve_schedule
+
+
+def _request():
+    workers = [Worker(0, "Ana", 20), Worker(1, "Luis", 20)]
+    demand = {d: {0: 1, 1: 1, 2: 1, 3: 0} for d in range(3)}
+    return ScheduleRequest(workers, {1: {0: {0: 0}}}, demand)
+
+
+def test_pulp_solver_uses_options():
+    options = SolverOptions(
+        time_limit=7, gap=0.05, threads=2, max_nodes=100, cuts="root", heuristics=False
+    )
+    solver = pulp_solver(options)
+    assert solver.timeLimit == 7
+    assert solver.optionsDict["gapRel"] == 0.05
+    assert solver.optionsDict["threads"] == 2
+    assert "maxNodes 100" in solver.getOptions()
+    assert solver.options == ["cuts root", "heuristics off"]
+
+
+def test_default_solver_is_exact():
+    # sin gap ni hilos: los valores de CBC, como PULP_CBC_CMD sin opciones
+    solver = pulp_solver()
+    assert solver.optionsDict.get("gapRel") is None
+    assert solver.optionsDict.get("threads") is None
+    assert not any(o.startswith(("ratio", "threads")) for o in solver.getOptions())
+
+
+def test_invalid_cut_level():
+    with pytest.raises(ValueError):
+        SolverOptions(cuts="max")
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        get_engine("gurobi")
+
+
+# todos los motores, no sólo los instalados: si falta highspy u ortools
+# (requirements-solvers.txt) el test falla con el ImportError de _require
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_engines_match_cbc(engine):
+    request = _request()
+    options = SolverOptions(time_limit=30, gap=0)
+    cbc = solve_schedule(request, options=options, compact=True)
+    other = solve_schedule(
+        request, backend="matrix", engine=engine, options=options, compact=True
+    )
+
+    assert other.status == cbc.status == "Optimal"
+    assert other.objective == pytest.approx(cbc.objective)
+    assert engine in other.stats["phases"]
+
+    # con MIP start (scipy lo ignora) se llega al mismo objetivo
+    again = solve_schedule(
+        request,
+        backend="matrix",
+        engine=engine,
+        options=options,
+        warm_start=cbc,
+        compact=True,
+    )
+    assert again.objective == pytest.approx(cbc.objective)
+
+
+def test_ortools_without_solver(monkeypatch):
+    from ortools.linear_solver import pywraplp
+
+    monkeypatch.setattr(
+        pywraplp.Solver, "CreateSolver", staticmethod(lambda name: None)
+    )
+    with pytest.raises(RuntimeError, match="SCIP"):
+        solve_ortools(None, None, None, None, None, SolverOptions(), name="SCIP")
@@ -0,0 +1,27 @@
+from benchmarks.bench_suite import compare, run
+from benchmarks.generator import generate_data
+from core.restrictions_manager import ACTIVE_RESTRICTIONS
+
+
+def test_generator_is_seeded():
+    assert generate_data(20, 7, seed=3) == generate_data(20, 7, seed=3)
+    _, _, weekend = generate_data(20, 7, seed=3, profile="weekend")
+    _, _, flat = generate_data(20, 7, seed=3, profile="flat")
+    assert set(flat[0].values()) == {2}
+    assert weekend[5][0] > weekend[0][0]
+
+
+def test_suite_times_every_phase():
+    scenarios = [("tiny", 4, 3, 0.2, "peaks", True)]
+    report = run(scenarios, time_limit=5)
+
+    timings = report["cases"][0]["timings"]
+    expected = {r.__name__ for r in ACTIVE_RESTRICTIONS} | {
+        "create_model",
+        "set_objective",
+        "solve",
+        "extract_solution",
+        "extract_df",
+    }
+    assert set(timings) == expected
+    assert set(compare(report, report)["tiny"].values()) == {1.0}
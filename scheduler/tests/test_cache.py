@@ -0,0 +1,76 @@
+import pytest
+import services.cache as cache_module
+from core.backends import SolverOptions
+from core.domain import ScheduleRequest, Worker
+from core.restrictions import coverage, hours
+from services.cache import SolveCache, request_key, solve_cached
+
+
+def _request(availability=None, name="Ana"):
+    workers = [Worker(0, name, 20), Worker(1, "Luis", 20)]
+    demand = {d: {0: 1, 1: 1, 2: 1, 3: 1} for d in range(3)}
+    return ScheduleRequest(workers, availability or {}, demand)
+
+
+def test_request_key_is_canonical(monkeypatch):
+    key = request_key(_request())
+
+    # nombres y disponibilidad explícita a 1 no cambian el modelo
+    assert request_key(_request(name="Ana María")) == key
+    assert request_key(_request({0: {1: {2: 1}}})) == key
+
+    assert request_key(_request({0: {1: {2: 0}}})) != key
+    assert request_key(_request(), [coverage.add_coverage_constraints]) != key
+    assert request_key(_request(), backend="matrix") != key
+    assert request_key(_request(), presolve=False) != key
+    assert request_key(_request(), engine="highs") != key
+
+    # los hilos sólo cambian el tiempo; el gap cambia la solución
+    assert request_key(_request(), options=SolverOptions(threads=3)) == key
+    assert request_key(_request(), options=SolverOptions(gap=0.1)) != key
+    settings = cache_module.settings
+    monkeypatch.setattr(settings, "P_SPLIT", settings.P_SPLIT + 1)
+    assert request_key(_request()) != key
+
+
+def test_solve_cached_hits_and_evicts(tmp_path, monkeypatch):
+    cache = SolveCache(str(tmp_path / "cache.db"), max_entries=1)
+    first = solve_cached(_request(), cache)
+    assert first.gap_reached
+
+    def fail(*args, **kwargs):
+        raise AssertionError("no debería resolver")
+
+    monkeypatch.setattr("services.cache.solve_schedule", fail)
+    hit = solve_cached(_request(), cache)
+    assert hit.assignments() == first.assignments()
+    assert hit.objective == first.objective
+
+    # la entrada nueva expulsa a la anterior (max_entries=1)
+    cache.put(request_key(_request(), [hours.add_hour_constraints]), first)
+    assert cache.get(request_key(_request())) is None
+
+
+def test_time_limited_solution_is_not_cached(tmp_path, monkeypatch):
+    cache = SolveCache(str(tmp_path / "cache.db"))
+
+    # matrix no informa del gap: no se guarda
+    solution = solve_cached(_request(), cache, backend="matrix")
+    assert solution.gap_reached is None
+    assert cache.get(request_key(_request(), backend="matrix")) is None
+
+    solution = solve_cached(_request(), cache)
+    solution.gap_reached = False  # CBC paró por el límite de tiempo
+    monkeypatch.setattr(
+        "services.cache.solve_schedule", lambda *args, **kwargs: solution
+    )
+    request = _request({0: {1: {2: 0}}})
+    assert solve_cached(request, cache) is solution
+    assert cache.get(request_key(request)) is None
+
+
+def test_solve_cached_rejects_unkeyed_arguments(tmp_path):
+    cache = SolveCache(str(tmp_path / "cache.db"))
+    for kwargs in ({"solver": object()}, {"warm_start": True}):
+        with pytest.raises(TypeError):
+            solve_cached(_request(), cache, **kwargs)
@@ -0,0 +1,53 @@
+import pytest
+from core.backends import SolverOptions
+from core.cbc import CbcProgress
+from core.domain import ScheduleRequest, Worker
+from core.solve import solve_schedule
+
+LOG = """\
+Continuous objective value is -91.5167 - 0.01 seconds
+Cbc0012I Integer solution of 109.5 found by feasibility pump after 0 iterations and 0 nodes (0.40 seconds)
+Cbc0012I Integer solution of -81 found by DiveCoefficient after 3144 iterations and 0 nodes (1.10 seconds)
+Cbc0013I At root node, 116 cuts changed objective from -90.462054 to -83.133085 in 20 passes
+Cbc0010I After 100 nodes, 5 on tree, -81 best solution, best possible -83.133085 (1.25 seconds)
+Cbc0001I Search completed - best objective -81.5, took 19288 iterations and 696 nodes (5.84 seconds)
+"""
+
+
+def test_progress_parses_cbc_log():
+    seen = []
+    progress = CbcProgress(callback=lambda p: seen.append((p.incumbent, p.bound)))
+    for line in LOG.splitlines():
+        progress.feed(line)
+
+    assert seen == [
+        (None, -91.5167),
+        (109.5, -91.5167),
+        (-81.0, -91.5167),
+        (-81.0, -83.133085),
+        (-81.5, -81.5),
+    ]
+    assert progress.gap == 0
+
+
+def _request():
+    workers = [Worker(i, f"W{i}", 20) for i in range(4)]
+    demand = {d: {0: 1, 1: 2, 2: 1, 3: 1} for d in range(5)}
+    return ScheduleRequest(workers, {1: {0: {0: 0}}}, demand)
+
+
+@pytest.mark.parametrize("backend", ["pulp", "mps"])
+def test_stop_keeps_best_solution(backend):
+    # parar en cuanto hay una solución entera
+    progress = CbcProgress(callback=lambda p: p.incumbent is not None and p.stop())
+    solution = solve_schedule(
+        _request(),
+        backend=backend,
+        options=SolverOptions(time_limit=30, gap=0),
+        progress=progress,
+        compact=True,
+    )
+
+    assert progress.stopped
+    assert solution.status == "Optimal"
+    assert solution.objective == pytest.approx(progress.incumbent)
@@ -0,0 +1,80 @@
+from itertools import product
+
+import numpy as np
+import pytest
+from benchmarks.generator import generate_request
+from core.backends import SolverOptions
+from core.column_generation import PricingProblem, solve_column_generation
+from core.domain import ScheduleRequest, Worker
+from core.matrix import VariableIndex
+from core.solve import solve_schedule
+
+
+def _request(n_days=4):
+    workers = [Worker(0, "Ana", 24), Worker(1, "Luis", 24), Worker(2, "Marta", 16)]
+    availability = {1: {0: {0: 0}}, 2: {1: {1: 0, 2: 0}}}
+    demand = {d: {0: 1, 1: 2, 2: 1, 3: 1} for d in range(n_days)}
+    return ScheduleRequest(workers, availability, demand)
+
+
+def test_matches_full_model():
+    request = generate_request(10, 7)
+    exact = SolverOptions(gap=0)
+    full = solve_schedule(request, backend="matrix", options=exact)
+    columns = solve_column_generation(request, options=exact)
+
+    # heurística aunque coincida con el óptimo; la cota lo confirma
+    assert columns["status"] == "Heuristic"
+    assert columns["objective"] == pytest.approx(full["objective"])
+    assert columns["gap"] == pytest.approx(0, abs=1e-6)
+
+
+def test_bounds_full_model():
+    # aquí la relajación del maestro no es entera: la solución es heurística
+    request = _request()
+    exact = SolverOptions(gap=0)
+    full = solve_schedule(request, backend="matrix", options=exact)
+    columns = solve_column_generation(request, options=exact, local_search=True)
+
+    assert columns["lower_bound"] <= full["objective"] + 1e-6
+    assert columns["objective"] >= full["objective"] - 1e-6
+    assert columns["status"] == "Heuristic" and columns["gap"] >= 0
+
+
+def test_pricing_matches_enumeration():
+    # DP frente a probar todos los patrones de 3 días de cada trabajador
+    request = _request(n_days=3)
+    index = VariableIndex(request)
+    pricing = PricingProblem(index, request)
+    duals = np.random.default_rng(0).uniform(0, 6, (3, 4))
+    chosen, reduced = pricing.solve(duals)
+
+    S = len(pricing.bits)
+    for w in range(len(request.workers)):
+        best = np.inf
+        for pattern in product(range(S), repeat=3):
+            pattern = np.array(pattern)
+            if not pricing.allowed[w, np.arange(3), pattern].all():
+                continue
+            if any(
+                pricing.night[a] and pricing.morning[b]
+                for a, b in zip(pattern, pattern[1:])
+            ):
+                continue
+            if pricing.hours[pattern].sum() > pricing.max_hours[w]:
+                continue
+            cost = pricing.pattern_cost([w], pattern[None])[0]
+            best = min(best, cost - (duals * pricing.bits[pattern]).sum())
+        assert reduced[w] == pytest.approx(best)
+        cost = pricing.pattern_cost([w], chosen[w][None])[0]
+        assert cost - (duals * pricing.bits[chosen[w]]).sum() == pytest.approx(best)
+
+
+def test_patterns_respect_worker_rules():
+    request = _request()
+    solution = solve_column_generation(request, compact=True)
+    # no disponible, noche→mañana y max_hours
+    assert solution.x[1, 0, 0] == 0
+    assert solution.x[2, 1, 1] == solution.x[2, 1, 2] == 0
+    assert not (solution.x[:, :-1, 3] & solution.x[:, 1:, 0]).any()
+    assert (solution.hours() <= [24, 24, 16]).all()
@@ -0,0 +1,39 @@
+import threading
+
+from services import repository
+from services.repository import SchedulerRepository
+
+
+def test_pooled_connections_use_wal_and_init_once(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "db.sqlite")
+    repo = SchedulerRepository(db_path)
+    with repo._connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    calls = []
+    monkeypatch.setattr(repository, "_create_tables", calls.append)
+    SchedulerRepository(db_path)
+    assert calls == []
+
+
+def test_concurrent_sessions_do_not_lock(tmp_path):
+    db_path = str(tmp_path / "db.sqlite")
+    errors = []
+
+    def edit(i):
+        try:
+            repo = SchedulerRepository(db_path)
+            for j in range(20):
+                repo.save_demand({i: {0: j}}, mode="diff")
+                repo.load_demand()
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=edit, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert set(SchedulerRepository(db_path).load_demand()) <= set(range(8))
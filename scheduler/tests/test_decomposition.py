@@ -0,0 +1,24 @@
+from config.settings import TURN_HOURS
+from core.decomposition import solve_rolling_horizon
+from core.domain import ScheduleRequest, Worker
+
+
+def test_rolling_horizon_respects_cross_window_rules():
+    workers = [Worker(0, "Ana", 30), Worker(1, "Luis", 30), Worker(2, "Marta", 20)]
+    availability = {1: {2: {0: 0, 1: 0}}}
+    demand = {d: {0: 1, 1: 1, 2: 1, 3: 1} for d in range(6)}
+    request = ScheduleRequest(workers, availability, demand)
+
+    result = solve_rolling_horizon(request, window=3, overlap=1)
+
+    assert result["status"] == "Optimal"
+    assert [w["committed"] for w in result["windows"]] == [[0, 1], [2, 3], [4, 5]]
+
+    x = result["variables"]["x"]
+    on = {key for key, var in x.items() if var.value() == 1}
+    for w in workers:
+        hours = sum(TURN_HOURS[t] for (wid, d, t) in on if wid == w.id)
+        assert hours <= w.max_hours
+        for d in range(5):
+            assert not ((w.id, d, 3) in on and (w.id, d + 1, 0) in on)
+    assert (1, 2, 0) not in on and (1, 2, 1) not in on
@@ -0,0 +1,106 @@
+import pytest
+from core.column_generation import solve_column_generation
+from core.domain import ScheduleRequest, Worker, as_request
+from core.evaluate import Evaluator
+from core.heuristic import solve_heuristic
+from core.restrictions_manager import TIGHT_RESTRICTIONS
+from core.session import ScheduleSession
+from core.solve import solve_schedule
+from services.builder import RequestBuilder
+
+
+def _data():
+    workers = [
+        {"id": 7, "name": "Ana", "max_hours": 20},
+        {"id": 3, "name": "Luis", "max_hours": 12},
+    ]
+    availability = {3: {1: {0: 0, 3: 0}}, 7: {0: {2: 1}}, 99: {0: {0: 0}}}
+    demand = {d: {0: 1, 1: 2, 2: 1, 3: d} for d in range(3)}
+    return workers, availability, demand
+
+
+def test_arrays_match_dicts():
+    request = RequestBuilder.from_dict(*_data())
+
+    assert request.worker_ids == [7, 3]
+    assert request.days == [0, 1, 2] and request.shifts == [0, 1, 2, 3]
+    assert request.available.shape == (2, 3, 4)
+    assert request.available.sum() == 2 * 3 * 4 - 2
+    assert request.available[request.worker_pos[3], 1, 3] == 0
+    assert request.demand_matrix[2, 3] == 2
+    assert request.max_hours.tolist() == [20, 12]
+    with pytest.raises(AttributeError):
+        request.workers[0].extra = 1
+
+
+def test_round_trip():
+    request = RequestBuilder.from_dict(*_data())
+    workers, availability, demand = RequestBuilder.to_dict(request)
+
+    assert workers == _data()[0]
+    # sólo quedan las celdas no disponibles de trabajadores de la petición
+    assert availability == {3: {1: {0: 0, 3: 0}}}
+    assert demand == _data()[2]
+
+    again = ScheduleRequest.from_arrays(
+        request.workers,
+        request.days,
+        request.shifts,
+        request.available,
+        request.demand_matrix,
+    )
+    assert (again.available == request.available).all()
+    assert (again.demand_matrix == request.demand_matrix).all()
+
+
+def test_as_request_and_session_edits():
+    worker = Worker(0, "Ana", 40)
+    req = type(
+        "Req",
+        (object,),
+        {
+            "workers": [worker],
+            "availability": {},
+            "demand": {0: {3: 1}, 1: {0: 1}},
+            "days": [0, 1],
+            "shifts": [0, 3],
+        },
+    )
+    request = as_request(req)
+    assert request.demand_matrix.tolist() == [[0, 1], [1, 0]]
+    assert as_request(request) is request
+
+    session = ScheduleSession(ScheduleRequest([worker], {}, {0: {0: 1}}))
+    session.set_availability(0, 0, 0, 0)
+    session.set_demand(0, 0, 2)
+    assert session.request.available[0, 0, 0] == 0
+    assert session.request.demand_matrix[0, 0] == 2
+
+
+def test_duck_typed_request_everywhere():
+    # objeto con los atributos de dict, sin arrays (como los de los tests)
+    workers, availability, demand = _data()
+    req = type(
+        "Req",
+        (object,),
+        {
+            "workers": [Worker(w["id"], w["name"], w["max_hours"]) for w in workers],
+            "availability": availability,
+            "demand": demand,
+            "days": [0, 1, 2],
+            "shifts": [0, 1, 2, 3],
+        },
+    )
+    request = RequestBuilder.from_dict(*_data())
+
+    draft = solve_heuristic(req, compact=True)
+    assert draft.objective == pytest.approx(
+        solve_heuristic(request, compact=True).objective
+    )
+    assert Evaluator(req).objective(draft.x) == pytest.approx(draft.objective)
+    columns = solve_column_generation(req, compact=True)
+    assert columns.status == "Heuristic"
+    tight = solve_schedule(req, restrictions=TIGHT_RESTRICTIONS, compact=True)
+    assert tight.objective == pytest.approx(
+        solve_schedule(request, restrictions=TIGHT_RESTRICTIONS, compact=True).objective
+    )
@@ -0,0 +1,60 @@
+import pytest
+from config.settings import P_COVER, P_FULL
+from core.backends import SolverOptions
+from core.domain import ScheduleRequest, Worker
+from core.evaluate import Evaluator
+from core.restrictions_manager import TIGHT_RESTRICTIONS
+from core.solve import solve_schedule
+
+
+def _request(n_days=3):
+    workers = [Worker(0, "Ana", 12), Worker(1, "Luis", 20)]
+    availability = {1: {0: {0: 0}}}
+    demand = {d: {0: 1, 1: 1, 2: 1, 3: 1} for d in range(n_days)}
+    return ScheduleRequest(workers, availability, demand)
+
+
+def test_matches_solver_objective():
+    request = _request()
+    solution = solve_schedule(
+        request, backend="matrix", options=SolverOptions(gap=0), compact=True
+    )
+    result = Evaluator(request).evaluate(solution.x)
+
+    assert result["feasible"]
+    assert result["objective"] == pytest.approx(solution.objective)
+    assert result["breakdown"] == pytest.approx(solution.breakdown)
+
+
+def test_lists_violations_of_edited_schedule():
+    request = _request()
+    evaluator = Evaluator(request)
+    rows = [
+        {"worker_id": 1, "day": 0, "shift": 0},  # no disponible
+        {"worker_id": 0, "day": 0, "shift": 3},  # noche → mañana
+        {"worker_id": 0, "day": 1, "shift": 0},
+        {"worker_id": 0, "day": 1, "shift": 1},
+        {"worker_id": 0, "day": 2, "shift": 2},  # 15 h > 12
+        {"worker_id": 9, "day": 0, "shift": 0},  # ya no existe
+    ]
+    result = evaluator.evaluate(evaluator.array(rows))
+    rules = {
+        (v["rule"], v["worker"], v["day"], v["shift"]) for v in result["violations"]
+    }
+
+    assert not result["feasible"]
+    assert ("availability", 1, 0, 0) in rules
+    assert ("night_morning", 0, 0, None) in rules
+    assert ("max_hours", 0, None, None) in rules
+    # sin nadie el día 2 por la mañana: falta cobertura y el turno está vacío
+    assert ("cover", None, 2, 0) in rules and ("empty", None, 2, 0) in rules
+    cover = sum(v["penalty"] for v in result["violations"] if v["rule"] == "cover")
+    assert cover == result["breakdown"]["cover"] == P_COVER * 7
+
+
+def test_tight_penalizes_full_day():
+    request = _request(n_days=1)
+    evaluator = Evaluator(request, restrictions=TIGHT_RESTRICTIONS)
+    x = evaluator.array([{"worker_id": 1, "day": 0, "shift": t} for t in range(4)])
+    assert evaluator.breakdown(x)["full"] == P_FULL
+    assert Evaluator(request).breakdown(x)["full"] == 0
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from core.backends import SolverOptions
+from core.domain import ScheduleRequest, Worker
+from core.evaluate import Evaluator
+from core.heuristic import LocalSearch, greedy_schedule, solve_heuristic
+from core.lazy import violated_rows
+from core.matrix import FAMILIES, VariableIndex
+from core.restrictions_manager import build_matrix
+from core.solve import solve_schedule
+
+
+def _request(n_days=4):
+    workers = [Worker(0, "Ana", 24), Worker(1, "Luis", 24), Worker(2, "Marta", 16)]
+    availability = {1: {0: {0: 0}}, 2: {1: {1: 0, 2: 0}}}
+    demand = {d: {0: 1, 1: 2, 2: 1, 3: 1} for d in range(n_days)}
+    return ScheduleRequest(workers, availability, demand)
+
+
+def test_heuristic_is_feasible_and_improves_greedy():
+    request = _request()
+    greedy = solve_heuristic(request, local_search=False, compact=True)
+    solution = solve_heuristic(request, compact=True)
+    assert solution.status == greedy.status == "Heuristic"
+
+    index = VariableIndex(request)
+    values = np.zeros(index.n_cols)
+    for name in FAMILIES:
+        values[getattr(index, name)] = solution.family(name)
+    A, lb, ub = build_matrix(index, request)
+    assert len(violated_rows(A, lb, ub, values)) == 0
+    assert solution.objective <= greedy.objective
+    assert solution.objective == pytest.approx(sum(solution.breakdown.values()))
+
+
+def test_move_deltas_match_objective():
+    request = _request()
+    index = VariableIndex(request)
+    evaluator = Evaluator(request)
+    search = LocalSearch(index, request, greedy_schedule(index, request))
+
+    before = evaluator.objective(search.x)
+    for _ in range(20):
+        delta, changes = search.best_move()
+        if not delta < 0:
+            break
+        for w, d, t, v in changes:
+            search.x[w, d, t] = v
+        after = evaluator.objective(search.x)
+        assert after - before == pytest.approx(delta)
+        before = after
+
+
+def test_heuristic_as_warm_start():
+    request = _request()
+    draft = solve_heuristic(request, compact=True)
+    result = solve_schedule(
+        request, warm_start=draft, options=SolverOptions(gap=0), compact=True
+    )
+    assert result.status == "Optimal"
+    assert result.objective <= draft.objective + 1e-6
@@ -0,0 +1,31 @@
+import ast
+import importlib
+from pathlib import Path
+
+import pytest
+
+INTERFACE = Path(__file__).resolve().parent.parent / "interface"
+
+
+def _imported_names(path):
+    # (módulo, nombre) de cada "from scheduler.x import nombre" del fichero
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and (node.module or "").startswith(
+            "scheduler."
+        ):
+            for alias in node.names:
+                yield node.module, alias.name
+
+
+# las páginas importan streamlit, que no está en los tests: se comprueba
+# sólo que los nombres del paquete que importan existen
+@pytest.mark.parametrize(
+    "page", sorted(INTERFACE.glob("*.py")), ids=lambda path: path.name
+)
+def test_interface_names_exist(page):
+    for module, name in _imported_names(page):
+        # "io" choca con el módulo estándar: ése se deja con scheduler.
+        if not module.startswith("scheduler.io"):
+            module = module[len("scheduler.") :]
+        assert hasattr(importlib.import_module(module), name), f"{module}.{name}"
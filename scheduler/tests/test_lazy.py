@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from core.backends import SolverOptions
+from core.domain import ScheduleRequest, Worker
+from core.lazy import LAZY_RESTRICTIONS, solve_lazy, violated_rows
+from core.matrix import FAMILIES, VariableIndex
+from core.restrictions_manager import build_matrix
+from core.solve import solve_schedule
+
+
+def _request(n_days=3):
+    workers = [Worker(0, "Ana", 24), Worker(1, "Luis", 24), Worker(2, "Marta", 16)]
+    availability = {1: {0: {0: 0}}}
+    demand = {d: {0: 1, 1: 2, 2: 1, 3: 1} for d in range(n_days)}
+    return ScheduleRequest(workers, availability, demand)
+
+
+@pytest.mark.parametrize("backend", ["pulp", "matrix"])
+def test_lazy_matches_full_model(backend):
+    request = _request()
+    exact = SolverOptions(gap=0)
+    full = solve_schedule(request, backend="matrix", options=exact)
+    lazy = solve_lazy(request, backend=backend, options=exact)
+
+    assert lazy["status"] == "Optimal"
+    assert lazy["objective"] == pytest.approx(full["objective"])
+    added, total = lazy["lazy_rows"]
+    assert added <= total
+    assert lazy["rounds"][-1]["rows"] == 0
+
+
+def test_lazy_solution_has_no_violations():
+    request = _request()
+    solution = solve_lazy(
+        request, backend="matrix", options=SolverOptions(gap=0), compact=True
+    )
+    index = VariableIndex(request)
+    values = np.zeros(index.n_cols)
+    for name in FAMILIES:
+        values[getattr(index, name)] = solution.family(name)
+    A, lb, ub = build_matrix(index, request, LAZY_RESTRICTIONS)
+    assert len(violated_rows(A, lb, ub, values)) == 0
+
+
+def test_last_round_adds_all_pending_rows():
+    request = _request()
+    exact = SolverOptions(gap=0)
+    full = solve_schedule(request, backend="matrix", options=exact)
+    lazy = solve_lazy(request, backend="matrix", options=exact, max_rounds=1)
+
+    assert lazy["objective"] == pytest.approx(full["objective"])
+    assert lazy["lazy_rows"][0] == lazy["lazy_rows"][1]
+    assert lazy["rounds"][-1]["rows"] == 0
+
+    with pytest.raises(ValueError):
+        solve_lazy(request, max_rounds=0)
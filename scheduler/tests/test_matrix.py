@@ -0,0 +1,43 @@
+import pytest
+from core.solve import solve_schedule
+
+
+class DummyWorker:
+    def __init__(self, id, max_hours=40):
+        self.id = id
+        self.max_hours = max_hours
+
+
+def test_matrix_backend_same_objective():
+    workers = [DummyWorker(0), DummyWorker(1, max_hours=12), DummyWorker(2)]
+    availability = {
+        0: {0: {0: 0, 1: 0}},
+        1: {2: {3: 0}},
+    }
+    demand = {
+        0: {0: 1, 1: 2, 2: 1, 3: 1},
+        1: {0: 1, 1: 1, 2: 2, 3: 0},
+        2: {0: 2, 1: 1, 2: 1, 3: 1},
+    }
+
+    req = type(
+        "Req",
+        (object,),
+        {
+            "workers": workers,
+            "availability": availability,
+            "demand": demand,
+            "days": [0, 1, 2],
+            "shifts": [0, 1, 2, 3],
+        },
+    )
+
+    pulp_result = solve_schedule(req)
+    matrix_result = solve_schedule(req, backend="matrix")
+
+    assert matrix_result["status"] == "Optimal"
+    assert matrix_result["objective"] == pytest.approx(pulp_result["objective"])
+
+    x = matrix_result["variables"]["x"]
+    assert x[(0, 0, 0)].value() == 0
+    assert x[(1, 2, 3)].value() == 0
@@ -0,0 +1,47 @@
+from core.matrix import VariableIndex
+from core.model import create_model
+from core.objective import objective_vector, set_objective
+from core.restrictions_manager import apply_restrictions
+from scheduler.io.mps import write_mps  # "io" es el módulo estándar
+
+
+class DummyWorker:
+    def __init__(self, id, max_hours=40):
+        self.id = id
+        self.max_hours = max_hours
+
+
+def test_write_mps_matches_pulp(tmp_path):
+    workers = [DummyWorker(i) for i in range(12)]
+    availability = {3: {1: {0: 0, 3: 0}}}
+    demand = {d: {0: 2, 1: 1, 2: 2, 3: 1} for d in range(3)}
+
+    req = type(
+        "Req",
+        (object,),
+        {
+            "workers": workers,
+            "availability": availability,
+            "demand": demand,
+            "days": [0, 1, 2],
+            "shifts": [0, 1, 2, 3],
+        },
+    )
+
+    model, variables = create_model(req)
+    apply_restrictions(model, variables, req)
+    set_objective(model, variables, req)
+    model.writeMPS(tmp_path / "pulp.mps", rename=1)
+
+    # bloques pequeños para forzar varios ficheros temporales
+    index = VariableIndex(req)
+    write_mps(
+        tmp_path / "stream.mps",
+        index,
+        req,
+        objective_vector(index, req),
+        chunk_rows=17,
+        chunk_cols=40,
+    )
+
+    assert (tmp_path / "stream.mps").read_text() == (tmp_path / "pulp.mps").read_text()
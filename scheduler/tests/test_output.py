@@ -0,0 +1,42 @@
+from core.domain import ScheduleRequest, Worker
+from core.heuristic import solve_heuristic
+from core.solution import assignment_array, assignments
+from interface.utils import result_to_df
+from scheduler.io.output import print_schedule  # "io" es el módulo estándar
+
+
+def _request():
+    workers = [Worker(0, "Ana", 20), Worker(1, "Luis", 20), Worker(2, "Marta", 12)]
+    availability = {1: {0: {0: 0}}}
+    demand = {d: {0: 1, 1: 2, 2: 1, 3: 1} for d in range(3)}
+    return ScheduleRequest(workers, availability, demand)
+
+
+def test_dict_and_compact_give_same_outputs(capsys):
+    request = _request()
+    result = solve_heuristic(request)
+    solution = solve_heuristic(request, compact=True)
+
+    x = assignment_array(result, request)
+    assert (x == assignment_array(solution, request)).all()
+    assert assignments(result) == solution.assignments()
+    assert int(x.sum()) == len(solution.assignments())
+
+    df = result_to_df(result, request)
+    assert list(df.columns) == ["Día", "Turno", "Trabajador"]
+    assert df.equals(result_to_df(solution, request))
+
+    print_schedule(result, request)
+    printed = capsys.readouterr().out
+    print_schedule(solution, request)
+    assert capsys.readouterr().out == printed
+    assert printed.count("=== Día") == 3
+
+
+def test_empty_result_has_columns():
+    request = _request()
+    solution = solve_heuristic(request, compact=True)
+    solution.x[:] = 0
+
+    df = result_to_df(solution, request)
+    assert df.empty and list(df.columns) == ["Día", "Turno", "Trabajador"]
@@ -0,0 +1,25 @@
+import pickle
+
+from core.domain import ScheduleRequest, Worker
+from core.parallel import solve_many
+
+
+def _request(n_workers, demand_level):
+    workers = [Worker(i, f"W{i}", 30) for i in range(n_workers)]
+    demand = {d: {t: demand_level for t in range(4)} for d in range(3)}
+    return ScheduleRequest(workers, {}, demand)
+
+
+def test_solve_many_streams_compact_solutions():
+    requests = {"centro": _request(3, 1), "playa": _request(2, 2)}
+
+    results = dict(solve_many(requests, max_workers=2))
+
+    assert set(results) == {"centro", "playa"}
+    for solution in results.values():
+        assert solution.status == "Optimal"
+        # sólo arrays y tipos básicos: se puede serializar sin PuLP
+        copy = pickle.loads(pickle.dumps(solution))
+        assert copy.assignments() == solution.assignments()
+        assert all(len(key) == 3 for key in solution.assignments())
+    assert results["playa"].slack["deficit"].sum() > 0
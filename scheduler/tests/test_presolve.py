@@ -0,0 +1,40 @@
+import pytest
+from core.domain import ScheduleRequest, Worker
+from core.restrictions.availability import add_availability_constraints
+from core.presolve import build_presolved, feasible_cells, presolve_report
+from core.solve import solve_schedule
+
+
+def _request():
+    workers = [Worker(0, "Ana", 20), Worker(1, "Luis", 20)]
+    # Luis no puede ningún turno el día 0 ni la noche del día 1
+    availability = {1: {0: {0: 0, 1: 0, 2: 0, 3: 0}, 1: {3: 0}}}
+    demand = {d: {0: 1, 1: 1, 2: 1, 3: 1} for d in range(3)}
+    return ScheduleRequest(workers, availability, demand)
+
+
+def test_presolve_only_builds_feasible_cells():
+    request = _request()
+    cells = feasible_cells(request)
+    assert len(cells) == 2 * 3 * 4 - 5
+    assert (1, 0, 2) not in cells and (1, 1, 3) not in cells
+
+    model, variables = build_presolved(request)
+    assert set(variables[0]) == cells
+
+    # ninguna fila de disponibilidad sobrevive (todas triviales)
+    model, _ = build_presolved(request, [add_availability_constraints])
+    assert len(model.constraints) == 0
+
+    report = presolve_report(request)
+    assert report["x"] == (24, 19)
+    assert report["rows"][1] < report["rows"][0]
+
+
+def test_presolve_keeps_the_optimum():
+    request = _request()
+    full = solve_schedule(request, presolve=False)
+    reduced = solve_schedule(request)
+
+    assert reduced["status"] == full["status"] == "Optimal"
+    assert reduced["objective"] == pytest.approx(full["objective"])
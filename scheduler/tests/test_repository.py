@@ -0,0 +1,65 @@
+import sqlite3
+
+import pandas as pd
+from services.repository import SchedulerRepository
+
+
+def _rowids(db_path, table):
+    conn = sqlite3.connect(db_path)
+    rows = dict(conn.execute(f"SELECT id, rowid FROM {table}").fetchall())
+    conn.close()
+    return rows
+
+
+def test_bulk_writes_round_trip(tmp_path):
+    repo = SchedulerRepository(str(tmp_path / "db.sqlite"))
+
+    repo.save_workers(
+        [
+            {"id": 1, "name": " Ana ", "max_hours": 30},
+            {"id": [2], "name": ["Luis"], "max_hours": "x"},
+            {"id": None, "name": "sin id"},
+        ]
+    )
+    assert repo.load_workers() == [
+        {"id": 1, "name": "Ana", "max_hours": 30},
+        {"id": 2, "name": "Luis", "max_hours": 40},
+    ]
+
+    repo.save_availability({1: {0: {2: 0, 3: 0}}})
+    assert repo.load_availability() == {1: {0: {2: 0, 3: 0}}}
+
+    repo.save_demand({0: {0: 1, 1: 2}})
+    assert repo.load_demand() == {0: {0: 1, 1: 2}}
+
+    df = pd.DataFrame({"Día": [0, 1], "Turno": [2, 3], "worker_id": [1, 2]})
+    repo.save_schedule(df)
+    assert repo.load_schedule() == [
+        {"day": 0, "shift": 2, "worker_id": 1},
+        {"day": 1, "shift": 3, "worker_id": 2},
+    ]
+
+
+def test_diff_mode_only_touches_changed_rows(tmp_path):
+    db_path = str(tmp_path / "db.sqlite")
+    repo = SchedulerRepository(db_path)
+    workers = [{"id": i, "name": f"W{i}", "max_hours": 30} for i in range(4)]
+    repo.save_workers(workers)
+    before = _rowids(db_path, "workers")
+
+    workers[1]["max_hours"] = 20
+    repo.save_workers(workers[:3] + [{"id": 9, "name": "Nuevo"}], mode="diff")
+    after = _rowids(db_path, "workers")
+
+    assert {w["id"]: w["max_hours"] for w in repo.load_workers()} == {
+        0: 30,
+        1: 20,
+        2: 30,
+        9: 40,
+    }
+    # filas sin cambios: no se reescriben
+    assert after[0] == before[0] and after[2] == before[2]
+
+    repo.save_demand({0: {0: 1, 1: 1}})
+    repo.save_demand({0: {0: 1, 1: 3}, 1: {0: 2}}, mode="diff")
+    assert repo.load_demand() == {0: {0: 1, 1: 3}, 1: {0: 2}}
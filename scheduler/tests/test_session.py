@@ -0,0 +1,41 @@
+import pytest
+from core.domain import ScheduleRequest, Worker
+from core.session import ScheduleSession
+from core.solve import solve_schedule
+
+
+def _request(workers, availability, demand):
+    return ScheduleRequest(workers, availability, demand)
+
+
+def test_session_edits_match_full_solve():
+    workers = [Worker(0, "Ana", 40), Worker(1, "Luis", 12), Worker(2, "Marta", 40)]
+    availability = {0: {0: {0: 0}}}
+    demand = {d: {0: 1, 1: 1, 2: 2, 3: 1} for d in range(3)}
+
+    session = ScheduleSession(_request(workers, availability, demand))
+    first = session.solve()
+    assert first["objective"] == pytest.approx(
+        solve_schedule(_request(workers, availability, demand))["objective"]
+    )
+
+    # editar: disponibilidad, demanda, horas, alta y baja
+    session.set_availability(2, 1, 2, 0)
+    session.set_availability(0, 0, 0, 1)
+    session.set_demand(2, 3, 2)
+    session.set_max_hours(1, 8)
+    session.add_worker(Worker(3, "Juan", 20), {0: {3: 0}})
+    session.remove_worker(0)
+    result = session.solve()
+
+    edited = _request(
+        [Worker(1, "Luis", 8), Worker(2, "Marta", 40), Worker(3, "Juan", 20)],
+        {2: {1: {2: 0}}, 3: {0: {3: 0}}},
+        {d: {0: 1, 1: 1, 2: 2, 3: 2 if d == 2 else 1} for d in range(3)},
+    )
+    expected = solve_schedule(edited)
+
+    assert result["status"] == "Optimal"
+    assert result["objective"] == pytest.approx(expected["objective"])
+    assert all(k[0] != 0 for k in result["variables"]["x"])
+    assert result["variables"]["x"][(2, 1, 2)].value() == 0
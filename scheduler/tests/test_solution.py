@@ -0,0 +1,41 @@
+import pickle
+
+import pytest
+from config.settings import TURN_HOURS
+from core.domain import ScheduleRequest, Worker
+from core.solve import solve_schedule
+from interface.utils import result_to_df
+
+
+def _request():
+    workers = [Worker(0, "Ana", 20), Worker(1, "Luis", 20)]
+    availability = {1: {0: {0: 0, 1: 0}}}
+    demand = {d: {0: 1, 1: 1, 2: 1, 3: 2} for d in range(3)}
+    return ScheduleRequest(workers, availability, demand)
+
+
+def test_compact_solution_matches_full_result():
+    request = _request()
+    full = solve_schedule(request)
+    solution = solve_schedule(request, compact=True)
+
+    assert solution.status == full["status"]
+    assert solution.x.dtype.name == "uint8"
+    assert solution.x.shape == (2, 3, 4)
+    assert sum(solution.breakdown.values()) == pytest.approx(solution.objective)
+    assert solution.objective == pytest.approx(full["objective"])
+
+    # los consumidores aceptan las dos formas
+    by_full = result_to_df(full, request).values.tolist()
+    assert result_to_df(solution, request).values.tolist() == by_full
+
+    assert len(pickle.dumps(solution)) < len(pickle.dumps(full["variables"]))
+
+
+def test_compact_solution_from_matrix_backend():
+    solution = solve_schedule(_request(), backend="matrix", compact=True)
+    x = solution.x
+    assert x[1, 0, 0] == 0 and x[1, 0, 1] == 0
+    for i, wid in enumerate(solution.worker_ids):
+        hours = sum(TURN_HOURS[t] for w, d, t in solution.assignments() if w == wid)
+        assert solution.hours()[i] == hours <= 20
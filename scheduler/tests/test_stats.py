@@ -0,0 +1,66 @@
+import pytest
+from core.domain import ScheduleRequest, Worker
+from core.restrictions_manager import ACTIVE_RESTRICTIONS
+from core.session import ScheduleSession
+from core.solve import solve_schedule
+
+
+def _request():
+    workers = [Worker(0, "Ana", 20), Worker(1, "Luis", 20)]
+    demand = {d: {0: 1, 1: 1, 2: 0, 3: 0} for d in range(2)}
+    return ScheduleRequest(workers, {}, demand)
+
+
+def test_pulp_phases_in_order():
+    seen = []
+    result = solve_schedule(_request(), on_phase=lambda name, _: seen.append(name))
+
+    restrictions = [add.__name__ for add in ACTIVE_RESTRICTIONS]
+    expected = ["build_variables", *restrictions, "set_objective"]
+    assert seen[: len(expected)] == expected
+    assert seen[len(expected) :] == ["write_mps", "cbc", "read_solution"]
+
+    stats = result["stats"]
+    assert list(stats["phases"]) == seen
+    assert set(stats["size"]) == {"variables", "constraints", "nonzeros"}
+    assert stats["total_time"] == pytest.approx(
+        sum(p["time"] for p in stats["phases"].values())
+    )
+
+
+def test_memory_and_compact_stats():
+    solution = solve_schedule(
+        _request(), backend="matrix", compact=True, profile_memory=True
+    )
+    assert solution.stats["phases"]["build_variables"]["peak"] >= 0
+    assert solution.stats["size"]["variables"] > 0
+
+
+def test_session_stats():
+    session = ScheduleSession(_request())
+    phases = session.solve()["stats"]["phases"]
+    assert {"write_mps", "cbc", "read_solution"} <= set(phases)
+
+
+def test_stats_without_resource(monkeypatch):
+    # Windows no tiene el módulo resource: se omite la memoria de CBC
+    import importlib
+    import sys
+
+    import core.stats
+
+    monkeypatch.setitem(sys.modules, "resource", None)
+    stats = importlib.reload(core.stats)
+    try:
+        assert stats.resource is None
+        recorded = stats.SolveStats(memory=True)
+        model = type("M", (), {"writeMPS": lambda self: None, "writeLP": None})()
+        solver = type("S", (), {"readsol_MPS": lambda self: None})()
+        with stats.instrument_pulp(model, solver, recorded):
+            model.writeMPS()
+            solver.readsol_MPS()
+        recorded.stop()
+        assert "children_peak_rss_kb" not in recorded.phases["cbc"]
+    finally:
+        monkeypatch.undo()
+        importlib.reload(core.stats)
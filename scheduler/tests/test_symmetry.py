@@ -0,0 +1,33 @@
+import pytest
+from core.domain import ScheduleRequest, Worker
+from core.restrictions.symmetry import symmetry_groups
+from core.restrictions_manager import ACTIVE_RESTRICTIONS, SYMMETRY_RESTRICTIONS
+from core.solve import solve_schedule
+
+
+def _request():
+    workers = [Worker(i, f"W{i}", 20) for i in range(3)] + [Worker(3, "Luis", 30)]
+    # W2 no puede el lunes por la mañana: ya no es intercambiable
+    availability = {2: {0: {0: 0}}}
+    demand = {d: {0: 1, 1: 2, 2: 1, 3: 1} for d in range(3)}
+    return ScheduleRequest(workers, availability, demand)
+
+
+def test_symmetry_groups():
+    groups = symmetry_groups(_request())
+    assert [[w.id for w in g] for g in groups] == [[0, 1]]
+
+
+@pytest.mark.parametrize("backend", ["pulp", "matrix"])
+def test_symmetry_breaking_orders_group_and_keeps_optimum(backend):
+    request = _request()
+    base = solve_schedule(request, backend=backend)
+    ordered = solve_schedule(
+        request, restrictions=SYMMETRY_RESTRICTIONS, backend=backend, compact=True
+    )
+
+    assert ordered.status == "Optimal"
+    assert ordered.objective == pytest.approx(base["objective"])
+    shifts = ordered.x.sum(axis=(1, 2))
+    assert shifts[0] >= shifts[1]
+    assert len(SYMMETRY_RESTRICTIONS) == len(ACTIVE_RESTRICTIONS) + 1
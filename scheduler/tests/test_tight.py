@@ -0,0 +1,64 @@
+import pytest
+from config.settings import P_FULL
+from core.backends import SolverOptions
+from core.domain import ScheduleRequest, Worker
+from core.restrictions_manager import ACTIVE_RESTRICTIONS, TIGHT_RESTRICTIONS
+from core.solve import solve_schedule
+
+
+def _request(n_days=4):
+    workers = [Worker(0, "Ana", 20), Worker(1, "Luis", 20), Worker(2, "Marta", 12)]
+    availability = {1: {0: {0: 0}}}
+    demand = {d: {0: 1, 1: 2, 2: 1, 3: 1} for d in range(n_days)}
+    return ScheduleRequest(workers, availability, demand)
+
+
+@pytest.mark.parametrize("backend", ["pulp", "matrix", "mps"])
+def test_tight_matches_backends(backend):
+    request = _request()
+    exact = SolverOptions(gap=0)
+    reference = solve_schedule(
+        request, restrictions=TIGHT_RESTRICTIONS, backend="matrix", options=exact
+    )
+    tight = solve_schedule(
+        request,
+        restrictions=TIGHT_RESTRICTIONS,
+        backend=backend,
+        options=exact,
+        compact=True,
+    )
+    assert tight.status == "Optimal"
+    assert tight.objective == pytest.approx(reference["objective"])
+
+
+def test_full_day_is_penalized():
+    # un solo trabajador y un día con demanda en todos los turnos
+    request = ScheduleRequest([Worker(0, "Ana", 40)], {}, {0: {t: 1 for t in range(4)}})
+
+    exact = SolverOptions(gap=0)
+    base = solve_schedule(request, options=exact, compact=True)
+    tight = solve_schedule(
+        request, restrictions=TIGHT_RESTRICTIONS, options=exact, compact=True
+    )
+
+    assert base.x.sum() == tight.x.sum() == 4
+    assert base.family("y_full").sum() == 0
+    assert tight.family("y_full").sum() == 1
+    assert tight.objective == pytest.approx(base.objective + P_FULL)
+
+
+def test_tight_rest_keeps_optimum():
+    request = _request(n_days=5)
+    exact = SolverOptions(gap=0)
+    base = solve_schedule(request, backend="matrix", options=exact, compact=True)
+    tight = solve_schedule(
+        request,
+        restrictions=TIGHT_RESTRICTIONS,
+        backend="matrix",
+        options=exact,
+        compact=True,
+    )
+    # sin días completos en el óptimo las dos formulaciones coinciden
+    assert tight.family("y_full").sum() == 0
+    assert tight.objective == pytest.approx(base.objective)
+    assert len(TIGHT_RESTRICTIONS) == len(ACTIVE_RESTRICTIONS)
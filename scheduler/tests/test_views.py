@@ -0,0 +1,105 @@
+import pandas as pd
+from config.settings import TURN_HOURS
+from core.domain import ScheduleRequest, Worker
+from core.heuristic import solve_heuristic
+from interface.utils import (
+    day_worker_matrix,
+    hours_per_worker,
+    matrix_css,
+    result_to_df,
+    schedule_pivot,
+)
+from interface.views import ScheduleView, ViewCache
+
+
+def _request():
+    workers = [Worker(0, "Marta", 20), Worker(1, "Ana", 20), Worker(2, "Luis", 12)]
+    availability = {1: {0: {0: 0}}}
+    demand = {d: {0: 1, 1: 2, 2: 1, 3: 1} for d in range(3)}
+    return ScheduleRequest(workers, availability, demand)
+
+
+def _same_views(view, solution, request):
+    df = result_to_df(solution, request)
+    assert view.pivot().equals(schedule_pivot(df.copy()))
+    matrix = day_worker_matrix(df.copy())
+    assert (view.matrix().to_numpy() == matrix.to_numpy()).all()
+    hours = hours_per_worker(df.copy(), TURN_HOURS)
+    assert dict(zip(view.hours()["Trabajador"], view.hours()["Horas"])) == dict(
+        zip(hours["Trabajador"], hours["Horas"])
+    )
+
+
+def test_view_matches_dataframe_kernels():
+    request = _request()
+    solution = solve_heuristic(request, compact=True)
+    _same_views(ScheduleView.from_result(solution, request), solution, request)
+
+
+def test_set_cell_matches_rebuild():
+    request = _request()
+    solution = solve_heuristic(request, compact=True)
+    view = ScheduleView(solution.x, request)
+    pivot = view.pivot()
+
+    wid, d, t = solution.assignments()[0]
+    assert view.set_cell(wid, d, t, 0)
+    assert not view.set_cell(wid, d, t, 0)
+    # una celda libre de otro día
+    i, j, k = next(
+        (i, j, k) for i, j, k in zip(*(view.x == 0).nonzero()) if request.days[j] != d
+    )
+    assert view.set_cell(request.worker_ids[i], request.days[j], request.shifts[k], 1)
+    assert view.version == 2 and view.pivot() is not pivot
+
+    solution.x[:] = view.x
+    _same_views(view, solution, request)
+    rows = view.rows()
+    assert len(rows) == int(view.x.sum())
+
+
+def test_cache_reuses_and_evicts():
+    request = _request()
+    solution = solve_heuristic(request, compact=True)
+    cache = ViewCache(max_entries=2)
+
+    view = cache.get(solution, request)
+    assert cache.get(solution, request) is view
+    rows = [
+        {"day": d, "shift": t, "worker_id": w} for w, d, t in solution.assignments()
+    ]
+    assert cache.get(rows, request) is view
+
+    for k in range(2):
+        other = solve_heuristic(request, compact=True)
+        other.x[:] = 0
+        other.x[k, 0, 0] = 1
+        cache.get(other, request)
+    assert len(cache) == 2
+    assert cache.get(solution, request) is not view
+
+
+def test_pivot_matches_groupby():
+    # el kernel de arrays frente al groupby + join anterior, sin ordenar
+    df = pd.DataFrame(
+        {
+            "Día": [2, 0, 2, 0, 1, 2],
+            "Turno": [3, 1, 3, 0, 1, 0],
+            "Trabajador": ["Luis", "Ana", "Marta", "Luis", "Ana", "Ana"],
+        }
+    )
+    expected = df.groupby(["Día", "Turno"])["Trabajador"].agg(", ".join)
+    assert schedule_pivot(df).equals(expected.unstack(fill_value=""))
+    assert schedule_pivot(df.iloc[:0]).empty
+
+
+def test_matrix_css():
+    request = _request()
+    matrix = ScheduleView.from_result(solve_heuristic(request), request).matrix()
+    css = matrix_css(matrix, {"Ana": "a"}, {0: "d"}, "yes", "no")
+    assert css.shape == matrix.shape
+    assert set(css[0]) <= {"yes", "no"}
+    assert (
+        css["Trabajador"] == matrix["Trabajador"].map({"Ana": "a"}).fillna("")
+    ).all()
+    assert (css["Día"][matrix["Día"] == 0] == "d").all()
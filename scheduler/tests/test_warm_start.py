@@ -0,0 +1,83 @@
+import pytest
+from core.backends import pulp_solver
+from core.domain import ScheduleRequest, Worker
+from core.lazy import violated_rows
+from core.matrix import VariableIndex
+from core.restrictions_manager import (
+    ACTIVE_RESTRICTIONS,
+    TIGHT_RESTRICTIONS,
+    build_matrix,
+)
+from core.solve import solve_schedule
+from core.warm_start import start_values, start_vector
+
+
+class DummyWorker:
+    def __init__(self, id, max_hours=40):
+        self.id = id
+        self.max_hours = max_hours
+
+
+def test_warm_start_drops_invalid_cells():
+    workers = [DummyWorker(0), DummyWorker(1, max_hours=4)]
+    availability = {0: {1: {2: 0}}}
+    demand = {d: {0: 1, 1: 1, 2: 1, 3: 1} for d in range(2)}
+
+    req = type(
+        "Req",
+        (object,),
+        {
+            "workers": workers,
+            "availability": availability,
+            "demand": demand,
+            "days": [0, 1],
+            "shifts": [0, 1, 2, 3],
+        },
+    )
+
+    rows = [
+        {"day": 0, "shift": 3, "worker_id": 0},
+        {"day": 1, "shift": 0, "worker_id": 0},  # noche → mañana
+        {"day": 1, "shift": 2, "worker_id": 0},  # no disponible
+        {"day": 0, "shift": 0, "worker_id": 1},
+        {"day": 0, "shift": 2, "worker_id": 1},  # supera max_hours
+        {"day": 0, "shift": 1, "worker_id": 9},  # ya no existe
+    ]
+
+    values = start_values(rows, req)
+    x = values["x"]
+
+    assert [k for k, v in x.items() if v] == [(0, 0, 3), (1, 0, 0)]
+    assert values["deficit"][(0, 1)] == 1
+    assert values["z"][(1, 0)] == 1
+    assert values["work"] == {(0, 0): 1, (0, 1): 0, (1, 0): 1, (1, 1): 0}
+    assert values["free2"][(0, 1)] == 0
+    assert values["viol_rest"] == {0: 1, 1: 1}
+
+
+def test_warm_start_does_not_touch_caller_solver():
+    workers = [Worker(0, "Ana", 20), Worker(1, "Luis", 20)]
+    demand = {d: {0: 1, 1: 1, 2: 0, 3: 0} for d in range(2)}
+    request = ScheduleRequest(workers, {}, demand)
+    solver = pulp_solver()
+
+    first = solve_schedule(request, solver=solver, compact=True)
+    again = solve_schedule(request, solver=solver, warm_start=first, compact=True)
+
+    assert again.status == "Optimal"
+    assert not solver.optionsDict.get("warmStart")
+
+
+@pytest.mark.parametrize("restrictions", [ACTIVE_RESTRICTIONS, TIGHT_RESTRICTIONS])
+def test_start_satisfies_restrictions(restrictions):
+    # un día con todos los turnos y cuatro días libres seguidos
+    request = ScheduleRequest(
+        [Worker(0, "Ana", 40)], {}, {d: {t: 1 for t in range(4)} for d in range(5)}
+    )
+    rows = [{"day": 0, "shift": t, "worker_id": 0} for t in range(4)]
+    values = start_values(rows, request, restrictions)
+
+    index = VariableIndex(request)
+    A, lb, ub = build_matrix(index, request, restrictions)
+    assert len(violated_rows(A, lb, ub, start_vector(index, values))) == 0
+    assert values["viol_rest"][0] == 0